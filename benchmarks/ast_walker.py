@@ -0,0 +1,108 @@
+"""
+Compare the full-tree `AstNodeVisitor` with the targeted `iter_test_functions` walker on large generated test files.
+
+Usage:
+    python -m benchmarks.ast_walker --classes=200 --tests-per-class=20 --statements-per-test=30
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import time
+import tracemalloc
+from typing import Callable
+
+from intentions.render.ast_ import (
+    AstNodeVisitor,
+    iter_test_functions,
+)
+
+
+def generate_test_file(classes: int, tests_per_class: int, statements_per_test: int) -> str:
+    lines = ['from intentions import case, describe, expect, when', '']
+
+    for class_index in range(classes):
+        lines.append(f"@describe(domain='domain_{class_index}', component='component', layer='service')")
+        lines.append(f'class TestClass{class_index}:')
+
+        for test_index in range(tests_per_class):
+            lines.append(f'    def test_function_{test_index}(self):')
+            lines.append(f"        with when('Condition {test_index}'):")
+
+            for statement_index in range(statements_per_test):
+                lines.append(f'            value_{statement_index} = {{"key": [1, 2, 3], "other": (4, 5)}}')
+
+            lines.append(f"        with case('Action {test_index}'):")
+            lines.append('            result = sum([value_0["key"][0], value_0["other"][1]])')
+            lines.append(f"        with expect('Outcome {test_index}'):")
+            lines.append('            assert result == 6')
+
+        lines.append('')
+
+    return '\n'.join(lines)
+
+
+def visit_with_node_visitor(module: ast.Module) -> int:
+    ast_node_visitor = AstNodeVisitor()
+    ast_node_visitor.visit(module)
+
+    functions = 0
+
+    for node in ast_node_visitor.get_nodes():
+        if not isinstance(node, ast.FunctionDef):
+            continue
+
+        ast_node_visitor.get_describe(decorators=ast_node_visitor.get_parent(node).decorator_list)
+        functions += 1
+
+    return functions
+
+
+def visit_with_walker(module: ast.Module) -> int:
+    functions = 0
+
+    for _ in iter_test_functions(node=module):
+        functions += 1
+
+    return functions
+
+
+def measure(visit: Callable[[ast.Module], int], module: ast.Module) -> tuple[int, float, int]:
+    started_at = time.perf_counter()
+    functions = visit(module)
+    elapsed = time.perf_counter() - started_at
+
+    tracemalloc.start()
+    visit(module)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return functions, elapsed, peak_memory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark AST walkers on a large generated test file.')
+    parser.add_argument('--classes', type=int, default=200)
+    parser.add_argument('--tests-per-class', type=int, default=20)
+    parser.add_argument('--statements-per-test', type=int, default=30)
+    arguments = parser.parse_args()
+
+    source = generate_test_file(
+        classes=arguments.classes,
+        tests_per_class=arguments.tests_per_class,
+        statements_per_test=arguments.statements_per_test,
+    )
+    module = ast.parse(source)
+
+    print(f'Generated file: {len(source.splitlines())} lines, {len(source)} bytes')  # noqa: T201
+
+    for name, visit in (('AstNodeVisitor', visit_with_node_visitor), ('iter_test_functions', visit_with_walker)):
+        functions, elapsed, peak_memory = measure(visit=visit, module=module)
+        print(  # noqa: T201
+            f'{name:<20} functions: {functions:>6}  time: {elapsed * 1000:>9.2f} ms  '
+            f'peak memory: {peak_memory / 1024:>10.1f} KiB',
+        )
+
+
+if __name__ == '__main__':
+    main()
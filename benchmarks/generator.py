@@ -0,0 +1,181 @@
+"""
+Generate a synthetic tree of test files to benchmark the renderer on.
+
+Usage:
+    python -m benchmarks.generator ./generated --files=1000 --tests-per-file=10 --layout=mixed
+"""
+from __future__ import annotations
+
+import argparse
+import random
+from pathlib import Path
+
+LAYOUTS = ('class', 'function', 'mixed')
+INTENTION_TYPES = ('when', 'case', 'expect')
+
+
+def generate_test_function(
+    name: str,
+    intentions: int,
+    indent: str,
+    is_method: bool,
+    uses_intentions: bool,
+    describe: str,
+) -> list[str]:
+    lines = [] if is_method or not uses_intentions else [f'{indent}{describe}']
+    lines.append(f'{indent}def {name}({"self" if is_method else ""}):')
+    lines.append(f'{indent}    value = {{"key": [1, 2, 3], "other": (4, 5)}}')
+
+    for intention_index in range(intentions):
+        if uses_intentions:
+            intention_type = INTENTION_TYPES[min(intention_index * len(INTENTION_TYPES) // intentions, 2)]
+            lines.append(f"{indent}    with {intention_type}('{name} intention number {intention_index}'):")
+            lines.append(f'{indent}        value["key"].append({intention_index})')
+        else:
+            lines.append(f'{indent}    value["key"].append({intention_index})')
+
+    lines.append(f'{indent}    assert value')
+    lines.append('')
+
+    return lines
+
+
+def generate_test_file(
+    file_index: int,
+    tests_per_file: int,
+    layout: str,
+    intentions_per_test: int,
+    uses_intentions: bool,
+) -> str:
+    """
+    Generate source code of a test file.
+
+    Arguments:
+        file_index (int): an index of the file to make names and descriptions unique.
+        tests_per_file (int): a number of test functions in the file.
+        layout (str): `class` to put test functions into a described class, `function` to describe each test function,
+            `mixed` to alternate both between files.
+        intentions_per_test (int): a number of intention blocks in each test function.
+        uses_intentions (bool): whether test functions use intentions at all.
+
+    Returns:
+        Source code of the test file as `str`.
+    """
+    if layout == 'mixed':
+        layout = LAYOUTS[file_index % 2]
+
+    describe = (
+        f"@describe(domain='domain_{file_index % 10}', component='component_{file_index % 7}', "
+        f"layer='layer_{file_index % 3}')"
+    )
+
+    lines = ['from intentions import case, describe, expect, when', '', ''] if uses_intentions else ['', '']
+
+    if layout == 'class':
+        if uses_intentions:
+            lines.append(describe)
+
+        lines.append(f'class TestClass{file_index}:')
+        lines.append('')
+
+    for test_index in range(tests_per_file):
+        lines.extend(
+            generate_test_function(
+                name=f'test_function_{file_index}_{test_index}',
+                intentions=intentions_per_test,
+                indent='    ' if layout == 'class' else '',
+                is_method=layout == 'class',
+                uses_intentions=uses_intentions,
+                describe=describe,
+            ),
+        )
+
+    return '\n'.join(lines)
+
+
+def generate_test_tree(
+    directory: str,
+    files: int,
+    tests_per_file: int = 10,
+    layout: str = 'mixed',
+    intentions_per_test: int = 3,
+    nesting_depth: int = 2,
+    plain_files_share: float = 0.2,
+    seed: int = 0,
+) -> list[Path]:
+    """
+    Generate a tree of test files.
+
+    Files are spread over nested directories, ten directories per level, and files that do not use intentions are
+    chosen randomly with the seed, so the same arguments always generate the same tree.
+
+    Arguments:
+        directory (str): a path to a directory to generate test files in.
+        files (int): a number of test files.
+        tests_per_file (int): a number of test functions in each file.
+        layout (str): `class`, `function` or `mixed` layout of test functions.
+        intentions_per_test (int): a number of intention blocks in each test function.
+        nesting_depth (int): a number of nested directory levels below the directory.
+        plain_files_share (float): a share of files that do not use intentions at all.
+        seed (int): a seed to choose files that do not use intentions with.
+
+    Returns:
+        Paths to generated test files as `list`.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f'Layout must be one of {", ".join(LAYOUTS)}.')
+
+    randomizer = random.Random(seed)
+    test_files = []
+
+    for file_index in range(files):
+        file_directory = Path(directory)
+
+        for level in range(nesting_depth):
+            file_directory = file_directory / f'level_{level}_{file_index // 10 ** (level + 1) % 10}'
+
+        file_directory.mkdir(parents=True, exist_ok=True)
+
+        test_file = file_directory / f'test_file_{file_index}.py'
+        test_file.write_text(
+            generate_test_file(
+                file_index=file_index,
+                tests_per_file=tests_per_file,
+                layout=layout,
+                intentions_per_test=intentions_per_test,
+                uses_intentions=randomizer.random() >= plain_files_share,
+            ),
+        )
+        test_files.append(test_file)
+
+    return test_files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Generate a synthetic tree of test files.')
+    parser.add_argument('directory')
+    parser.add_argument('--files', type=int, default=1000)
+    parser.add_argument('--tests-per-file', type=int, default=10)
+    parser.add_argument('--layout', choices=LAYOUTS, default='mixed')
+    parser.add_argument('--intentions-per-test', type=int, default=3)
+    parser.add_argument('--nesting-depth', type=int, default=2)
+    parser.add_argument('--plain-files-share', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=0)
+    arguments = parser.parse_args()
+
+    test_files = generate_test_tree(
+        directory=arguments.directory,
+        files=arguments.files,
+        tests_per_file=arguments.tests_per_file,
+        layout=arguments.layout,
+        intentions_per_test=arguments.intentions_per_test,
+        nesting_depth=arguments.nesting_depth,
+        plain_files_share=arguments.plain_files_share,
+        seed=arguments.seed,
+    )
+
+    print(f'Generated {len(test_files)} test files in {arguments.directory}')  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
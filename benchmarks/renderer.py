@@ -0,0 +1,256 @@
+"""
+Benchmark how the renderer scales with the number of test files and check it against stored baselines.
+
+Each target runs in a fresh process on a generated test tree, so its peak RSS is measured in isolation. Baselines are
+machine specific, so they are not committed, save them on the machine you check on before upgrading.
+
+Usage:
+    python -m benchmarks.renderer --files=100,1000,10000,100000 --save-baseline
+    python -m benchmarks.renderer --files=100,1000,10000,100000 --check
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.generator import (
+    LAYOUTS,
+    generate_test_tree,
+)
+
+BASELINES_PATH = Path(__file__).parent / 'baselines.json'
+TARGETS = ('create_intentions_json', 'collect_test_cases', 'AstNodeVisitor')
+METRICS = ('wall_time', 'peak_rss', 'output_size')
+
+
+def run_target(target: str, directory: str, workers: int) -> dict:
+    """
+    Run a target on a test tree in the current process.
+
+    Arguments:
+        target (str): a name of the target to run.
+        directory (str): a path to a directory with test files.
+        workers (int): a number of processes to render test files with.
+
+    Returns:
+        Wall time in seconds, peak RSS in kilobytes and output size in bytes as `dict`.
+    """
+    from intentions.render.ast_ import AstNodeVisitor
+    from intentions.render.encoders import JsonEncoderWithEnumSupport
+    from intentions.render.main import (
+        INTENTIONS_JSON_PATH,
+        collect_test_cases,
+        collect_test_files,
+        create_intentions_json,
+    )
+
+    output_size = 0
+
+    with tempfile.TemporaryDirectory() as output_directory:
+        os.chdir(output_directory)
+        started_at = time.perf_counter()
+
+        if target == 'create_intentions_json':
+            create_intentions_json(directory=directory, workers=workers)
+            output_size = os.path.getsize(INTENTIONS_JSON_PATH)
+
+        elif target == 'collect_test_cases':
+            storage = {}
+
+            for test_file in collect_test_files(directory=directory):
+                collect_test_cases(storage=storage, file=test_file)
+
+            output_size = len(json.dumps(storage, cls=JsonEncoderWithEnumSupport, indent=4))
+
+        else:
+            for test_file in collect_test_files(directory=directory):
+                AstNodeVisitor().visit(ast.parse(test_file.read_bytes()))
+
+        wall_time = time.perf_counter() - started_at
+
+    peak_rss = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+
+    return {'wall_time': wall_time, 'peak_rss': peak_rss, 'output_size': output_size}
+
+
+def measure_target(target: str, directory: str, workers: int) -> Optional[dict]:
+    """
+    Run a target on a test tree in a fresh process.
+
+    Arguments:
+        target (str): a name of the target to run.
+        directory (str): a path to a directory with test files.
+        workers (int): a number of processes to render test files with.
+
+    Returns:
+        Measured metrics as `dict` or `None` if the process failed, for instance, was killed for running out of memory.
+    """
+    process = subprocess.run(
+        [  # noqa: S603
+            sys.executable, '-m', 'benchmarks.renderer',
+            '--run-target', target,
+            '--directory', directory,
+            '--workers', str(workers),
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+    if process.returncode != 0:
+        return None
+
+    return json.loads(process.stdout)
+
+
+def get_scenario(target: str, files: int, arguments: argparse.Namespace) -> str:
+    """
+    Get a scenario a target is measured in.
+
+    A scenario includes every parameter of the generated test tree, so results of different trees are never compared.
+
+    Arguments:
+        target (str): a name of the target.
+        files (int): a number of generated test files.
+        arguments (argparse.Namespace): parsed command line arguments.
+
+    Returns:
+        A scenario as `str`.
+    """
+    return '/'.join(
+        str(parameter) for parameter in (
+            target,
+            files,
+            arguments.layout,
+            arguments.tests_per_file,
+            arguments.intentions_per_test,
+            arguments.nesting_depth,
+            arguments.plain_files_share,
+            arguments.workers,
+        )
+    )
+
+
+def check_results(results: dict, baselines: dict, tolerance: float) -> list[str]:
+    """
+    Check results against baselines.
+
+    A failed target, for instance, killed for running out of memory, is a regression regardless of baselines.
+
+    Arguments:
+        results (dict): measured metrics by scenario, `None` for scenarios a target failed in.
+        baselines (dict): baseline metrics by scenario.
+        tolerance (float): a share a metric could exceed its baseline by.
+
+    Returns:
+        Messages about failed targets and regressed metrics as `list`.
+    """
+    regressions = []
+
+    for scenario, metrics in results.items():
+        if metrics is None:
+            regressions.append(f'{scenario}: the target failed')
+            continue
+
+        baseline_metrics = baselines.get(scenario)
+
+        if baseline_metrics is None:
+            continue
+
+        for metric in METRICS:
+            if metrics[metric] > baseline_metrics[metric] * (1 + tolerance):
+                regressions.append(
+                    f'{scenario} {metric}: {metrics[metric]:.3f} exceeds the baseline {baseline_metrics[metric]:.3f} '
+                    f'by more than {tolerance:.0%}',
+                )
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the renderer on generated test trees.')
+    parser.add_argument('--files', default='100,1000,10000')
+    parser.add_argument('--tests-per-file', type=int, default=10)
+    parser.add_argument('--layout', choices=LAYOUTS, default='mixed')
+    parser.add_argument('--intentions-per-test', type=int, default=3)
+    parser.add_argument('--nesting-depth', type=int, default=2)
+    parser.add_argument('--plain-files-share', type=float, default=0.2)
+    parser.add_argument('--targets', default=','.join(TARGETS))
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--check', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--baselines', default=str(BASELINES_PATH))
+    parser.add_argument('--run-target', choices=TARGETS, help=argparse.SUPPRESS)
+    parser.add_argument('--directory', help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.run_target is not None:
+        result = run_target(target=arguments.run_target, directory=arguments.directory, workers=arguments.workers)
+        print(json.dumps(result))  # noqa: T201
+        return
+
+    baselines_path = Path(arguments.baselines)
+
+    if arguments.check and not arguments.save_baseline and not baselines_path.exists():
+        parser.error(f'baselines {baselines_path} do not exist, save them on this machine with --save-baseline first')
+
+    results = {}
+
+    for files in [int(files) for files in arguments.files.split(',')]:
+        with tempfile.TemporaryDirectory() as directory:
+            generate_test_tree(
+                directory=directory,
+                files=files,
+                tests_per_file=arguments.tests_per_file,
+                layout=arguments.layout,
+                intentions_per_test=arguments.intentions_per_test,
+                nesting_depth=arguments.nesting_depth,
+                plain_files_share=arguments.plain_files_share,
+            )
+
+            for target in arguments.targets.split(','):
+                scenario = get_scenario(target=target, files=files, arguments=arguments)
+                result = measure_target(target=target, directory=directory, workers=arguments.workers)
+                results[scenario] = result
+
+                if result is None:
+                    print(f'{target:<24} files: {files:>7}  failed')  # noqa: T201
+                    continue
+
+                print(  # noqa: T201
+                    f'{target:<24} files: {files:>7}  time: {result["wall_time"] * 1000:>10.1f} ms  '
+                    f'peak RSS: {result["peak_rss"] / 1024:>8.1f} MiB  '
+                    f'output: {result["output_size"] / 1024:>10.1f} KiB',
+                )
+
+    baselines = json.loads(baselines_path.read_text()) if baselines_path.exists() else {}
+
+    if arguments.save_baseline:
+        baselines.update({scenario: result for scenario, result in results.items() if result is not None})
+        baselines_path.write_text(json.dumps(baselines, indent=4, sort_keys=True) + '\n')
+
+    if arguments.check:
+        regressions = check_results(results=results, baselines=baselines, tolerance=arguments.tolerance)
+
+        for regression in regressions:
+            print(f'REGRESSION {regression}')  # noqa: T201
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
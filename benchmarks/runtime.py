@@ -0,0 +1,102 @@
+"""
+Compare the per-block overhead of intentions with an empty `with nullcontext()` block.
+
+Usage:
+    python -m benchmarks.runtime --blocks=1000000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from contextlib import nullcontext
+from typing import Callable
+
+from intentions import (
+    case,
+    describe,
+    expect,
+    when,
+)
+
+
+def run_empty_blocks(blocks: int) -> None:
+    for _ in range(blocks):
+        pass
+
+
+def run_nullcontext_blocks(blocks: int) -> None:
+    for _ in range(blocks):
+        with nullcontext('Sender account has insufficient balance'):
+            pass
+
+
+def run_when_blocks(blocks: int) -> None:
+    for _ in range(blocks):
+        with when('Sender account has insufficient balance'):
+            pass
+
+
+def run_case_blocks(blocks: int) -> None:
+    for _ in range(blocks):
+        with case('Transfer money from one sender to receiver'):
+            pass
+
+
+def run_expect_blocks(blocks: int) -> None:
+    for _ in range(blocks):
+        with expect('No transfers have been made'):
+            pass
+
+
+def run_undescribed_calls(blocks: int) -> None:
+    def test_function() -> None:
+        return
+
+    for _ in range(blocks):
+        test_function()
+
+
+def run_described_calls(blocks: int) -> None:
+    @describe(domain='accounts', component='accounts', layer='service')
+    def test_function() -> None:
+        return
+
+    for _ in range(blocks):
+        test_function()
+
+
+def measure(run: Callable[[int], None], blocks: int, repeats: int) -> float:
+    best_elapsed = float('inf')
+
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        run(blocks)
+        best_elapsed = min(best_elapsed, time.perf_counter() - started_at)
+
+    return best_elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the runtime overhead of intentions.')
+    parser.add_argument('--blocks', type=int, default=1_000_000)
+    parser.add_argument('--repeats', type=int, default=5)
+    arguments = parser.parse_args()
+
+    loop_elapsed = measure(run=run_empty_blocks, blocks=arguments.blocks, repeats=arguments.repeats)
+
+    runs = (
+        ('with nullcontext()', run_nullcontext_blocks),
+        ('with when()', run_when_blocks),
+        ('with case()', run_case_blocks),
+        ('with expect()', run_expect_blocks),
+        ('undescribed call', run_undescribed_calls),
+        ('described call', run_described_calls),
+    )
+
+    for name, run in runs:
+        elapsed = measure(run=run, blocks=arguments.blocks, repeats=arguments.repeats) - loop_elapsed
+        print(f'{name:<20} {elapsed / arguments.blocks * 1e9:>8.1f} ns per block')  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Compare the `ast` extraction engine with the scanner one on a generated tree of test files.
+
+Contents of test files are read into memory beforehand, so only extraction is measured. Both engines must extract the
+same test cases, the benchmark fails otherwise.
+
+Usage:
+    python -m benchmarks.scanner --files=1000 --tests-per-file=10 --intentions-per-test=3
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+
+from benchmarks.generator import (
+    LAYOUTS,
+    generate_test_tree,
+)
+from intentions.render.dto import FileTestCases
+from intentions.render.enums import ExtractionEngine
+from intentions.render.main import extract_test_cases
+from intentions.render.scanner import scan_test_functions
+
+
+def measure(engine: ExtractionEngine, contents: dict[str, bytes], repeats: int) -> tuple[float, list[FileTestCases]]:
+    """
+    Measure extraction of test cases from contents of test files.
+
+    Arguments:
+        engine (ExtractionEngine): an engine to extract test cases with.
+        contents (dict): contents of test files by their paths.
+        repeats (int): a number of times to extract test cases, the fastest time is taken.
+
+    Returns:
+        The fastest time in seconds and extracted test cases of each file as `tuple`.
+    """
+    best_time = float('inf')
+    results = []
+
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        results = [
+            extract_test_cases(file_path=file_path, content=content, engine=engine)
+            for file_path, content in contents.items()
+        ]
+        best_time = min(best_time, time.perf_counter() - started_at)
+
+    return best_time, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare extraction engines on a generated test tree.')
+    parser.add_argument('--files', type=int, default=1000)
+    parser.add_argument('--tests-per-file', type=int, default=10)
+    parser.add_argument('--layout', choices=LAYOUTS, default='mixed')
+    parser.add_argument('--intentions-per-test', type=int, default=3)
+    parser.add_argument('--repeats', type=int, default=3)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        test_files = generate_test_tree(
+            directory=directory,
+            files=arguments.files,
+            tests_per_file=arguments.tests_per_file,
+            layout=arguments.layout,
+            intentions_per_test=arguments.intentions_per_test,
+        )
+        contents = {test_file.as_posix(): test_file.read_bytes() for test_file in test_files}
+
+    ast_time, ast_results = measure(engine=ExtractionEngine.AST, contents=contents, repeats=arguments.repeats)
+    scanner_time, scanner_results = measure(
+        engine=ExtractionEngine.SCANNER,
+        contents=contents,
+        repeats=arguments.repeats,
+    )
+    fallbacks = sum(scan_test_functions(content=content) is None for content in contents.values())
+
+    print(f'ast      {ast_time * 1000:>10.1f} ms')  # noqa: T201
+    print(f'scanner  {scanner_time * 1000:>10.1f} ms  speedup: {ast_time / scanner_time:.2f}x')  # noqa: T201
+    print(f'files: {len(contents)}  scanner fallbacks to ast: {fallbacks}')  # noqa: T201
+
+    if ast_results != scanner_results:
+        print('Engines extracted different test cases.')  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
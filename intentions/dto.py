@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import (
+    dataclass,
+    fields,
+)
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from intentions.enums import Intention
+
+DataclassType = TypeVar('DataclassType', bound=type)
+
+
+def with_slots(cls: DataclassType) -> DataclassType:
+    """
+    Recreate a dataclass with `__slots__` for its fields.
+
+    It is what `dataclass(slots=True)` does on Python 3.10 and later. Instances of slotted classes have no `__dict__`,
+    so they take less memory and are faster to access, which matters for classes there are millions of instances of.
+    Defaults of fields stay in the generated `__init__`, so they are removed from the class to not conflict with slots.
+
+    Arguments:
+        cls (DataclassType): a dataclass to recreate.
+
+    Returns:
+        The dataclass with `__slots__` as `type`.
+    """
+    field_names = tuple(dataclass_field.name for dataclass_field in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace['__slots__'] = field_names
+
+    for name in (*field_names, '__dict__', '__weakref__'):
+        namespace.pop(name, None)
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@with_slots
+@dataclass
+class Describe:
+    domain: str
+    component: str
+    layer: str
+
+
+@dataclass
+class BudgetViolation:
+
+    type: Intention  # noqa: A003
+    description: str
+    file_path: str
+    code_line: int
+    budget_ms: Optional[float]
+    elapsed_ms: float
+    budget_bytes: Optional[int]
+    allocated_bytes: Optional[int]
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class Intention(Enum):
+
+    WHEN = 'when'
+    CASE = 'case'
+    EXPECT = 'expect'
+
+
+class BudgetPolicy(Enum):
+
+    FAIL = 'fail'
+    WARN = 'warn'
+    RECORD = 'record'
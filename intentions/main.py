@@ -1,34 +1,216 @@
 from __future__ import annotations
 
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+from collections import deque
 from typing import (
     TYPE_CHECKING,
-    Any,
     Callable,
     Optional,
     TypeVar,
 )
 
+from intentions.dto import (
+    BudgetViolation,
+    Describe,
+)
+from intentions.enums import (
+    BudgetPolicy,
+    Intention,
+)
+
 if TYPE_CHECKING:
-    from types import TracebackType
+    from types import (
+        FrameType,
+        TracebackType,
+    )
 
 T = TypeVar('T')
 
+DESCRIBE_ATTRIBUTE = '__intentions_describe__'
+
+BUDGET_POLICY_ENVIRONMENT_VARIABLE = 'INTENTIONS_BUDGET_POLICY'
+BUDGET_MULTIPLIER_ENVIRONMENT_VARIABLE = 'INTENTIONS_BUDGET_MULTIPLIER'
+BUDGET_VIOLATIONS_LIMIT = 1000
+
+
+class IntentionObserver:
+    """
+    Intention observer interface.
+
+    Observers are notified when a block of any intention is entered and exited. Blocks are exited in the reversed order
+    they are entered, so an observer could keep a stack of entered blocks.
+    """
+
+    def on_enter(self, intention: AbstractIntention, frame: FrameType) -> None:
+        """
+        Handle entering a block of the intention.
+
+        Arguments:
+            intention (AbstractIntention): an intention which block is entered.
+            frame (FrameType): a frame the block is declared in.
+        """
+
+    def on_exit(self, intention: AbstractIntention, exc_type: Optional[type[BaseException]]) -> None:
+        """
+        Handle exiting a block of the intention.
+
+        Arguments:
+            intention (AbstractIntention): an intention which block is exited.
+            exc_type (type): a type of an exception raised in the block if any.
+        """
+
+
+intention_observers: list[IntentionObserver] = []
+
+
+def add_intention_observer(observer: IntentionObserver) -> None:
+    intention_observers.append(observer)
+
+
+def remove_intention_observer(observer: IntentionObserver) -> None:
+    if observer in intention_observers:
+        intention_observers.remove(observer)
+
+
+class IntentionBudgetExceededError(AssertionError):
+    """
+    Error raised when a block of an intention exceeds its budget with the fail budget policy.
+    """
+
+
+class IntentionBudgetWarning(UserWarning):
+    """
+    Warning issued when a block of an intention exceeds its budget with the warn budget policy.
+    """
+
+
+budget_policy: Optional[BudgetPolicy] = None
+budget_multiplier: Optional[float] = None
+budget_violations: deque[BudgetViolation] = deque(maxlen=BUDGET_VIOLATIONS_LIMIT)
+
+
+def get_environment_budget_policy() -> BudgetPolicy:
+    """
+    Get the budget policy from the `INTENTIONS_BUDGET_POLICY` environment variable.
+
+    Returns:
+        The budget policy as `BudgetPolicy`, fail if the variable is not set.
+
+    Raises:
+        ValueError: if the variable is not a budget policy.
+    """
+    value = os.environ.get(BUDGET_POLICY_ENVIRONMENT_VARIABLE, BudgetPolicy.FAIL.value)
+
+    try:
+        return BudgetPolicy(value)
+
+    except ValueError:
+        policies = ', '.join(policy.value for policy in BudgetPolicy)
+        message = f'{BUDGET_POLICY_ENVIRONMENT_VARIABLE} must be one of {policies}, got {value!r}.'
+        raise ValueError(message) from None
+
+
+def get_environment_budget_multiplier() -> float:
+    """
+    Get the budget multiplier from the `INTENTIONS_BUDGET_MULTIPLIER` environment variable.
+
+    Returns:
+        The budget multiplier as `float`, `1` if the variable is not set.
+
+    Raises:
+        ValueError: if the variable is not a number.
+    """
+    value = os.environ.get(BUDGET_MULTIPLIER_ENVIRONMENT_VARIABLE, '1')
+
+    try:
+        return float(value)
+
+    except ValueError:
+        message = f'{BUDGET_MULTIPLIER_ENVIRONMENT_VARIABLE} must be a number, got {value!r}.'
+        raise ValueError(message) from None
+
+
+def configure_budgets(policy: Optional[BudgetPolicy] = None, multiplier: Optional[float] = None) -> None:
+    """
+    Configure how budgets of intention blocks are enforced.
+
+    By default, the policy and multiplier are taken from the `INTENTIONS_BUDGET_POLICY` and
+    `INTENTIONS_BUDGET_MULTIPLIER` environment variables, or fail and `1` if they are not set. The variables are read
+    once budgets are enforced for the first time, so importing the library never fails on them.
+
+    Arguments:
+        policy (BudgetPolicy): whether to fail, warn or only record when a block exceeds its budget.
+        multiplier (float): a multiplier of time budgets, for instance, `2` for machines twice as slow.
+    """
+    global budget_policy, budget_multiplier  # noqa: PLW0603
+
+    if policy is not None:
+        budget_policy = policy
+
+    if multiplier is not None:
+        budget_multiplier = multiplier
+
+
+def get_budget_configuration() -> tuple[BudgetPolicy, float]:
+    """
+    Get how budgets of intention blocks are enforced.
+
+    Returns:
+        The budget policy and multiplier as `tuple`, read from the environment variables if they are not configured.
+    """
+    global budget_policy, budget_multiplier  # noqa: PLW0603
+
+    if budget_policy is None:
+        budget_policy = get_environment_budget_policy()
+
+    if budget_multiplier is None:
+        budget_multiplier = get_environment_budget_multiplier()
+
+    return budget_policy, budget_multiplier
+
 
 class AbstractIntention:
     """
     Abstract intention implementation.
     """
 
-    def __init__(self, description: str) -> None:
+    __slots__ = ('description', 'budget_ms', 'budget_bytes', 'budget_state')
+
+    intention_type: Intention
+
+    def __init__(self, description: str, budget_ms: Optional[float] = None, budget_bytes: Optional[int] = None) -> None:
         """
         Construct the object.
 
+        A time budget limits wall clock time of the block and is multiplied by the budget multiplier. An allocation
+        budget limits memory allocated in the block and still held on its exit, it is traced with `tracemalloc` that
+        is started for the block if it is not tracing yet. Budgets are enforced on exiting the block unless the block
+        raises an exception, blocks without budgets cost nothing extra.
+
         Arguments:
             description (str): a description of the intention.
+            budget_ms (float): a maximum number of milliseconds the block could take.
+            budget_bytes (int): a maximum number of bytes the block could allocate.
         """
         self.description = description
+        self.budget_ms = budget_ms
+        self.budget_bytes = budget_bytes
+        self.budget_state = None
 
     def __enter__(self) -> AbstractIntention:
+        if intention_observers:
+            frame = sys._getframe(1)  # noqa: SLF001
+
+            for observer in intention_observers:
+                observer.on_enter(intention=self, frame=frame)
+
+        if self.budget_ms is not None or self.budget_bytes is not None:
+            self._start_budget(frame=sys._getframe(1))  # noqa: SLF001
+
         return self
 
     def __exit__(
@@ -37,7 +219,80 @@ class AbstractIntention:
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> None:
-        return
+        budget_violation = None
+
+        if self.budget_state is not None:
+            budget_violation = self._finish_budget()
+
+        if intention_observers:
+            for observer in reversed(intention_observers):
+                observer.on_exit(intention=self, exc_type=exc_type)
+
+        if budget_violation is not None and exc_type is None:
+            self._enforce_budget(budget_violation=budget_violation)
+
+    def _start_budget(self, frame: FrameType) -> None:
+        is_tracing_started = False
+        started_memory = None
+
+        if self.budget_bytes is not None:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                is_tracing_started = True
+
+            started_memory, _ = tracemalloc.get_traced_memory()
+
+        file_path, code_line = frame.f_code.co_filename, frame.f_lineno
+        self.budget_state = (file_path, code_line, is_tracing_started, started_memory, time.perf_counter_ns())
+
+    def _finish_budget(self) -> Optional[BudgetViolation]:
+        finished_at = time.perf_counter_ns()
+        file_path, code_line, is_tracing_started, started_memory, started_at = self.budget_state
+        self.budget_state = None
+        _, multiplier = get_budget_configuration()
+
+        elapsed_ms = (finished_at - started_at) / 1_000_000
+        allocated_bytes = None
+
+        if started_memory is not None:
+            current_memory, _ = tracemalloc.get_traced_memory()
+            allocated_bytes = current_memory - started_memory
+
+            if is_tracing_started:
+                tracemalloc.stop()
+
+        is_time_exceeded = self.budget_ms is not None and elapsed_ms > self.budget_ms * multiplier
+        is_memory_exceeded = self.budget_bytes is not None and allocated_bytes > self.budget_bytes
+
+        if not is_time_exceeded and not is_memory_exceeded:
+            return None
+
+        return BudgetViolation(
+            type=self.intention_type,
+            description=self.description,
+            file_path=file_path,
+            code_line=code_line,
+            budget_ms=None if self.budget_ms is None else self.budget_ms * multiplier,
+            elapsed_ms=elapsed_ms,
+            budget_bytes=self.budget_bytes,
+            allocated_bytes=allocated_bytes,
+        )
+
+    @staticmethod
+    def _enforce_budget(budget_violation: BudgetViolation) -> None:
+        budget_violations.append(budget_violation)
+        policy, _ = get_budget_configuration()
+
+        if policy == BudgetPolicy.RECORD:
+            return
+
+        message = format_budget_violation(budget_violation=budget_violation)
+
+        if policy == BudgetPolicy.WARN:
+            warnings.warn(message, IntentionBudgetWarning, stacklevel=3)
+            return
+
+        raise IntentionBudgetExceededError(message)
 
 
 class when(AbstractIntention):
@@ -45,23 +300,90 @@ class when(AbstractIntention):
     "When" intention implementation.
     """
 
+    __slots__ = ()
+
+    intention_type = Intention.WHEN
+
 
 class case(AbstractIntention):
     """
     "Case" intention implementation.
     """
 
+    __slots__ = ()
+
+    intention_type = Intention.CASE
+
 
 class expect(AbstractIntention):
     """
     "Expect" intention implementation.
     """
 
+    __slots__ = ()
+
+    intention_type = Intention.EXPECT
+
+
+def describe(domain: str, component: str, layer: str) -> Callable[[T], T]:
+    """
+    Describe a test function or class with a domain, component and layer it tests.
+
+    The function or class is returned as is, so its signature is seen by test runners and calling it costs nothing
+    extra. The description is attached to it as the `__intentions_describe__` attribute, so it could be looked up with
+    `get_describe`.
+
+    Arguments:
+        domain (str): a domain the test cases belong to.
+        component (str): a component of the domain the test cases belong to.
+        layer (str): a layer of the component the test cases belong to.
+
+    Returns:
+        A decorator that describes a test function or class.
+    """
+    description = Describe(domain=domain, component=component, layer=layer)
+
+    def decorator(obj: T) -> T:
+        setattr(obj, DESCRIBE_ATTRIBUTE, description)
+        return obj
 
-def describe(domain: str, component: str, layer: str) -> Callable[[Callable[..., T]], Callable[..., T]]:  # noqa: ARG001
-    def decorator(func: [..., T]) -> Callable[..., T]:
-        def wrapper(*args: tuple[Any, ...], **kwargs: dict[str, Any]) -> T:
-            result = func(*args, **kwargs)
-            return result
-        return wrapper
     return decorator
+
+
+def get_describe(obj: object) -> Optional[Describe]:
+    """
+    Get a description of a described test function or class.
+
+    Arguments:
+        obj (object): a test function or class.
+
+    Returns:
+        A description of the test function or class as `Describe` or `None` if it is not described.
+    """
+    return getattr(obj, DESCRIBE_ATTRIBUTE, None)
+
+
+def format_budget_violation(budget_violation: BudgetViolation) -> str:
+    """
+    Format a budget violation into a human-readable message.
+
+    Arguments:
+        budget_violation (BudgetViolation): a violation of a budget of an intention block.
+
+    Returns:
+        A message as `str`.
+    """
+    exceeded_budgets = []
+
+    if budget_violation.budget_ms is not None and budget_violation.elapsed_ms > budget_violation.budget_ms:
+        exceeded_budgets.append(f'took {budget_violation.elapsed_ms:.2f}ms of {budget_violation.budget_ms:.2f}ms')
+
+    if budget_violation.budget_bytes is not None and budget_violation.allocated_bytes > budget_violation.budget_bytes:
+        exceeded_budgets.append(
+            f'allocated {budget_violation.allocated_bytes} bytes of {budget_violation.budget_bytes} bytes',
+        )
+
+    return (
+        f"{budget_violation.type.value}('{budget_violation.description}') at "
+        f'{budget_violation.file_path}:{budget_violation.code_line} exceeds its budget: {", ".join(exceeded_budgets)}.'
+    )
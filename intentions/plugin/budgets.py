@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from intentions.dto import BudgetViolation
+from intentions.enums import Intention
+from intentions.main import format_budget_violation
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def dump_budget_violations(budget_violations: list[BudgetViolation]) -> list[list]:
+    return [
+        [
+            budget_violation.type.value,
+            budget_violation.description,
+            budget_violation.file_path,
+            budget_violation.code_line,
+            budget_violation.budget_ms,
+            budget_violation.elapsed_ms,
+            budget_violation.budget_bytes,
+            budget_violation.allocated_bytes,
+        ]
+        for budget_violation in budget_violations
+    ]
+
+
+def load_budget_violations(data: list[list]) -> list[BudgetViolation]:
+    """
+    Load budget violations dumped by another process.
+
+    Arguments:
+        data (list): budget violations dumped with `dump_budget_violations`.
+
+    Returns:
+        Budget violations as `list`.
+    """
+    return [
+        BudgetViolation(
+            type=Intention(type_),
+            description=description,
+            file_path=file_path,
+            code_line=code_line,
+            budget_ms=budget_ms,
+            elapsed_ms=elapsed_ms,
+            budget_bytes=budget_bytes,
+            allocated_bytes=allocated_bytes,
+        )
+        for type_, description, file_path, code_line, budget_ms, elapsed_ms, budget_bytes, allocated_bytes in data
+    ]
+
+
+def write_budget_summary(terminal_reporter: pytest.TerminalReporter, budget_violations: list[BudgetViolation]) -> None:
+    """
+    Write the budget violations summary into the terminal.
+
+    Arguments:
+        terminal_reporter (pytest.TerminalReporter): a terminal reporter to write with.
+        budget_violations (list): budget violations to write.
+    """
+    terminal_reporter.write_sep('=', 'intentions budgets')
+    terminal_reporter.write_line(f'{len(budget_violations)} blocks exceeded their budgets:')
+
+    for budget_violation in budget_violations:
+        terminal_reporter.write_line(format_budget_violation(budget_violation=budget_violation))
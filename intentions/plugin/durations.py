@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import heapq
+import json
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pytest
+
+    from intentions.dto import Describe
+
+INTENTIONS_DURATIONS_PATH = './.intentions/durations.json'
+
+
+def load_durations(path: str = INTENTIONS_DURATIONS_PATH) -> dict[str, float]:
+    """
+    Load recorded durations of tests.
+
+    Arguments:
+        path (str): a path to the durations JSON file.
+
+    Returns:
+        Durations of tests in seconds by their node identifiers as `dict`, empty if nothing is recorded yet.
+    """
+    try:
+        with open(path) as file:
+            return json.load(file)
+
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations: dict[str, float], path: str = INTENTIONS_DURATIONS_PATH) -> None:
+    """
+    Save durations of tests as JSON.
+
+    Arguments:
+        durations (dict): durations of tests in seconds by their node identifiers.
+        path (str): a path to the durations JSON file.
+    """
+    durations_path = Path(path)
+
+    if not durations_path.parent.exists():
+        durations_path.parent.mkdir(parents=True)
+
+    with open(durations_path, 'w') as file:
+        json.dump(durations, file, indent=4, sort_keys=True)
+
+
+def predict_makespan(durations: Iterable[float], workers: int) -> float:
+    """
+    Predict a makespan of groups of tests scheduled longest processing time first.
+
+    Each group, from the longest to the shortest, is given to the least loaded worker, as a worker that finishes
+    first takes the next group.
+
+    Arguments:
+        durations (Iterable): predicted durations of groups in seconds.
+        workers (int): a number of workers.
+
+    Returns:
+        A predicted time in seconds the busiest worker runs its groups for as `float`.
+    """
+    loads = [0.0] * max(1, workers)
+
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(loads, loads[0] + duration)
+
+    return max(loads)
+
+
+class TestDescribes:
+    """
+    Descriptions of tests by their node identifiers known without importing test files.
+
+    Test files are extracted statically once each, so descriptions are known to the `pytest-xdist` controller that does
+    not collect tests itself. Tests are described as the renderer describes them.
+    """
+
+    __test__ = False
+
+    def __init__(self, root_directory: str) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            root_directory (str): a path to the directory node identifiers are relative to.
+        """
+        self.root_directory = Path(root_directory)
+        self.file_describes: dict[str, dict[tuple[Optional[str], str], Describe]] = {}
+
+    def get_describe(self, node_id: str) -> Optional[Describe]:
+        """
+        Get a description of a test.
+
+        Arguments:
+            node_id (str): a node identifier of the test, for instance, `tests/test_file.py::TestClass::test_name[1]`.
+
+        Returns:
+            A description of the test as `Describe` or `None` if it is not described.
+        """
+        file_path, *names = node_id.split('::')
+
+        if not names:
+            return None
+
+        class_name = names[-2] if len(names) > 1 else None
+        function_name = names[-1].split('[', 1)[0]
+
+        if file_path not in self.file_describes:
+            self.file_describes[file_path] = self._extract_describes(file_path=file_path)
+
+        return self.file_describes[file_path].get((class_name, function_name))
+
+    def _extract_describes(self, file_path: str) -> dict[tuple[Optional[str], str], Describe]:
+        from intentions.render.main import extract_test_cases
+
+        file = self.root_directory / file_path
+
+        if not file.is_file():
+            return {}
+
+        return {
+            (described_test_case.test_case.class_name, described_test_case.test_case.function_name): (
+                described_test_case.describe
+            )
+            for described_test_case in extract_test_cases(file_path=file.as_posix()).test_cases
+        }
+
+
+def write_scheduling_summary(
+    terminal_reporter: pytest.TerminalReporter,
+    predicted_makespan: float,
+    actual_makespan: float,
+    groups: int,
+    workers: int,
+) -> None:
+    """
+    Write the scheduling summary into the terminal.
+
+    Arguments:
+        terminal_reporter (pytest.TerminalReporter): a terminal reporter to write with.
+        predicted_makespan (float): a predicted time in seconds the busiest worker runs its tests for.
+        actual_makespan (float): an actual time in seconds the busiest worker ran its tests for.
+        groups (int): a number of scheduled groups of tests.
+        workers (int): a number of workers.
+    """
+    terminal_reporter.write_sep('=', 'intentions scheduling')
+    terminal_reporter.write_line(f'{groups} groups of tests on {workers} workers, longest processing time first')
+    terminal_reporter.write_line(f'makespan: predicted {predicted_makespan:.2f}s, actual {actual_makespan:.2f}s')
@@ -0,0 +1,651 @@
+from __future__ import annotations
+
+import os
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+import pytest
+
+from intentions.enums import BudgetPolicy
+from intentions.main import (
+    BUDGET_MULTIPLIER_ENVIRONMENT_VARIABLE,
+    BUDGET_POLICY_ENVIRONMENT_VARIABLE,
+    add_intention_observer,
+    budget_violations,
+    configure_budgets,
+    get_budget_configuration,
+    remove_intention_observer,
+)
+from intentions.plugin.budgets import (
+    dump_budget_violations,
+    load_budget_violations,
+    write_budget_summary,
+)
+from intentions.plugin.durations import (
+    INTENTIONS_DURATIONS_PATH,
+    load_durations,
+    save_durations,
+    write_scheduling_summary,
+)
+from intentions.plugin.memory import (
+    INTENTIONS_MEMORY_PATH,
+    IntentionsMemoryProbe,
+    write_memory_summary,
+)
+from intentions.plugin.timing import (
+    IntentionsTimer,
+    write_timing_summary,
+)
+from intentions.plugin.tracing import (
+    INTENTIONS_TRACE_PATH,
+    TRACE_BUFFER_SIZE,
+    IntentionsTracer,
+)
+from intentions.plugin.utils import (
+    get_item_describe,
+    is_xdist_worker,
+)
+from intentions.render.walker import is_test_file_name
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from intentions.plugin.recorder import IntentionsRecorder
+    from intentions.plugin.scheduler import IntentionsScheduling
+    from intentions.plugin.selection import IntentionsSelector
+
+RECORDER_WORKER_OUTPUT_KEY = 'intentions_recorded_test_cases'
+TIMER_WORKER_OUTPUT_KEY = 'intentions_timings'
+MEMORY_WORKER_OUTPUT_KEY = 'intentions_memory'
+BUDGET_WORKER_OUTPUT_KEY = 'intentions_budget_violations'
+TRACER_WORKER_OUTPUT_KEY = 'intentions_trace'
+
+BUDGET_OPTIONS = ('intentions_budget_policy', 'intentions_budget_multiplier')
+BUDGET_ENVIRONMENT_VARIABLES = (BUDGET_POLICY_ENVIRONMENT_VARIABLE, BUDGET_MULTIPLIER_ENVIRONMENT_VARIABLE)
+SELECTION_OPTIONS = ('intentions_domain', 'intentions_component', 'intentions_layer')
+SELECTION_CACHE_WORKER_ID = 'gw0'
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup('intentions')
+    group.addoption(
+        '--intentions-record',
+        action='store_true',
+        help='record intentions of executed test cases into the intentions JSON file.',
+    )
+    group.addoption(
+        '--intentions-output',
+        default=None,
+        help='a path to the intentions JSON file to write recorded intentions to, `./.intentions/intentions.json` by '
+        'default.',
+    )
+    group.addoption(
+        '--intentions-static',
+        metavar='DIRECTORY',
+        default=None,
+        help='render test cases of the directory that did not run from their source code.',
+    )
+    group.addoption(
+        '--intentions-timing',
+        action='store_true',
+        help='measure wall clock and CPU time of intention blocks and report the slowest ones.',
+    )
+    group.addoption(
+        '--intentions-timing-top',
+        type=int,
+        default=10,
+        help='a number of the slowest intention blocks, describe groups and descriptions to report.',
+    )
+    group.addoption(
+        '--intentions-memory',
+        action='store_true',
+        help='measure net and peak memory allocated by intention blocks and report the heaviest ones.',
+    )
+    group.addoption(
+        '--intentions-memory-sample-rate',
+        type=int,
+        default=1,
+        help='measure memory of each n-th intention block only, allocations are traced only within measured blocks.',
+    )
+    group.addoption(
+        '--intentions-memory-top',
+        type=int,
+        default=10,
+        help='a number of the heaviest intention blocks to report.',
+    )
+    group.addoption(
+        '--intentions-memory-output',
+        default=INTENTIONS_MEMORY_PATH,
+        help='a path to the JSON file to write memory of intention blocks to.',
+    )
+    group.addoption(
+        '--intentions-budget-policy',
+        choices=[policy.value for policy in BudgetPolicy],
+        default=None,
+        help='whether to fail, warn or only record when an intention block exceeds its budget.',
+    )
+    group.addoption(
+        '--intentions-budget-multiplier',
+        type=float,
+        default=None,
+        help='a multiplier of time budgets of intention blocks, for instance, for slow machines.',
+    )
+    group.addoption(
+        '--intentions-trace',
+        action='store_true',
+        help='trace test cases and intention blocks into a Chrome trace event JSON file.',
+    )
+    group.addoption(
+        '--intentions-trace-output',
+        default=INTENTIONS_TRACE_PATH,
+        help='a path to the Chrome trace event JSON file to write traced events to.',
+    )
+    group.addoption(
+        '--intentions-trace-buffer-size',
+        type=int,
+        default=TRACE_BUFFER_SIZE,
+        help='a maximum number of traced events to keep per process, the oldest ones are dropped.',
+    )
+    group.addoption(
+        '--intentions-domain',
+        default=None,
+        help='collect and run only test cases of the domain, other test files are not imported.',
+    )
+    group.addoption(
+        '--intentions-component',
+        default=None,
+        help='collect and run only test cases of the component, other test files are not imported.',
+    )
+    group.addoption(
+        '--intentions-layer',
+        default=None,
+        help='collect and run only test cases of the layer, other test files are not imported.',
+    )
+    group.addoption(
+        '--intentions-index',
+        default=None,
+        help='a path to the intentions index to select test files by, test files are extracted statically otherwise.',
+    )
+    group.addoption(
+        '--intentions-dist',
+        action='store_true',
+        help='distribute tests to pytest-xdist workers grouped by describe, the longest groups by durations first.',
+    )
+    group.addoption(
+        '--intentions-durations',
+        default=INTENTIONS_DURATIONS_PATH,
+        help='a path to the JSON file to record durations of tests to and predict durations of groups from.',
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    is_budget_option_set = any(config.getoption(option) is not None for option in BUDGET_OPTIONS)
+
+    if is_budget_option_set or any(variable in os.environ for variable in BUDGET_ENVIRONMENT_VARIABLES):
+        config.pluginmanager.register(IntentionsBudgetPlugin(config=config), 'intentions-budget')
+
+    if config.getoption('intentions_record'):
+        config.pluginmanager.register(IntentionsRecorderPlugin(config=config), 'intentions-recorder')
+
+    if config.getoption('intentions_timing'):
+        config.pluginmanager.register(IntentionsTimerPlugin(config=config), 'intentions-timer')
+
+    if config.getoption('intentions_memory'):
+        config.pluginmanager.register(IntentionsMemoryPlugin(config=config), 'intentions-memory')
+
+    if config.getoption('intentions_trace'):
+        config.pluginmanager.register(IntentionsTracerPlugin(config=config), 'intentions-tracer')
+
+    if any(config.getoption(option) is not None for option in SELECTION_OPTIONS):
+        config.pluginmanager.register(IntentionsSelectionPlugin(config=config), 'intentions-selection')
+
+    if config.getoption('intentions_dist'):
+        config.pluginmanager.register(IntentionsSchedulingPlugin(config=config), 'intentions-scheduling')
+
+
+class IntentionsRecorderPlugin:
+    """
+    Plugin that records intentions of executed test cases.
+
+    Each process records intentions of test cases it runs, only those entered right in bodies of test functions as the
+    renderer renders them, so intentions of helpers a test calls are not recorded. Workers of `pytest-xdist` send their
+    records to the controller when they finish, and the controller writes the merged records into the intentions JSON
+    file. The renderer is imported only once the plugin is used, as the plugin module is loaded into every pytest
+    session.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            config (pytest.Config): pytest configuration.
+        """
+        from intentions.plugin.recorder import IntentionsRecorder
+
+        self.config = config
+        self.recorder: IntentionsRecorder = IntentionsRecorder(root_directory=str(config.invocation_params.dir))
+
+    def pytest_sessionstart(self) -> None:
+        add_intention_observer(observer=self.recorder)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None, object, object]:
+        self.recorder.start_test_case(item=item)
+
+        try:
+            return (yield)
+
+        finally:
+            self.recorder.finish_test_case()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object, error: Optional[object]) -> None:  # noqa: ARG002
+        worker_output = getattr(node, 'workeroutput', {})
+
+        if RECORDER_WORKER_OUTPUT_KEY in worker_output:
+            self.recorder.load(data=worker_output[RECORDER_WORKER_OUTPUT_KEY])
+
+    def pytest_sessionfinish(self) -> None:
+        remove_intention_observer(observer=self.recorder)
+
+        if is_xdist_worker(config=self.config):
+            self.config.workeroutput[RECORDER_WORKER_OUTPUT_KEY] = self.recorder.dump()
+            return
+
+        from intentions.render.main import (
+            INTENTIONS_JSON_PATH,
+            collect_test_files,
+            iter_file_test_cases,
+            save_intentions_json,
+            store_test_cases,
+        )
+
+        static_directory = self.config.getoption('intentions_static')
+
+        if static_directory is not None:
+            for file_test_cases in iter_file_test_cases(test_files=collect_test_files(directory=static_directory)):
+                if file_test_cases.error is None:
+                    self.recorder.add_file_test_cases(file_test_cases=file_test_cases)
+
+        storage = {}
+
+        for file_test_cases in self.recorder.get_file_test_cases():
+            store_test_cases(storage=storage, file_test_cases=file_test_cases)
+
+        save_intentions_json(storage=storage, path=self.config.getoption('intentions_output') or INTENTIONS_JSON_PATH)
+
+
+class IntentionsTimerPlugin:
+    """
+    Plugin that measures time of intention blocks of executed test cases.
+
+    Workers of `pytest-xdist` send their timings to the controller when they finish, and the controller reports the
+    merged timings in the terminal summary.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            config (pytest.Config): pytest configuration.
+        """
+        self.config = config
+        self.timer = IntentionsTimer(top=config.getoption('intentions_timing_top'))
+
+    def pytest_sessionstart(self) -> None:
+        add_intention_observer(observer=self.timer)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None, object, object]:
+        self.timer.start_test_case(item=item)
+
+        try:
+            return (yield)
+
+        finally:
+            self.timer.finish_test_case()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object, error: Optional[object]) -> None:  # noqa: ARG002
+        worker_output = getattr(node, 'workeroutput', {})
+
+        if TIMER_WORKER_OUTPUT_KEY in worker_output:
+            self.timer.load(data=worker_output[TIMER_WORKER_OUTPUT_KEY])
+
+    def pytest_sessionfinish(self) -> None:
+        remove_intention_observer(observer=self.timer)
+
+        if is_xdist_worker(config=self.config):
+            self.config.workeroutput[TIMER_WORKER_OUTPUT_KEY] = self.timer.dump()
+
+    def pytest_terminal_summary(self, terminalreporter: pytest.TerminalReporter) -> None:
+        if is_xdist_worker(config=self.config):
+            return
+
+        write_timing_summary(terminal_reporter=terminalreporter, timer=self.timer)
+
+
+class IntentionsMemoryPlugin:
+    """
+    Plugin that measures memory allocated by intention blocks of executed test cases.
+
+    Workers of `pytest-xdist` send their measurements to the controller when they finish, and the controller writes
+    the merged measurements next to the intentions JSON file and reports the heaviest blocks in the terminal summary.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            config (pytest.Config): pytest configuration.
+        """
+        self.config = config
+        self.probe = IntentionsMemoryProbe(sample_rate=config.getoption('intentions_memory_sample_rate'))
+
+    def pytest_sessionstart(self) -> None:
+        add_intention_observer(observer=self.probe)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None, object, object]:
+        self.probe.start_test_case(item=item)
+
+        try:
+            return (yield)
+
+        finally:
+            self.probe.finish_test_case()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object, error: Optional[object]) -> None:  # noqa: ARG002
+        worker_output = getattr(node, 'workeroutput', {})
+
+        if MEMORY_WORKER_OUTPUT_KEY in worker_output:
+            self.probe.load(data=worker_output[MEMORY_WORKER_OUTPUT_KEY])
+
+    def pytest_sessionfinish(self) -> None:
+        remove_intention_observer(observer=self.probe)
+
+        if is_xdist_worker(config=self.config):
+            self.config.workeroutput[MEMORY_WORKER_OUTPUT_KEY] = self.probe.dump()
+            return
+
+        self.probe.save(path=self.config.getoption('intentions_memory_output'))
+
+    def pytest_terminal_summary(self, terminalreporter: pytest.TerminalReporter) -> None:
+        if is_xdist_worker(config=self.config):
+            return
+
+        write_memory_summary(
+            terminal_reporter=terminalreporter,
+            probe=self.probe,
+            top=self.config.getoption('intentions_memory_top'),
+        )
+
+
+class IntentionsBudgetPlugin:
+    """
+    Plugin that configures and reports budgets of intention blocks.
+
+    Budgets are enforced by intentions themselves, the plugin only applies the budget policy and multiplier given as
+    options and reports blocks that exceeded their budgets during the session. It is used only if a budget option or
+    environment variable is set, otherwise budgets are still enforced, but not reported. Violations are taken from
+    intentions after each test, so they are not held twice. Workers of `pytest-xdist` send their violations to the
+    controller when they finish.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            config (pytest.Config): pytest configuration.
+
+        Raises:
+            UsageError: if a budget environment variable is not valid.
+        """
+        self.config = config
+        self.budget_violations = []
+
+        try:
+            self.previous_budget_configuration = get_budget_configuration()
+
+        except ValueError as error:
+            raise pytest.UsageError(str(error)) from None
+
+    def pytest_sessionstart(self) -> None:
+        policy = self.config.getoption('intentions_budget_policy')
+
+        configure_budgets(
+            policy=None if policy is None else BudgetPolicy(policy),
+            multiplier=self.config.getoption('intentions_budget_multiplier'),
+        )
+
+        budget_violations.clear()
+
+    def pytest_runtest_logfinish(self) -> None:
+        self.budget_violations.extend(budget_violations)
+        budget_violations.clear()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object, error: Optional[object]) -> None:  # noqa: ARG002
+        worker_output = getattr(node, 'workeroutput', {})
+
+        if BUDGET_WORKER_OUTPUT_KEY in worker_output:
+            self.budget_violations.extend(load_budget_violations(data=worker_output[BUDGET_WORKER_OUTPUT_KEY]))
+
+    def pytest_sessionfinish(self) -> None:
+        previous_policy, previous_multiplier = self.previous_budget_configuration
+        configure_budgets(policy=previous_policy, multiplier=previous_multiplier)
+
+        if is_xdist_worker(config=self.config):
+            self.config.workeroutput[BUDGET_WORKER_OUTPUT_KEY] = dump_budget_violations(
+                budget_violations=self.budget_violations,
+            )
+
+    def pytest_terminal_summary(self, terminalreporter: pytest.TerminalReporter) -> None:
+        if is_xdist_worker(config=self.config):
+            return
+
+        if self.budget_violations:
+            write_budget_summary(terminal_reporter=terminalreporter, budget_violations=self.budget_violations)
+
+
+class IntentionsTracerPlugin:
+    """
+    Plugin that traces test cases and their intention blocks into a Chrome trace event JSON file.
+
+    Workers of `pytest-xdist` send their buffered events to the controller when they finish, and the controller writes
+    the merged events once, so the trace could be opened in Perfetto or `chrome://tracing`.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            config (pytest.Config): pytest configuration.
+        """
+        self.config = config
+
+        process_name = 'controller'
+
+        if is_xdist_worker(config=config):
+            process_name = config.workerinput['workerid']
+
+        self.tracer = IntentionsTracer(
+            process_name=process_name,
+            buffer_size=config.getoption('intentions_trace_buffer_size'),
+        )
+
+    def pytest_sessionstart(self) -> None:
+        add_intention_observer(observer=self.tracer)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None, object, object]:
+        self.tracer.start_test_case(item=item)
+
+        try:
+            return (yield)
+
+        finally:
+            self.tracer.finish_test_case()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object, error: Optional[object]) -> None:  # noqa: ARG002
+        worker_output = getattr(node, 'workeroutput', {})
+
+        if TRACER_WORKER_OUTPUT_KEY in worker_output:
+            self.tracer.load(data=worker_output[TRACER_WORKER_OUTPUT_KEY])
+
+    def pytest_sessionfinish(self) -> None:
+        remove_intention_observer(observer=self.tracer)
+
+        if is_xdist_worker(config=self.config):
+            self.config.workeroutput[TRACER_WORKER_OUTPUT_KEY] = self.tracer.dump()
+            return
+
+        self.tracer.save(path=self.config.getoption('intentions_trace_output'))
+
+
+class IntentionsSelectionPlugin:
+    """
+    Plugin that collects and runs only test cases of the given domain, component and layer.
+
+    Test files are selected before they are imported, so test files without selected test cases are neither imported
+    nor collected. Test files that are not known to the index or cannot be parsed are collected as usual. Collected
+    test items are then deselected by their descriptions, so such files are narrowed down too. With `pytest-xdist`,
+    workers collect the same test files, so only the first one saves the cache of extracted test cases.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            config (pytest.Config): pytest configuration.
+        """
+        from intentions.plugin.selection import IntentionsSelector
+
+        self.config = config
+        self.test_file_patterns = tuple(config.getini('python_files'))
+        self.selector: IntentionsSelector = IntentionsSelector(
+            domain=config.getoption('intentions_domain'),
+            component=config.getoption('intentions_component'),
+            layer=config.getoption('intentions_layer'),
+            index_path=config.getoption('intentions_index'),
+        )
+
+    def pytest_ignore_collect(self, collection_path: Path) -> Optional[bool]:
+        if not is_test_file_name(name=collection_path.name, patterns=self.test_file_patterns):
+            return None
+
+        if not collection_path.is_file():
+            return None
+
+        if self.selector.select_file(path=collection_path) is False:
+            return True
+
+        return None
+
+    def pytest_collection_modifyitems(self, items: list[pytest.Item]) -> None:
+        selected_items = []
+        deselected_items = []
+
+        for item in items:
+            if self.selector.matches(describe=get_item_describe(item=item)):
+                selected_items.append(item)
+            else:
+                deselected_items.append(item)
+
+        if deselected_items:
+            self.config.hook.pytest_deselected(items=deselected_items)
+            items[:] = selected_items
+
+    def pytest_report_collectionfinish(self) -> str:
+        return (
+            f'intentions: {self.selector.ignored_files} test files not collected, '
+            f'{self.selector.unknown_files} unknown test files collected'
+        )
+
+    def pytest_sessionfinish(self) -> None:
+        if is_xdist_worker(config=self.config) and self.config.workerinput['workerid'] != SELECTION_CACHE_WORKER_ID:
+            return
+
+        self.selector.save()
+
+
+class IntentionsSchedulingPlugin:
+    """
+    Plugin that distributes tests to `pytest-xdist` workers grouped by their descriptions.
+
+    Durations of tests are recorded after each run, with or without `pytest-xdist`, and predict durations of groups of
+    the next run. Only durations of tests collected in the run are kept, so removed and renamed tests are forgotten.
+    The predicted and actual makespans are reported in the terminal summary.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            config (pytest.Config): pytest configuration.
+        """
+        self.config = config
+        self.durations = load_durations(path=config.getoption('intentions_durations'))
+        self.recorded_durations = {}
+        self.collected_node_ids: set[str] = set()
+        self.scheduling: Optional[IntentionsScheduling] = None
+
+    @pytest.hookimpl(optionalhook=True, tryfirst=True)
+    def pytest_xdist_make_scheduler(self, config: pytest.Config, log: object) -> Optional[IntentionsScheduling]:
+        if config.getoption('dist') == 'each':
+            return None
+
+        from intentions.plugin.scheduler import IntentionsScheduling
+
+        self.scheduling = IntentionsScheduling(config=config, log=log, durations=self.durations)
+
+        return self.scheduling
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, ids: list[str]) -> None:
+        self.collected_node_ids.update(ids)
+
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        self.collected_node_ids.update(item.nodeid for item in session.items)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if is_xdist_worker(config=self.config):
+            return
+
+        self.recorded_durations[report.nodeid] = self.recorded_durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self) -> None:
+        if is_xdist_worker(config=self.config) or not self.recorded_durations:
+            return
+
+        durations = {
+            node_id: self.recorded_durations.get(node_id, self.durations.get(node_id))
+            for node_id in self.collected_node_ids
+            if node_id in self.recorded_durations or node_id in self.durations
+        }
+
+        save_durations(durations=durations, path=self.config.getoption('intentions_durations'))
+
+    def pytest_terminal_summary(self, terminalreporter: pytest.TerminalReporter) -> None:
+        if self.scheduling is None or self.scheduling.predicted_makespan is None:
+            return
+
+        write_scheduling_summary(
+            terminal_reporter=terminalreporter,
+            predicted_makespan=self.scheduling.predicted_makespan,
+            actual_makespan=self.scheduling.actual_makespan,
+            groups=len(self.scheduling.scope_durations),
+            workers=len(self.scheduling.worker_durations),
+        )
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.main import IntentionObserver
+from intentions.plugin.utils import get_item_describe
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+    import pytest
+
+    from intentions.main import AbstractIntention
+
+INTENTIONS_MEMORY_PATH = './.intentions/memory.json'
+
+
+class IntentionsMemoryProbe(IntentionObserver):
+    """
+    Probe of memory allocated by intention blocks of executed test cases.
+
+    Memory is traced with `tracemalloc` only within probed blocks, as tracing of allocations is what costs the most.
+    For each block, net allocated bytes are the difference of traced memory on exit and enter, and peak bytes are the
+    highest traced memory within the block over traced memory on enter. The peak is reset on entering a block and
+    propagated to enclosing blocks on exit, so nested blocks are accounted too. With a sample rate above one, only
+    each n-th block is probed and traced, so code outside of probed blocks runs without tracing at all.
+    """
+
+    def __init__(self, sample_rate: int = 1) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            sample_rate (int): probe each n-th block only.
+        """
+        self.sample_rate = max(1, sample_rate)
+        self.blocks: dict[tuple[str, int, str, str], list] = {}
+
+        self.entered_blocks = 0
+
+        self.current_node_id: Optional[str] = None
+        self.current_describe: Optional[list[str]] = None
+        self.started_blocks: list[Optional[list[int]]] = []
+
+    def start_test_case(self, item: pytest.Item) -> None:
+        describe = get_item_describe(item=item)
+
+        self.current_node_id = item.nodeid
+        self.current_describe = None if describe is None else [describe.domain, describe.component, describe.layer]
+        self.started_blocks = []
+
+    def finish_test_case(self) -> None:
+        if any(started_block is not None and started_block[3] for started_block in self.started_blocks):
+            tracemalloc.stop()
+
+        self.current_node_id = None
+        self.current_describe = None
+        self.started_blocks = []
+
+    def on_enter(self, intention: AbstractIntention, frame: FrameType) -> None:  # noqa: ARG002
+        if self.current_node_id is None:
+            return
+
+        self.entered_blocks += 1
+
+        if self.entered_blocks % self.sample_rate:
+            self.started_blocks.append(None)
+            return
+
+        is_tracing_started = not tracemalloc.is_tracing()
+
+        if is_tracing_started:
+            tracemalloc.start()
+
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+
+        self._propagate_peak_memory(peak_memory=peak_memory)
+
+        tracemalloc.reset_peak()
+        self.started_blocks.append([frame.f_lineno, current_memory, current_memory, is_tracing_started])
+
+    def on_exit(self, intention: AbstractIntention, exc_type: Optional[type[BaseException]]) -> None:  # noqa: ARG002
+        if self.current_node_id is None or not self.started_blocks:
+            return
+
+        started_block = self.started_blocks.pop()
+
+        if started_block is None:
+            return
+
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        code_line, started_memory, started_peak_memory, is_tracing_started = started_block
+        peak_memory = max(peak_memory, started_peak_memory)
+
+        if is_tracing_started:
+            tracemalloc.stop()
+
+        self._propagate_peak_memory(peak_memory=peak_memory)
+
+        self.add_block(
+            node_id=self.current_node_id,
+            code_line=code_line,
+            intention_type=intention.intention_type.value,
+            description=intention.description,
+            describe=self.current_describe,
+            allocated_bytes=current_memory - started_memory,
+            peak_bytes=peak_memory - started_memory,
+        )
+
+    def add_block(  # noqa: PLR0913
+        self,
+        node_id: str,
+        code_line: int,
+        intention_type: str,
+        description: str,
+        describe: Optional[list[str]],
+        allocated_bytes: int,
+        peak_bytes: int,
+        count: int = 1,
+    ) -> None:
+        """
+        Account a probed block.
+
+        Arguments:
+            node_id (str): an identifier of a test item the block is executed by.
+            code_line (int): a code line the block is declared on.
+            intention_type (str): a type of the block's intention.
+            description (str): a description of the block's intention.
+            describe (list): a domain, component and layer of the test item if it is described.
+            allocated_bytes (int): net allocated bytes of the block.
+            peak_bytes (int): peak allocated bytes of the block.
+            count (int): a number of times the block is probed.
+        """
+        key = (node_id, code_line, intention_type, description)
+        block = self.blocks.get(key)
+
+        if block is None:
+            self.blocks[key] = [describe, count, allocated_bytes, peak_bytes]
+            return
+
+        block[1] += count
+        block[2] = max(block[2], allocated_bytes)
+        block[3] = max(block[3], peak_bytes)
+
+    def get_heaviest_blocks(self) -> list[dict]:
+        """
+        Get probed blocks from the heaviest to the lightest one by peak allocated bytes.
+
+        Returns:
+            Probed blocks with their test items, descriptions and the highest net and peak allocated bytes as `list`.
+        """
+        blocks = [
+            {
+                'node_id': node_id,
+                'code_line': code_line,
+                'type': intention_type,
+                'description': description,
+                'domain': describe[0] if describe is not None else None,
+                'component': describe[1] if describe is not None else None,
+                'layer': describe[2] if describe is not None else None,
+                'count': count,
+                'allocated_bytes': allocated_bytes,
+                'peak_bytes': peak_bytes,
+            }
+            for (node_id, code_line, intention_type, description), (describe, count, allocated_bytes, peak_bytes) in (
+                self.blocks.items()
+            )
+        ]
+
+        return sorted(blocks, key=lambda block: (-block['peak_bytes'], block['node_id'], block['code_line']))
+
+    def dump(self) -> list[list]:
+        return [[*key, *value] for key, value in self.blocks.items()]
+
+    def load(self, data: list[list]) -> None:
+        """
+        Merge blocks probed by another process.
+
+        Arguments:
+            data (list): blocks dumped by the probe of another process.
+        """
+        for node_id, code_line, intention_type, description, describe, count, allocated_bytes, peak_bytes in data:
+            self.add_block(
+                node_id=node_id,
+                code_line=code_line,
+                intention_type=intention_type,
+                description=description,
+                describe=describe,
+                allocated_bytes=allocated_bytes,
+                peak_bytes=peak_bytes,
+                count=count,
+            )
+
+    def save(self, path: str = INTENTIONS_MEMORY_PATH) -> None:
+        memory_path = Path(path)
+
+        if not memory_path.parent.exists():
+            memory_path.parent.mkdir(parents=True)
+
+        with open(memory_path, 'w') as file:
+            json.dump(self.get_heaviest_blocks(), file, indent=4)
+
+    def _propagate_peak_memory(self, peak_memory: int) -> None:
+        for started_block in reversed(self.started_blocks):
+            if started_block is not None:
+                started_block[2] = max(started_block[2], peak_memory)
+                return
+
+
+def format_bytes(number_of_bytes: int) -> str:
+    return f'{number_of_bytes / 1024:.1f}KiB'
+
+
+def write_memory_summary(terminal_reporter: pytest.TerminalReporter, probe: IntentionsMemoryProbe, top: int) -> None:
+    """
+    Write the memory summary into the terminal.
+
+    Arguments:
+        terminal_reporter (pytest.TerminalReporter): a terminal reporter to write with.
+        probe (IntentionsMemoryProbe): a probe with probed blocks.
+        top (int): a number of the heaviest blocks to write.
+    """
+    terminal_reporter.write_sep('=', 'intentions memory')
+    terminal_reporter.write_line(f'heaviest {top} blocks (peak / net allocated):')
+
+    for block in probe.get_heaviest_blocks()[:top]:
+        terminal_reporter.write_line(
+            f'{format_bytes(block["peak_bytes"]):>14} {format_bytes(block["allocated_bytes"]):>14}  '
+            f'{block["type"]:<6} {block["node_id"]}:{block["code_line"]} {block["description"]}',
+        )
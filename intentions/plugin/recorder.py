@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import ast
+import inspect
+import linecache
+import os
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.enums import Intention
+from intentions.main import IntentionObserver
+from intentions.plugin.utils import get_item_describe
+from intentions.render.cache import (
+    file_test_cases_from_dict,
+    file_test_cases_to_dict,
+)
+from intentions.render.dto import (
+    DescribedTestCase,
+    FileTestCases,
+    TestCase,
+    TestCaseIntention,
+)
+from intentions.utils import convert_test_function_name_to_case_name
+
+if TYPE_CHECKING:
+    from types import (
+        CodeType,
+        FrameType,
+    )
+
+    import pytest
+
+    from intentions.main import AbstractIntention
+
+    TestCaseIdentity = tuple[str, Optional[str], str]
+    IntentionIdentity = tuple[int, str, str]
+
+INTENTION_NAMES = ('when', 'case', 'expect')
+
+
+def get_declaration_code_line(file_path: str, code_line: int, keywords: tuple[str, ...]) -> int:
+    """
+    Get a code line a function or class is declared on skipping its decorators.
+
+    The first code line of decorated functions and classes known at runtime is the code line of their first decorator,
+    while the renderer refers to the code line of the declaration itself.
+
+    Arguments:
+        file_path (str): a path to a file the function or class is declared in.
+        code_line (int): the first code line of the function or class including decorators.
+        keywords (tuple): keywords the declaration starts with.
+
+    Returns:
+        A code line the function or class is declared on as `int`.
+    """
+    current_code_line = code_line
+
+    while True:
+        line = linecache.getline(file_path, current_code_line)
+
+        if not line:
+            return code_line
+
+        if line.lstrip().startswith(keywords):
+            return current_code_line
+
+        current_code_line += 1
+
+
+def get_intention_code_lines(file_path: str) -> Optional[dict[IntentionIdentity, int]]:
+    """
+    Get code lines the renderer refers intentions of a file by.
+
+    The renderer refers to the code line of the description of an intention, while at runtime only the code line the
+    with statement is being executed on is known. They differ for with statements that span several lines, and the
+    executed code line of those differs between Python versions, so each code line a with statement spans is mapped.
+    Only with statements right in a body of a function are mapped, as the renderer looks only into those.
+
+    Arguments:
+        file_path (str): a path to a file with test functions.
+
+    Returns:
+        Code lines of descriptions of intentions by code lines of their with statements, types and descriptions as
+        `dict` or `None` if the file cannot be parsed.
+    """
+    try:
+        node = ast.parse(''.join(linecache.getlines(file_path)))
+
+    except (SyntaxError, ValueError):
+        return None
+
+    intention_code_lines = {}
+
+    for function_node in ast.walk(node):
+        if not isinstance(function_node, ast.FunctionDef):
+            continue
+
+        for with_node in function_node.body:
+            if not isinstance(with_node, ast.With):
+                continue
+
+            with_end_code_line = max(with_node_item.context_expr.end_lineno for with_node_item in with_node.items)
+
+            for with_node_item in with_node.items:
+                call = with_node_item.context_expr
+
+                if not isinstance(call, ast.Call) or not isinstance(call.func, ast.Name) or not call.args:
+                    continue
+
+                if call.func.id not in INTENTION_NAMES or not isinstance(call.args[0], ast.Constant):
+                    continue
+
+                for code_line in range(with_node.lineno, with_end_code_line + 1):
+                    intention_identity = (code_line, call.func.id, call.args[0].value)
+                    intention_code_lines.setdefault(intention_identity, call.args[0].lineno)
+
+    return intention_code_lines
+
+
+class IntentionsRecorder(IntentionObserver):
+    """
+    Recorder of intentions of executed test cases.
+    """
+
+    def __init__(self, root_directory: str) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            root_directory (str): a directory paths to test files are relative to.
+        """
+        self.root_directory = root_directory
+        self.test_cases: dict[TestCaseIdentity, DescribedTestCase] = {}
+        self.class_code_lines = {}
+        self.intention_code_lines: dict[str, Optional[dict[IntentionIdentity, int]]] = {}
+
+        self.current_item: Optional[pytest.Item] = None
+        self.current_code: Optional[CodeType] = None
+        self.current_intentions: list[TestCaseIntention] = []
+
+    def on_enter(self, intention: AbstractIntention, frame: FrameType) -> None:
+        """
+        Record an intention entered by the current test case.
+
+        Only intentions entered right in a body of the test function are recorded, as the renderer does, so intentions
+        of helpers and fixtures the test function calls are not.
+
+        Arguments:
+            intention (AbstractIntention): an entered intention.
+            frame (FrameType): a frame the intention is entered in.
+        """
+        if self.current_item is None or frame.f_code is not self.current_code:
+            return
+
+        code_line = self._get_intention_code_line(intention=intention, frame=frame)
+
+        if code_line is None:
+            return
+
+        self.current_intentions.append(
+            TestCaseIntention(
+                type=intention.intention_type,
+                code_line=code_line,
+                description=intention.description,
+                budget_ms=intention.budget_ms,
+                budget_bytes=intention.budget_bytes,
+            ),
+        )
+
+    def start_test_case(self, item: pytest.Item) -> None:
+        test_function = getattr(item, 'function', None)
+
+        self.current_item = item
+        self.current_code = None if test_function is None else inspect.unwrap(test_function).__code__
+        self.current_intentions = []
+
+    def finish_test_case(self) -> None:
+        """
+        Finish recording of the current test case.
+
+        A test case is kept only if it is described and has intentions, as the renderer does. If a test case is run
+        several times, for instance, being parametrized, the first run is kept.
+        """
+        item = self.current_item
+        intentions = self.current_intentions
+
+        self.current_item = None
+        self.current_code = None
+        self.current_intentions = []
+
+        if item is None or not intentions:
+            return
+
+        test_function = getattr(item, 'function', None)
+        test_class = getattr(item, 'cls', None)
+
+        if test_function is None:
+            return
+
+        describe = get_item_describe(item=item)
+
+        if describe is None:
+            return
+
+        file_path = os.path.relpath(item.path, self.root_directory).replace(os.sep, '/')
+        class_name = test_class.__name__ if test_class is not None else None
+        test_case_identity = (file_path, class_name, test_function.__name__)
+
+        if test_case_identity in self.test_cases:
+            return
+
+        unique_intentions = []
+
+        for intention in intentions:
+            if intention not in unique_intentions:
+                unique_intentions.append(intention)
+
+        case_description = None
+
+        for intention in unique_intentions:
+            if intention.type == Intention.CASE:
+                case_description = intention.description
+
+        function_code = test_function.__code__
+
+        self.test_cases[test_case_identity] = DescribedTestCase(
+            describe=describe,
+            case_description=case_description,
+            test_case=TestCase(
+                file_path=file_path,
+                class_name=class_name,
+                class_code_line=self._get_class_code_line(test_class=test_class),
+                case_name=convert_test_function_name_to_case_name(test_function_name=test_function.__name__),
+                function_name=test_function.__name__,
+                function_code_line=get_declaration_code_line(
+                    file_path=function_code.co_filename,
+                    code_line=function_code.co_firstlineno,
+                    keywords=('def ', 'async def '),
+                ),
+                intentions=unique_intentions,
+            ),
+        )
+
+    def get_file_test_cases(self) -> list[FileTestCases]:
+        """
+        Get recorded test cases grouped by test files.
+
+        Test files are sorted by their paths and test cases by their code lines, so merged records of several
+        processes are always in the same order.
+
+        Returns:
+            Recorded test cases of each test file as `list`.
+        """
+        file_test_cases = {}
+
+        for described_test_case in sorted(self.test_cases.values(), key=get_test_case_order):
+            file_path = described_test_case.test_case.file_path
+
+            if file_path not in file_test_cases:
+                file_test_cases[file_path] = FileTestCases(file_path=file_path)
+
+            file_test_cases[file_path].test_cases.append(described_test_case)
+
+        return list(file_test_cases.values())
+
+    def dump(self) -> dict:
+        return {
+            file_test_cases.file_path: file_test_cases_to_dict(file_test_cases=file_test_cases)
+            for file_test_cases in self.get_file_test_cases()
+        }
+
+    def load(self, data: dict) -> None:
+        """
+        Merge test cases recorded by another process.
+
+        Arguments:
+            data (dict): test cases dumped by the recorder of another process.
+        """
+        for file_path, file_test_cases_data in data.items():
+            file_test_cases = file_test_cases_from_dict(file_path=file_path, data=file_test_cases_data)
+            self.add_file_test_cases(file_test_cases=file_test_cases)
+
+    def add_file_test_cases(self, file_test_cases: FileTestCases) -> None:
+        for described_test_case in file_test_cases.test_cases:
+            test_case = described_test_case.test_case
+            test_case_identity = (test_case.file_path, test_case.class_name, test_case.function_name)
+
+            if test_case_identity not in self.test_cases:
+                self.test_cases[test_case_identity] = described_test_case
+
+    def _get_intention_code_line(self, intention: AbstractIntention, frame: FrameType) -> Optional[int]:
+        file_path = frame.f_code.co_filename
+
+        if file_path not in self.intention_code_lines:
+            self.intention_code_lines[file_path] = get_intention_code_lines(file_path=file_path)
+
+        intention_code_lines = self.intention_code_lines[file_path]
+
+        if intention_code_lines is None:
+            return frame.f_lineno
+
+        intention_identity = (frame.f_lineno, intention.intention_type.value, intention.description)
+
+        return intention_code_lines.get(intention_identity)
+
+    def _get_class_code_line(self, test_class: Optional[type]) -> Optional[int]:
+        if test_class is None:
+            return None
+
+        if test_class not in self.class_code_lines:
+            try:
+                file_path = inspect.getsourcefile(test_class)
+                _, code_line = inspect.findsource(test_class)
+
+            except (OSError, TypeError):
+                self.class_code_lines[test_class] = None
+
+            else:
+                self.class_code_lines[test_class] = get_declaration_code_line(
+                    file_path=file_path,
+                    code_line=code_line + 1,
+                    keywords=('class ',),
+                )
+
+        return self.class_code_lines[test_class]
+
+
+def get_test_case_order(described_test_case: DescribedTestCase) -> tuple[str, int, int]:
+    test_case = described_test_case.test_case
+    class_code_line = test_case.function_code_line
+
+    if test_case.class_code_line is not None:
+        class_code_line = test_case.class_code_line
+
+    return test_case.file_path, class_code_line, test_case.function_code_line
@@ -0,0 +1,138 @@
+"""
+Scheduling of tests onto `pytest-xdist` workers by their descriptions.
+
+The module imports `pytest-xdist`, so it is imported only by its hook when `pytest-xdist` is installed.
+"""
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from xdist.scheduler import LoadScopeScheduling
+
+from intentions.plugin.durations import (
+    TestDescribes,
+    predict_makespan,
+)
+
+if TYPE_CHECKING:
+    import pytest
+    from xdist.remote import Producer
+    from xdist.workermanage import WorkerController
+
+DESCRIBE_SCOPE_PREFIX = '@describe'
+DEFAULT_DURATION = 1.0
+
+
+class IntentionsScheduling(LoadScopeScheduling):
+    """
+    Scheduling of tests grouped by their descriptions onto workers longest processing time first.
+
+    Tests of the same domain, component and layer are a single work unit, so a worker pays for their shared setup
+    once. Tests that are not described are grouped by their module or class as `--dist=loadscope` does. A work unit is
+    predicted to take as long as its tests took in previous runs, tests without a recorded duration are predicted to
+    take the mean one. A worker that runs out of work takes the longest of the remaining work units, the work queue is
+    sorted by predicted durations once and again only when work units of a crashed worker are put back into it.
+    """
+
+    def __init__(
+        self,
+        config: pytest.Config,
+        log: Optional[Producer] = None,
+        durations: Optional[dict[str, float]] = None,
+    ) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            config (pytest.Config): pytest configuration.
+            log (Producer): a log of the scheduler.
+            durations (dict): recorded durations of tests in seconds by their node identifiers.
+        """
+        super().__init__(config=config, log=log)
+
+        self.durations = durations or {}
+        self.default_duration = DEFAULT_DURATION
+
+        if self.durations:
+            self.default_duration = sum(self.durations.values()) / len(self.durations)
+
+        self.test_describes = TestDescribes(root_directory=str(config.rootpath))
+
+        self.scopes: dict[str, str] = {}
+        self.scope_durations: dict[str, float] = {}
+        self.worker_durations: dict[str, float] = {}
+        self.predicted_makespan: Optional[float] = None
+        self.is_workqueue_sorted = False
+
+    @property
+    def actual_makespan(self) -> float:
+        return max(self.worker_durations.values(), default=0.0)
+
+    def schedule(self) -> None:
+        is_initial_schedule = self.collection is None
+        workers = len(self.nodes)
+
+        super().schedule()
+
+        if is_initial_schedule and self.collection:
+            scope_durations = {}
+
+            for node_id in self.collection:
+                scope = self._split_scope(node_id)
+                scope_durations[scope] = scope_durations.get(scope, 0.0) + self._predict_duration(node_id=node_id)
+
+            self.scope_durations = scope_durations
+            self.predicted_makespan = predict_makespan(durations=scope_durations.values(), workers=workers)
+
+    def mark_test_complete(self, node: WorkerController, item_index: int, duration: float = 0) -> None:
+        worker_id = node.gateway.id
+        self.worker_durations[worker_id] = self.worker_durations.get(worker_id, 0.0) + duration
+
+        super().mark_test_complete(node, item_index, duration)
+
+    def remove_node(self, node: WorkerController) -> Optional[str]:
+        crash_item = super().remove_node(node)
+        self.is_workqueue_sorted = False
+
+        return crash_item
+
+    def _assign_work_unit(self, node: WorkerController) -> None:
+        if not self.is_workqueue_sorted:
+            for scope in sorted(self.workqueue, key=self._predict_scope_duration, reverse=True):
+                self.workqueue.move_to_end(scope)
+
+            self.is_workqueue_sorted = True
+
+        super()._assign_work_unit(node)
+
+    def _split_scope(self, nodeid: str) -> str:
+        scope = self.scopes.get(nodeid)
+
+        if scope is not None:
+            return scope
+
+        describe = self.test_describes.get_describe(node_id=nodeid)
+
+        if describe is None:
+            scope = super()._split_scope(nodeid)
+        else:
+            scope = f'{DESCRIBE_SCOPE_PREFIX}/{describe.domain}/{describe.component}/{describe.layer}'
+
+        self.scopes[nodeid] = scope
+
+        return scope
+
+    def _predict_duration(self, node_id: str) -> float:
+        return self.durations.get(node_id, self.default_duration)
+
+    def _predict_scope_duration(self, scope: str) -> float:
+        scope_duration = self.scope_durations.get(scope)
+
+        if scope_duration is None:
+            scope_duration = sum(self._predict_duration(node_id=node_id) for node_id in self.workqueue[scope])
+            self.scope_durations[scope] = scope_duration
+
+        return scope_duration
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.render.cache import RenderCache
+from intentions.render.index import IntentionsIndex
+from intentions.render.main import (
+    INTENTIONS_FOLDER_PATH,
+    extract_test_cases,
+)
+
+if TYPE_CHECKING:
+    from intentions.dto import Describe
+
+INTENTIONS_SELECTION_CACHE_PATH = f'{INTENTIONS_FOLDER_PATH}/selection-cache.json'
+
+
+class IntentionsSelector:
+    """
+    Selector of test files and test items by domain, component and layer of their test cases.
+
+    Test files are selected by test cases rendered from them without importing them, either from a prebuilt
+    intentions index or by static extraction. The extraction is incremental, test cases of unchanged files are served
+    from a cache of its own. Paths to test files are matched relative to the current working directory, as the
+    renderer stores them.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        domain: Optional[str] = None,
+        component: Optional[str] = None,
+        layer: Optional[str] = None,
+        index_path: Optional[str] = None,
+        cache_path: str = INTENTIONS_SELECTION_CACHE_PATH,
+    ) -> None:
+        """
+        Construct the object.
+
+        If the index is given, but does not exist, `FileNotFoundError` of the index is raised.
+
+        Arguments:
+            domain (str): a domain of test cases to select.
+            component (str): a component of test cases to select.
+            layer (str): a layer of test cases to select.
+            index_path (str): a path to the intentions index to select test files by, test files are extracted
+                statically if it is not given.
+            cache_path (str): a path to the cache of statically extracted test cases.
+        """
+        self.domain = domain
+        self.component = component
+        self.layer = layer
+
+        self.cache = None
+        self.indexed_file_paths = set()
+        self.selected_file_paths = set()
+        self.index_modified_at = 0
+
+        if index_path is None:
+            self.cache = RenderCache(path=cache_path)
+        else:
+            with IntentionsIndex(path=index_path) as intentions_index:
+                self.indexed_file_paths = intentions_index.get_file_paths()
+                self.selected_file_paths = intentions_index.get_file_paths(
+                    domain=domain,
+                    component=component,
+                    layer=layer,
+                )
+
+            self.index_modified_at = Path(index_path).stat().st_mtime_ns
+
+        self.ignored_files = 0
+        self.unknown_files = 0
+
+    def matches(self, describe: Optional[Describe]) -> bool:
+        if describe is None:
+            return False
+
+        return (
+            (self.domain is None or describe.domain == self.domain)
+            and (self.component is None or describe.component == self.component)
+            and (self.layer is None or describe.layer == self.layer)
+        )
+
+    def select_file(self, path: Path) -> Optional[bool]:
+        """
+        Check whether a test file has selected test cases without importing it.
+
+        A file is unknown if it cannot be parsed, or it is not in the index or modified after the index was built, as
+        files without test cases are not indexed at all. A statically extracted file is unknown if none of its described
+        test cases is extracted, as test functions without intention blocks are not extracted at all.
+
+        Arguments:
+            path (Path): a path to the test file.
+
+        Returns:
+            Whether the test file has selected test cases as `bool` or `None` if it is unknown.
+        """
+        try:
+            file = Path(os.path.relpath(path))
+
+        except ValueError:
+            file = path
+
+        if self.cache is None:
+            is_selected = self._select_indexed_file(file=file)
+        else:
+            is_selected = self._select_extracted_file(file=file)
+
+        if is_selected is None:
+            self.unknown_files += 1
+
+        elif not is_selected:
+            self.ignored_files += 1
+
+        return is_selected
+
+    def save(self) -> None:
+        if self.cache is not None:
+            self.cache.save()
+
+    def _select_indexed_file(self, file: Path) -> Optional[bool]:
+        file_path = file.as_posix()
+
+        if file_path not in self.indexed_file_paths:
+            return None
+
+        if file.stat().st_mtime_ns > self.index_modified_at:
+            return None
+
+        return file_path in self.selected_file_paths
+
+    def _select_extracted_file(self, file: Path) -> Optional[bool]:
+        file_test_cases = self.cache.get(file=file)
+
+        if file_test_cases is None:
+            file_test_cases = extract_test_cases(file_path=file.as_posix())
+            self.cache.set(file_test_cases=file_test_cases)
+
+        if file_test_cases.error is not None:
+            return None
+
+        describes = [test_case.describe for test_case in file_test_cases.test_cases if test_case.describe is not None]
+
+        if not describes:
+            return None
+
+        return any(self.matches(describe=describe) for describe in describes)
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import heapq
+import time
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.enums import Intention
+from intentions.main import IntentionObserver
+from intentions.plugin.utils import get_item_describe
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+    import pytest
+
+    from intentions.main import AbstractIntention
+
+INTENTION_STAGES = {
+    Intention.WHEN.value: 'arrange',
+    Intention.CASE.value: 'act',
+    Intention.EXPECT.value: 'assert',
+}
+
+
+class IntentionsTimer(IntentionObserver):
+    """
+    Timer of intention blocks of executed test cases.
+
+    Wall clock time is measured with `time.perf_counter_ns` and CPU time with `time.process_time_ns`, both monotonic.
+    Timings are aggregated per intention type and description, and per describe group and intention type. Only the
+    slowest blocks are kept individually.
+    """
+
+    def __init__(self, top: int = 10) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            top (int): a number of the slowest blocks to keep.
+        """
+        self.top = top
+
+        self.slowest_blocks: list[tuple[int, int, str, str, int, str]] = []
+        self.descriptions: dict[tuple[str, str], list[int]] = {}
+        self.describe_groups: dict[tuple[str, str, str, str], list[int]] = {}
+
+        self.current_node_id: Optional[str] = None
+        self.current_describe: Optional[tuple[str, str, str]] = None
+        self.started_blocks: list[tuple[int, int, int]] = []
+
+    def start_test_case(self, item: pytest.Item) -> None:
+        describe = get_item_describe(item=item)
+
+        self.current_node_id = item.nodeid
+        self.current_describe = None if describe is None else (describe.domain, describe.component, describe.layer)
+        self.started_blocks = []
+
+    def finish_test_case(self) -> None:
+        self.current_node_id = None
+        self.current_describe = None
+        self.started_blocks = []
+
+    def on_enter(self, intention: AbstractIntention, frame: FrameType) -> None:  # noqa: ARG002
+        if self.current_node_id is None:
+            return
+
+        self.started_blocks.append((frame.f_lineno, time.perf_counter_ns(), time.process_time_ns()))
+
+    def on_exit(self, intention: AbstractIntention, exc_type: Optional[type[BaseException]]) -> None:  # noqa: ARG002
+        finished_at, finished_at_cpu = time.perf_counter_ns(), time.process_time_ns()
+
+        if self.current_node_id is None or not self.started_blocks:
+            return
+
+        code_line, started_at, started_at_cpu = self.started_blocks.pop()
+        wall_time, cpu_time = finished_at - started_at, finished_at_cpu - started_at_cpu
+        intention_type = intention.intention_type.value
+
+        self.add_block(
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            intention_type=intention_type,
+            description=intention.description,
+            code_line=code_line,
+            node_id=self.current_node_id,
+            describe=self.current_describe,
+        )
+
+    def add_block(  # noqa: PLR0913
+        self,
+        wall_time: int,
+        cpu_time: int,
+        intention_type: str,
+        description: str,
+        code_line: int,
+        node_id: str,
+        describe: Optional[tuple[str, str, str]],
+    ) -> None:
+        """
+        Account a timed block.
+
+        Arguments:
+            wall_time (int): wall clock time of the block in nanoseconds.
+            cpu_time (int): CPU time of the block in nanoseconds.
+            intention_type (str): a type of the block's intention.
+            description (str): a description of the block's intention.
+            code_line (int): a code line the block is declared on.
+            node_id (str): an identifier of a test item the block is executed by.
+            describe (tuple): a domain, component and layer of the test item if it is described.
+        """
+        self._keep_if_slowest(block=(wall_time, cpu_time, intention_type, description, code_line, node_id))
+
+        self._accumulate(
+            storage=self.descriptions,
+            key=(intention_type, description),
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+        )
+
+        if describe is not None:
+            self._accumulate(
+                storage=self.describe_groups,
+                key=(*describe, intention_type),
+                wall_time=wall_time,
+                cpu_time=cpu_time,
+            )
+
+    def get_slowest_blocks(self) -> list[tuple[int, int, str, str, int, str]]:
+        return sorted(self.slowest_blocks, reverse=True)
+
+    def get_stages_per_domain(self) -> dict[str, dict[str, list[int]]]:
+        """
+        Get cumulative arrange, act and assert time per domain.
+
+        Returns:
+            Wall clock and CPU time of each stage of each domain as `dict`.
+        """
+        stages_per_domain = {}
+
+        for (domain, _, _, intention_type), (_, wall_time, cpu_time, _) in self.describe_groups.items():
+            stages = stages_per_domain.setdefault(domain, {stage: [0, 0] for stage in INTENTION_STAGES.values()})
+            stage = stages[INTENTION_STAGES[intention_type]]
+            stage[0] += wall_time
+            stage[1] += cpu_time
+
+        return stages_per_domain
+
+    def dump(self) -> dict:
+        return {
+            'slowest_blocks': [list(block) for block in self.slowest_blocks],
+            'descriptions': [[*key, *value] for key, value in self.descriptions.items()],
+            'describe_groups': [[*key, *value] for key, value in self.describe_groups.items()],
+        }
+
+    def load(self, data: dict) -> None:
+        """
+        Merge timings measured by another process.
+
+        Arguments:
+            data (dict): timings dumped by the timer of another process.
+        """
+        for block in data['slowest_blocks']:
+            self._keep_if_slowest(block=tuple(block))
+
+        for intention_type, description, count, wall_time, cpu_time, max_wall_time in data['descriptions']:
+            self._merge(
+                storage=self.descriptions,
+                key=(intention_type, description),
+                value=[count, wall_time, cpu_time, max_wall_time],
+            )
+
+        for domain, component, layer, intention_type, count, wall_time, cpu_time, max_wall_time in data[
+            'describe_groups'
+        ]:
+            self._merge(
+                storage=self.describe_groups,
+                key=(domain, component, layer, intention_type),
+                value=[count, wall_time, cpu_time, max_wall_time],
+            )
+
+    def _keep_if_slowest(self, block: tuple[int, int, str, str, int, str]) -> None:
+        if len(self.slowest_blocks) < self.top:
+            heapq.heappush(self.slowest_blocks, block)
+            return
+
+        if self.top and block > self.slowest_blocks[0]:
+            heapq.heapreplace(self.slowest_blocks, block)
+
+    @staticmethod
+    def _accumulate(storage: dict, key: tuple, wall_time: int, cpu_time: int) -> None:
+        timing = storage.get(key)
+
+        if timing is None:
+            storage[key] = [1, wall_time, cpu_time, wall_time]
+            return
+
+        timing[0] += 1
+        timing[1] += wall_time
+        timing[2] += cpu_time
+        timing[3] = max(timing[3], wall_time)
+
+    @staticmethod
+    def _merge(storage: dict, key: tuple, value: list[int]) -> None:
+        timing = storage.get(key)
+
+        if timing is None:
+            storage[key] = value
+            return
+
+        timing[0] += value[0]
+        timing[1] += value[1]
+        timing[2] += value[2]
+        timing[3] = max(timing[3], value[3])
+
+
+def format_duration(nanoseconds: int) -> str:
+    return f'{nanoseconds / 1_000_000:.2f}ms'
+
+
+def write_timing_summary(terminal_reporter: pytest.TerminalReporter, timer: IntentionsTimer) -> None:
+    """
+    Write the timing summary into the terminal.
+
+    Arguments:
+        terminal_reporter (pytest.TerminalReporter): a terminal reporter to write with.
+        timer (IntentionsTimer): a timer with measured timings.
+    """
+    terminal_reporter.write_sep('=', 'intentions timing')
+
+    terminal_reporter.write_line(f'slowest {timer.top} blocks (wall / cpu):')
+
+    for wall_time, cpu_time, intention_type, description, code_line, node_id in timer.get_slowest_blocks():
+        terminal_reporter.write_line(
+            f'{format_duration(wall_time):>12} {format_duration(cpu_time):>12}  '
+            f'{intention_type:<6} {node_id}:{code_line} {description}',
+        )
+
+    terminal_reporter.write_line('')
+    terminal_reporter.write_line('arrange / act / assert per domain (wall / cpu):')
+
+    for domain, stages in sorted(timer.get_stages_per_domain().items()):
+        terminal_reporter.write_line(
+            f'{domain}: ' + ', '.join(
+                f'{stage} {format_duration(wall_time)} / {format_duration(cpu_time)}'
+                for stage, (wall_time, cpu_time) in stages.items()
+            ),
+        )
+
+    terminal_reporter.write_line('')
+    terminal_reporter.write_line(f'slowest {timer.top} describe groups (count, total wall / cpu, max wall):')
+
+    describe_groups = sorted(timer.describe_groups.items(), key=lambda item: item[1][1], reverse=True)
+
+    for (domain, component, layer, intention_type), (count, wall_time, cpu_time, max_wall_time) in describe_groups[
+        :timer.top
+    ]:
+        terminal_reporter.write_line(
+            f'{format_duration(wall_time):>12} {format_duration(cpu_time):>12} {format_duration(max_wall_time):>12}'
+            f'  {count:>6}x {intention_type:<6} {domain}/{component}/{layer}',
+        )
+
+    terminal_reporter.write_line('')
+    terminal_reporter.write_line(f'slowest {timer.top} descriptions (count, total wall / cpu, max wall):')
+
+    descriptions = sorted(timer.descriptions.items(), key=lambda item: item[1][1], reverse=True)
+
+    for (intention_type, description), (count, wall_time, cpu_time, max_wall_time) in descriptions[:timer.top]:
+        terminal_reporter.write_line(
+            f'{format_duration(wall_time):>12} {format_duration(cpu_time):>12} {format_duration(max_wall_time):>12}'
+            f'  {count:>6}x {intention_type:<6} {description}',
+        )
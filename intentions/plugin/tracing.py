@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.main import IntentionObserver
+from intentions.plugin.utils import get_item_describe
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import FrameType
+
+    import pytest
+
+    from intentions.main import AbstractIntention
+
+INTENTIONS_TRACE_PATH = './.intentions/trace.json'
+TRACE_BUFFER_SIZE = 1_000_000
+TEST_EVENT_CATEGORY = 'test'
+
+
+class IntentionsTracer(IntentionObserver):
+    """
+    Tracer of test cases and their intention blocks into Chrome trace events.
+
+    Test cases and blocks are buffered as plain tuples in a ring of a fixed size and converted to trace events only
+    when the trace is written, so tracing costs a clock read and a tuple per block. If the ring is full, the oldest
+    events are dropped. Timestamps are taken with `time.perf_counter_ns` that is a system-wide monotonic clock on Linux,
+    so events of `pytest-xdist` workers fit on the same timeline.
+    """
+
+    def __init__(self, process_name: str, buffer_size: int = TRACE_BUFFER_SIZE) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            process_name (str): a name of the process to show in the trace, for instance, a worker identifier.
+            buffer_size (int): a maximum number of events to keep.
+        """
+        self.process_name = process_name
+        self.process_id = os.getpid()
+        self.events: deque[tuple] = deque(maxlen=buffer_size)
+        self.recorded_events = 0
+        self.processes: dict[int, str] = {self.process_id: process_name}
+
+        self.current_node_id: Optional[str] = None
+        self.current_describe: Optional[tuple[str, str, str]] = None
+        self.started_test_case_at: Optional[int] = None
+        self.started_blocks: list[tuple[int, int]] = []
+
+    def start_test_case(self, item: pytest.Item) -> None:
+        describe = get_item_describe(item=item)
+
+        self.current_node_id = item.nodeid
+        self.current_describe = None if describe is None else (describe.domain, describe.component, describe.layer)
+        self.started_blocks = []
+        self.started_test_case_at = time.perf_counter_ns()
+
+    def finish_test_case(self) -> None:
+        finished_at = time.perf_counter_ns()
+
+        if self.current_node_id is not None and self.started_test_case_at is not None:
+            self._add_event(
+                category=TEST_EVENT_CATEGORY,
+                name=self.current_node_id,
+                code_line=None,
+                started_at=self.started_test_case_at,
+                finished_at=finished_at,
+            )
+
+        self.current_node_id = None
+        self.current_describe = None
+        self.started_test_case_at = None
+        self.started_blocks = []
+
+    def on_enter(self, intention: AbstractIntention, frame: FrameType) -> None:  # noqa: ARG002
+        if self.current_node_id is None:
+            return
+
+        self.started_blocks.append((frame.f_lineno, time.perf_counter_ns()))
+
+    def on_exit(self, intention: AbstractIntention, exc_type: Optional[type[BaseException]]) -> None:  # noqa: ARG002
+        finished_at = time.perf_counter_ns()
+
+        if self.current_node_id is None or not self.started_blocks:
+            return
+
+        code_line, started_at = self.started_blocks.pop()
+
+        self._add_event(
+            category=intention.intention_type.value,
+            name=intention.description,
+            code_line=code_line,
+            started_at=started_at,
+            finished_at=finished_at,
+        )
+
+    def dump(self) -> dict:
+        return {
+            'process_id': self.process_id,
+            'process_name': self.process_name,
+            'recorded_events': self.recorded_events,
+            'events': [list(event) for event in self.events],
+        }
+
+    def load(self, data: dict) -> None:
+        """
+        Merge events traced by another process.
+
+        Arguments:
+            data (dict): events dumped by the tracer of another process.
+        """
+        self.processes[data['process_id']] = data['process_name']
+        self.recorded_events += data['recorded_events']
+
+        self.events.extend(tuple(event) for event in data['events'])
+
+    def iter_trace_events(self) -> Iterator[dict]:
+        """
+        Iterate over buffered events converted to Chrome trace events.
+
+        Test cases and blocks are complete events with timestamps and durations in microseconds. Processes are named
+        with metadata events.
+
+        Yields:
+            Trace events as `dict`.
+        """
+        for process_id, process_name in self.processes.items():
+            yield {'name': 'process_name', 'ph': 'M', 'pid': process_id, 'tid': 0, 'args': {'name': process_name}}
+
+        for category, name, code_line, started_at, duration, process_id, thread_id, node_id, describe in self.events:
+            args = {'node_id': node_id}
+
+            if code_line is not None:
+                args['code_line'] = code_line
+
+            if describe is not None:
+                args['domain'], args['component'], args['layer'] = describe
+
+            yield {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': started_at / 1000,
+                'dur': duration / 1000,
+                'pid': process_id,
+                'tid': thread_id,
+                'args': args,
+            }
+
+    def save(self, path: str = INTENTIONS_TRACE_PATH) -> None:
+        """
+        Write buffered events into a Chrome trace event JSON file.
+
+        Events are written one by one, so the whole trace is never held in memory as a string.
+
+        Arguments:
+            path (str): a path to the trace file.
+        """
+        trace_path = Path(path)
+
+        if not trace_path.parent.exists():
+            trace_path.parent.mkdir(parents=True)
+
+        with open(trace_path, 'w') as file:
+            other_data = {'recorded_events': self.recorded_events, 'kept_events': len(self.events)}
+
+            file.write(f'{{"displayTimeUnit": "ms", "otherData": {json.dumps(other_data)}, "traceEvents": [')
+
+            for index, trace_event in enumerate(self.iter_trace_events()):
+                file.write(',\n' if index else '\n')
+                file.write(json.dumps(trace_event))
+
+            file.write('\n]}\n')
+
+    def _add_event(  # noqa: PLR0913
+        self,
+        category: str,
+        name: str,
+        code_line: Optional[int],
+        started_at: int,
+        finished_at: int,
+    ) -> None:
+        self.recorded_events += 1
+        self.events.append((
+            category,
+            name,
+            code_line,
+            started_at,
+            finished_at - started_at,
+            self.process_id,
+            threading.get_native_id(),
+            self.current_node_id,
+            self.current_describe,
+        ))
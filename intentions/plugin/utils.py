@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.main import get_describe
+
+if TYPE_CHECKING:
+    import pytest
+
+    from intentions.dto import Describe
+
+
+def is_xdist_worker(config: pytest.Config) -> bool:
+    return hasattr(config, 'workerinput')
+
+
+def get_item_describe(item: pytest.Item) -> Optional[Describe]:
+    """
+    Get a description of a test item.
+
+    As the renderer does, test functions of a class are described by the class and other test functions by themselves.
+
+    Arguments:
+        item (pytest.Item): a test item.
+
+    Returns:
+        A description of the test item as `Describe` or `None` if it is not described.
+    """
+    test_class = getattr(item, 'cls', None)
+
+    if test_class is not None:
+        return get_describe(test_class)
+
+    test_function = getattr(item, 'function', None)
+
+    if test_function is None:
+        return None
+
+    return get_describe(test_function)
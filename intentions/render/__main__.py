@@ -0,0 +1,378 @@
+"""
+Command line interface of the intentions renderer.
+
+Usage:
+    python -m intentions.render json ./tests --workers=4 --cache
+    python -m intentions.render json ./tests --lines --output=intentions.jsonl
+    python -m intentions.render json ./tests --profile --profile-json=profile.json
+    python -m intentions.render shards ./tests --by-component
+    python -m intentions.render index ./tests --search
+    python -m intentions.render search "transfer money" --type=case --domain=accounts
+    python -m intentions.render watch ./tests
+    python -m intentions.render git main --directory=tests --output=main.json --cache
+    python -m intentions.render diff ./base/intentions.json ./.intentions/intentions.json --output=diff.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.enums import Intention
+from intentions.render.diff import (
+    diff_renders,
+    load_render,
+)
+from intentions.render.encoders import (
+    COMPACT_JSON_SEPARATORS,
+    JSON_INDENT,
+)
+from intentions.render.enums import ExtractionEngine
+from intentions.render.git import create_intentions_json_from_git
+from intentions.render.index import (
+    INTENTIONS_INDEX_PATH,
+    IntentionsIndex,
+)
+from intentions.render.main import (
+    INTENTIONS_JSON_PATH,
+    INTENTIONS_LINES_PATH,
+    create_intentions_index,
+    create_intentions_json,
+    create_intentions_lines,
+    create_intentions_shards,
+)
+from intentions.render.profiling import (
+    SLOWEST_FILES,
+    RenderProfiler,
+    save_render_profile,
+)
+from intentions.render.shards import INTENTIONS_SHARDS_PATH
+from intentions.render.walker import WalkFilter
+from intentions.render.watch import watch_intentions_json
+
+if TYPE_CHECKING:
+    from intentions.render.dto import (
+        RenderProfile,
+        RenderSummary,
+    )
+
+
+def add_walk_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--include', action='append', default=[], help='a glob of test files to render only')
+    parser.add_argument('--exclude', action='append', default=[], help='a glob of test files and directories to skip')
+    parser.add_argument('--gitignore', action='store_true', help='skip test files ignored by .gitignore files')
+
+
+def add_engine_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '--engine',
+        choices=[engine.value for engine in ExtractionEngine],
+        default=ExtractionEngine.AST.value,
+        help=(
+            'an engine to extract test cases with, the scanner one is faster and falls back to ast when needed, but '
+            'it does not check the syntax of code it does not look into, so a file with a syntax error out of describe '
+            'decorators and intention with statements is rendered instead of being reported as an error'
+        ),
+    )
+
+
+def add_render_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('directory', help='a path to a directory with test files')
+    parser.add_argument('--workers', type=int, default=1, help='a number of processes to parse test files with')
+    parser.add_argument('--cache', action='store_true', help='parse only test files changed since the previous render')
+    parser.add_argument('--no-prefilter', action='store_true', help='parse test files that do not mention intentions')
+    add_engine_argument(parser=parser)
+    add_walk_arguments(parser=parser)
+
+
+def get_walk_filter(arguments: argparse.Namespace) -> WalkFilter:
+    return WalkFilter(include=tuple(arguments.include), exclude=tuple(arguments.exclude), gitignore=arguments.gitignore)
+
+
+def print_render_summary(summary: RenderSummary) -> None:
+    print(  # noqa: T201
+        f'Rendered {summary.test_cases} test cases from {summary.files} files, '
+        f'{summary.skipped_files} files skipped, {len(summary.errors)} errors, '
+        f'{summary.cache_hits} cache hits, {summary.cache_misses} cache misses.',
+    )
+
+    for error in summary.errors:
+        print(f'{error.file_path}:{error.code_line}: {error.message}')  # noqa: T201
+
+
+def print_render_profile(profile: RenderProfile) -> None:
+    print(  # noqa: T201
+        f'Profiled {profile.files} files in {profile.elapsed * 1000:.1f} ms, {profile.skipped_files} files skipped, '
+        f'{profile.cached_files} files cached, {profile.bytes_read} bytes read, {profile.nodes} nodes parsed, '
+        f'{profile.test_cases} test cases.',
+    )
+
+    for name, elapsed in profile.phases.items():
+        print(f'    {name:<10} {elapsed * 1000:>10.1f} ms')  # noqa: T201
+
+    if profile.slowest_files:
+        print('Slowest files:')  # noqa: T201
+
+    for file_profile in profile.slowest_files:
+        print(f'    {file_profile.elapsed * 1000:>10.1f} ms  {file_profile.file_path}')  # noqa: T201
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m intentions.render', description='Render intentions of test cases.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    json_parser = subparsers.add_parser('json', help='render test cases into the intentions JSON file')
+    add_render_arguments(parser=json_parser)
+    json_parser.add_argument('--compact', action='store_true', help='write the JSON file without indentation')
+    json_parser.add_argument('--tables', action='store_true', help='write each string once in a string table')
+    json_parser.add_argument(
+        '--lines',
+        action='store_true',
+        help='write a test case per line as it is rendered, so memory does not grow with test cases',
+    )
+    json_parser.add_argument('--output', help='a path to the intentions JSON or JSON Lines file')
+    json_parser.add_argument('--profile', action='store_true', help='print time of each phase of the render')
+    json_parser.add_argument('--profile-json', help='a path to write the profile of the render to as JSON')
+    json_parser.add_argument(
+        '--profile-slowest',
+        type=int,
+        default=SLOWEST_FILES,
+        help='a number of the slowest files to profile',
+    )
+
+    shards_parser = subparsers.add_parser('shards', help='render test cases into intentions JSON files per domain')
+    add_render_arguments(parser=shards_parser)
+    shards_parser.add_argument('--compact', action='store_true', help='write shards without indentation')
+    shards_parser.add_argument('--by-component', action='store_true', help='write a shard per domain and component')
+    shards_parser.add_argument('--output', default=INTENTIONS_SHARDS_PATH, help='a path to a directory of shards')
+
+    index_parser = subparsers.add_parser('index', help='render test cases into the intentions SQLite index')
+    add_render_arguments(parser=index_parser)
+    index_parser.add_argument('--search', action='store_true', help='build an inverted index of descriptions')
+    index_parser.add_argument('--output', default=INTENTIONS_INDEX_PATH, help='a path to the intentions index')
+
+    search_parser = subparsers.add_parser('search', help='search test cases by descriptions of their intentions')
+    search_parser.add_argument('query', help='a text to search')
+    search_parser.add_argument('--type', choices=[intention.value for intention in Intention], dest='intention_type')
+    search_parser.add_argument('--domain')
+    search_parser.add_argument('--component')
+    search_parser.add_argument('--layer')
+    search_parser.add_argument('--limit', type=int, default=10)
+    search_parser.add_argument('--index', default=INTENTIONS_INDEX_PATH, help='a path to the intentions index')
+
+    watch_parser = subparsers.add_parser('watch', help='keep the intentions JSON file up to date with test files')
+    watch_parser.add_argument('directory', help='a path to a directory with test files')
+    watch_parser.add_argument('--compact', action='store_true', help='write the JSON file without indentation')
+    watch_parser.add_argument(
+        '--no-prefilter',
+        action='store_true',
+        help='parse test files that do not mention intentions',
+    )
+    watch_parser.add_argument('--debounce', type=float, default=0.2, help='seconds without changes to wait for')
+    watch_parser.add_argument('--polling', action='store_true', help='poll test files even if inotify is available')
+    watch_parser.add_argument('--poll-interval', type=float, default=1.0, help='seconds between polls')
+    add_walk_arguments(parser=watch_parser)
+
+    git_parser = subparsers.add_parser('git', help='render test cases of a git revision without checking it out')
+    git_parser.add_argument('revision', help='a revision to render, for instance, a branch name or a commit SHA')
+    git_parser.add_argument('--repository', default='.', help='a path to the git repository')
+    git_parser.add_argument('--directory', default='', help='a path to a directory with test files in the repository')
+    git_parser.add_argument('--output', default=INTENTIONS_JSON_PATH, help='a path to the intentions JSON file')
+    git_parser.add_argument('--cache', action='store_true', help='parse only blobs not parsed in any revision before')
+    git_parser.add_argument(
+        '--no-prefilter',
+        action='store_true',
+        help='parse test files that do not mention intentions',
+    )
+    add_engine_argument(parser=git_parser)
+    git_parser.add_argument('--compact', action='store_true', help='write the JSON file without indentation')
+    git_parser.add_argument('--tables', action='store_true', help='write each string once in a string table')
+    git_parser.add_argument('--include', action='append', default=[], help='a glob of test files to render only')
+    git_parser.add_argument(
+        '--exclude',
+        action='append',
+        default=[],
+        help='a glob of test files and directories to skip',
+    )
+
+    diff_parser = subparsers.add_parser('diff', help='diff test cases and intentions of two renders')
+    diff_parser.add_argument('old', help='a path to the old intentions JSON file or shards directory')
+    diff_parser.add_argument('new', help='a path to the new intentions JSON file or shards directory')
+    diff_parser.add_argument('--output', help='a path to write the diff JSON to instead of the standard output')
+    diff_parser.add_argument('--compact', action='store_true', help='write the diff JSON without indentation')
+
+    return parser
+
+
+def run_json_command(arguments: argparse.Namespace) -> None:
+    if arguments.lines:
+        summary = create_intentions_lines(
+            directory=arguments.directory,
+            path=arguments.output or INTENTIONS_LINES_PATH,
+            workers=arguments.workers,
+            cache=arguments.cache,
+            prefilter=not arguments.no_prefilter,
+            walk_filter=get_walk_filter(arguments=arguments),
+            engine=ExtractionEngine(arguments.engine),
+        )
+        print_render_summary(summary=summary)
+        return
+
+    profiler = None
+
+    if arguments.profile or arguments.profile_json:
+        profiler = RenderProfiler(slowest_files=arguments.profile_slowest)
+
+    summary = create_intentions_json(
+        directory=arguments.directory,
+        path=arguments.output or INTENTIONS_JSON_PATH,
+        workers=arguments.workers,
+        cache=arguments.cache,
+        compact=arguments.compact,
+        prefilter=not arguments.no_prefilter,
+        walk_filter=get_walk_filter(arguments=arguments),
+        tables=arguments.tables,
+        engine=ExtractionEngine(arguments.engine),
+        profiler=profiler,
+    )
+    print_render_summary(summary=summary)
+
+    if arguments.profile:
+        print_render_profile(profile=summary.profile)
+
+    if arguments.profile_json:
+        save_render_profile(profile=summary.profile, path=arguments.profile_json)
+
+
+def run_shards_command(arguments: argparse.Namespace) -> None:
+    summary, shards_summary = create_intentions_shards(
+        directory=arguments.directory,
+        path=arguments.output,
+        workers=arguments.workers,
+        cache=arguments.cache,
+        compact=arguments.compact,
+        prefilter=not arguments.no_prefilter,
+        walk_filter=get_walk_filter(arguments=arguments),
+        by_component=arguments.by_component,
+        engine=ExtractionEngine(arguments.engine),
+    )
+    print_render_summary(summary=summary)
+    print(  # noqa: T201
+        f'Written {shards_summary.written} shards, {shards_summary.unchanged} unchanged, '
+        f'{shards_summary.removed} removed.',
+    )
+
+
+def run_index_command(arguments: argparse.Namespace) -> None:
+    summary = create_intentions_index(
+        directory=arguments.directory,
+        path=arguments.output,
+        workers=arguments.workers,
+        cache=arguments.cache,
+        prefilter=not arguments.no_prefilter,
+        search=arguments.search,
+        walk_filter=get_walk_filter(arguments=arguments),
+        engine=ExtractionEngine(arguments.engine),
+    )
+    print_render_summary(summary=summary)
+
+
+def run_search_command(arguments: argparse.Namespace) -> None:
+    intention_type = Intention(arguments.intention_type) if arguments.intention_type else None
+
+    with IntentionsIndex(path=arguments.index) as intentions_index:
+        search_results = intentions_index.search(
+            query=arguments.query,
+            intention_type=intention_type,
+            domain=arguments.domain,
+            component=arguments.component,
+            layer=arguments.layer,
+            limit=arguments.limit,
+        )
+
+    for search_result in search_results:
+        describe = search_result.described_test_case.describe
+        test_case = search_result.described_test_case.test_case
+
+        print(  # noqa: T201
+            f'{search_result.score:.2f} {describe.domain}/{describe.component}/{describe.layer} '
+            f'{test_case.file_path}:{test_case.function_code_line} {test_case.function_name}',
+        )
+
+        for intention in search_result.intentions:
+            print(f'    {intention.type.value} {intention.code_line}: {intention.description}')  # noqa: T201
+
+
+def run_watch_command(arguments: argparse.Namespace) -> None:
+    try:
+        watch_intentions_json(
+            directory=arguments.directory,
+            compact=arguments.compact,
+            prefilter=not arguments.no_prefilter,
+            debounce=arguments.debounce,
+            polling=arguments.polling,
+            poll_interval=arguments.poll_interval,
+            on_update=print_render_summary,
+            walk_filter=get_walk_filter(arguments=arguments),
+        )
+
+    except KeyboardInterrupt:
+        return
+
+
+def run_git_command(arguments: argparse.Namespace) -> None:
+    summary = create_intentions_json_from_git(
+        revision=arguments.revision,
+        repository=arguments.repository,
+        directory=arguments.directory,
+        path=arguments.output,
+        cache=arguments.cache,
+        compact=arguments.compact,
+        prefilter=not arguments.no_prefilter,
+        walk_filter=WalkFilter(include=tuple(arguments.include), exclude=tuple(arguments.exclude)),
+        tables=arguments.tables,
+        engine=ExtractionEngine(arguments.engine),
+    )
+    print_render_summary(summary=summary)
+
+
+def run_diff_command(arguments: argparse.Namespace) -> None:
+    renders_diff = diff_renders(
+        old_storage=load_render(path=arguments.old),
+        new_storage=load_render(path=arguments.new),
+    )
+
+    if arguments.compact:
+        encoded_diff = json.dumps(renders_diff, separators=COMPACT_JSON_SEPARATORS)
+    else:
+        encoded_diff = json.dumps(renders_diff, indent=JSON_INDENT)
+
+    if arguments.output is None:
+        sys.stdout.write(f'{encoded_diff}\n')
+    else:
+        with open(arguments.output, 'w') as file:
+            file.write(encoded_diff)
+
+
+COMMANDS = {
+    'json': run_json_command,
+    'shards': run_shards_command,
+    'index': run_index_command,
+    'search': run_search_command,
+    'watch': run_watch_command,
+    'git': run_git_command,
+    'diff': run_diff_command,
+}
+
+
+def main(arguments: Optional[list[str]] = None) -> None:
+    arguments = create_parser().parse_args(arguments)
+    COMMANDS[arguments.command](arguments=arguments)
+
+
+if __name__ == '__main__':
+    main()
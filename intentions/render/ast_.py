@@ -1,9 +1,21 @@
 from __future__ import annotations
 
 import ast
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
 
-from intentions.render.dto import Describe
+from intentions.dto import Describe
+from intentions.enums import Intention
+from intentions.render.dto import (
+    TestCaseIntention,
+    TestFunction,
+)
+from intentions.utils import is_test_function
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class AstNodeVisitor(ast.NodeVisitor):
@@ -44,33 +56,178 @@ class AstNodeVisitor(ast.NodeVisitor):
         return self.nodes
 
     def get_describe(self, decorators: [ast.Call]) -> Optional[Describe]:
-        """
-        Get describe context manager description.
+        return get_describe(decorators=decorators)
 
-        Arguments:
-            decorators (list): list of decorators over a function or class that potentially relate to test cases.
 
-        Returns:
-            An object and domain as `Describe`.
-        """
-        for decorator in decorators:
-            if not isinstance(decorator, ast.Call):
-                continue
+def get_describe(decorators: [ast.Call]) -> Optional[Describe]:
+    """
+    Get describe context manager description.
+
+    Arguments:
+        decorators (list): list of decorators over a function or class that potentially relate to test cases.
+
+    Returns:
+        An object and domain as `Describe`.
+    """
+    for decorator in decorators:
+        if not isinstance(decorator, ast.Call):
+            continue
+
+        if not isinstance(decorator.func, ast.Name):
+            continue
+
+        if decorator.func.id != 'describe':
+            continue
+
+        assert decorator.keywords[0].arg == 'domain'  # noqa: S101
+        assert decorator.keywords[1].arg == 'component'  # noqa: S101
+        assert decorator.keywords[2].arg == 'layer'  # noqa: S101
+
+        return Describe(
+            domain=decorator.keywords[0].value.value,
+            component=decorator.keywords[1].value.value,
+            layer=decorator.keywords[2].value.value,
+        )
+
+    return None
+
+
+def get_intention_budgets(call: ast.Call) -> tuple[Optional[float], Optional[int]]:
+    """
+    Get budgets of an intention.
+
+    Only budgets given as numeric literals are known without running a test case, others are ignored.
+
+    Arguments:
+        call (ast.Call): a call of an intention context manager.
+
+    Returns:
+        A time budget in milliseconds and an allocation budget in bytes as `tuple`, `None` for each one not given.
+    """
+    budgets = {'budget_ms': None, 'budget_bytes': None}
+
+    for keyword in call.keywords:
+        if keyword.arg not in budgets:
+            continue
+
+        if not isinstance(keyword.value, ast.Constant):
+            continue
+
+        if isinstance(keyword.value.value, bool) or not isinstance(keyword.value.value, (int, float)):
+            continue
+
+        budgets[keyword.arg] = keyword.value.value
+
+    return budgets['budget_ms'], budgets['budget_bytes']
 
-            if not isinstance(decorator.func, ast.Name):
-                continue
 
-            if decorator.func.id != 'describe':
-                continue
+def iter_test_functions(
+    node: ast.AST,
+    class_node: Optional[ast.ClassDef] = None,
+    class_describe: Optional[Describe] = None,
+) -> Iterator[tuple[ast.FunctionDef, Optional[ast.ClassDef], Optional[Describe]]]:
+    """
+    Iterate over test functions of a module.
+
+    Unlike `AstNodeVisitor`, it descends only into module and class bodies as test functions cannot be declared
+    anywhere else, and keeps neither visited nodes nor their parents. Test functions are yielded in the top to down
+    manner with class's test functions be respected.
 
-            assert decorator.keywords[0].arg == 'domain'  # noqa: S101
-            assert decorator.keywords[1].arg == 'component'  # noqa: S101
-            assert decorator.keywords[2].arg == 'layer'  # noqa: S101
+    Arguments:
+        node (ast.AST): a module or class node to iterate over.
+        class_node (ast.ClassDef): a class the node is declared in.
+        class_describe (Describe): a description of the class the node is declared in.
 
-            return Describe(
-                domain=decorator.keywords[0].value.value,
-                component=decorator.keywords[1].value.value,
-                layer=decorator.keywords[2].value.value,
+    Yields:
+        A test function, a class it is declared in and its description as `tuple`.
+    """
+    for child_node in node.body:
+        if isinstance(child_node, ast.ClassDef):
+            yield from iter_test_functions(
+                node=child_node,
+                class_node=child_node,
+                class_describe=get_describe(decorators=child_node.decorator_list),
             )
+            continue
+
+        if not isinstance(child_node, ast.FunctionDef):
+            continue
+
+        if not is_test_function(name=child_node.name):
+            continue
+
+        if class_node is not None:
+            yield child_node, class_node, class_describe
+            continue
+
+        yield child_node, None, get_describe(decorators=child_node.decorator_list)
+
+
+def get_with_intentions(with_node: ast.With) -> list[TestCaseIntention]:
+    """
+    Get intentions of a with statement.
+
+    Arguments:
+        with_node (ast.With): a with statement in a body of a test function.
+
+    Returns:
+        Intentions the with statement enters as `list`.
+    """
+    intentions = []
 
-        return None
+    for with_node_item in with_node.items:
+        if not isinstance(with_node_item.context_expr.func, ast.Name):
+            continue
+
+        with_node_item_name = with_node_item.context_expr.func.id
+
+        if with_node_item_name not in ('when', 'case', 'expect'):
+            continue
+
+        with_node_item_budget_ms, with_node_item_budget_bytes = get_intention_budgets(
+            call=with_node_item.context_expr,
+        )
+
+        intentions.append(
+            TestCaseIntention(
+                type=Intention(with_node_item_name),
+                code_line=with_node_item.context_expr.args[0].lineno,
+                description=with_node_item.context_expr.args[0].value,
+                budget_ms=with_node_item_budget_ms,
+                budget_bytes=with_node_item_budget_bytes,
+            ),
+        )
+
+    return intentions
+
+
+def iter_described_test_functions(node: ast.Module) -> Iterator[TestFunction]:
+    """
+    Iterate over described test functions of a module with intentions of their bodies.
+
+    Only with statements right in a body of a test function are looked into.
+
+    Arguments:
+        node (ast.Module): a parsed test file.
+
+    Yields:
+        A described test function as `TestFunction`.
+    """
+    for function_node, class_node, describe in iter_test_functions(node=node):
+        if describe is None:
+            continue
+
+        intentions = []
+
+        for body_node in function_node.body:
+            if isinstance(body_node, ast.With):
+                intentions.extend(get_with_intentions(with_node=body_node))
+
+        yield TestFunction(
+            function_name=function_node.name,
+            function_code_line=function_node.lineno,
+            class_name=None if class_node is None else class_node.name,
+            class_code_line=None if class_node is None else class_node.lineno,
+            describe=describe,
+            intentions=intentions,
+        )
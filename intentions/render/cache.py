@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+from intentions.dto import Describe
+from intentions.enums import Intention
+from intentions.render.dto import (
+    DescribedTestCase,
+    FileError,
+    FileTestCases,
+    TestCase,
+    TestCaseIntention,
+)
+from intentions.render.enums import ExtractionEngine
+
+EXTRACTION_RULES_VERSION = 4
+
+BLOB_CACHE_BUCKET_PREFIX_LENGTH = 2
+BLOB_CACHE_BUCKET_SIZE = 256
+
+
+def get_cache_version(*, prefilter: bool = True, engine: ExtractionEngine = ExtractionEngine.AST) -> str:
+    """
+    Get a version of the cache.
+
+    Cached test cases are valid only for the library version, the extraction rules and the extraction options they were
+    extracted with. Increase `EXTRACTION_RULES_VERSION` each time the extraction of test cases changes.
+
+    Arguments:
+        prefilter (bool): whether files that cannot contain described test cases are skipped without parsing.
+        engine (ExtractionEngine): an engine test cases are extracted with, as engines differ on files with syntax
+            errors.
+
+    Returns:
+        A version of the cache as `str`.
+    """
+    try:
+        library_version = metadata.version('intentions')
+
+    except metadata.PackageNotFoundError:
+        library_version = 'unknown'
+
+    extraction_mode = 'prefilter' if prefilter else 'full'
+
+    return f'{library_version}-{EXTRACTION_RULES_VERSION}-{extraction_mode}-{engine.value}'
+
+
+def hash_file_content(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def convert_intention_to_list(intention: TestCaseIntention) -> list:
+    """
+    Convert an intention to a compact list.
+
+    Budgets are appended only if any of them is given, so lists of intentions without budgets stay short.
+
+    Arguments:
+        intention (TestCaseIntention): an intention to convert.
+
+    Returns:
+        An intention as `list`.
+    """
+    data = [intention.type.value, intention.code_line, intention.description]
+
+    if intention.budget_ms is not None or intention.budget_bytes is not None:
+        data.extend((intention.budget_ms, intention.budget_bytes))
+
+    return data
+
+
+def convert_intention_from_list(data: list) -> TestCaseIntention:
+    type_, code_line, description, *budgets = data
+    budget_ms, budget_bytes = budgets or (None, None)
+
+    return TestCaseIntention(
+        type=Intention(type_),
+        code_line=code_line,
+        description=description,
+        budget_ms=budget_ms,
+        budget_bytes=budget_bytes,
+    )
+
+
+def file_test_cases_to_dict(file_test_cases: FileTestCases) -> dict:
+    test_cases = []
+
+    for described_test_case in file_test_cases.test_cases:
+        describe = described_test_case.describe
+        test_case = described_test_case.test_case
+
+        test_cases.append({
+            'describe': [describe.domain, describe.component, describe.layer],
+            'case_description': described_test_case.case_description,
+            'test_case': [
+                test_case.class_name,
+                test_case.class_code_line,
+                test_case.case_name,
+                test_case.function_name,
+                test_case.function_code_line,
+                [convert_intention_to_list(intention=intention) for intention in test_case.intentions],
+            ],
+        })
+
+    error = None
+
+    if file_test_cases.error is not None:
+        error = [file_test_cases.error.code_line, file_test_cases.error.message]
+
+    return {
+        'test_cases': test_cases,
+        'error': error,
+        'skipped': file_test_cases.skipped,
+    }
+
+
+def file_test_cases_from_dict(file_path: str, data: dict) -> FileTestCases:
+    file_test_cases = FileTestCases(file_path=file_path, skipped=data['skipped'])
+
+    for test_case_data in data['test_cases']:
+        domain, component, layer = test_case_data['describe']
+        class_name, class_code_line, case_name, function_name, function_code_line, intentions = (
+            test_case_data['test_case']
+        )
+
+        test_case = TestCase(
+            file_path=file_path,
+            class_name=class_name,
+            class_code_line=class_code_line,
+            case_name=case_name,
+            function_name=function_name,
+            function_code_line=function_code_line,
+            intentions=[convert_intention_from_list(data=intention) for intention in intentions],
+        )
+
+        file_test_cases.test_cases.append(
+            DescribedTestCase(
+                describe=Describe(domain=domain, component=component, layer=layer),
+                case_description=test_case_data['case_description'],
+                test_case=test_case,
+            ),
+        )
+
+    if data['error'] is not None:
+        code_line, message = data['error']
+        file_test_cases.error = FileError(file_path=file_path, code_line=code_line, message=message)
+
+    return file_test_cases
+
+
+class RenderCache:
+    """
+    Persistent cache of test cases extracted from test files.
+    """
+
+    def __init__(self, path: str, *, prefilter: bool = True, engine: ExtractionEngine = ExtractionEngine.AST) -> None:
+        """
+        Construct the object.
+
+        Cache entries are keyed by a file path and hold the file's modification time, size and content hash. The cache
+        is loaded from the path if it exists and was written by the same cache version, otherwise it starts empty.
+
+        Arguments:
+            path (str): a path to the cache file.
+            prefilter (bool): whether test cases are extracted skipping files that cannot contain them.
+            engine (ExtractionEngine): an engine test cases are extracted with.
+        """
+        self.path = Path(path)
+        self.version = get_cache_version(prefilter=prefilter, engine=engine)
+        self.entries = {}
+        self.used_entries = {}
+        self.hits = 0
+        self.misses = 0
+
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path) as file:
+                cache = json.load(file)
+
+        except ValueError:
+            return
+
+        if cache.get('version') != self.version:
+            return
+
+        self.entries = cache['entries']
+
+    def get(self, file: Path) -> Optional[FileTestCases]:
+        """
+        Get cached test cases of a test file.
+
+        A file is considered unchanged if its modification time and size are the same as cached. Otherwise, its content
+        is hashed, so touched but not modified files are still served from the cache.
+
+        Arguments:
+            file (Path): a path to a test file.
+
+        Returns:
+            Cached test cases of the file as `FileTestCases` or `None` if the file changed since it was cached.
+        """
+        file_path = file.as_posix()
+        file_stat = file.stat()
+
+        entry = self.entries.get(file_path)
+
+        if entry is not None and entry['mtime'] == file_stat.st_mtime_ns and entry['size'] == file_stat.st_size:
+            return self._hit(file_path=file_path, entry=entry)
+
+        content_hash = hash_file_content(content=file.read_bytes())
+
+        if entry is not None and entry['hash'] == content_hash:
+            entry['mtime'] = file_stat.st_mtime_ns
+            entry['size'] = file_stat.st_size
+            return self._hit(file_path=file_path, entry=entry)
+
+        self.misses += 1
+        self.used_entries[file_path] = {
+            'mtime': file_stat.st_mtime_ns,
+            'size': file_stat.st_size,
+            'hash': content_hash,
+            'file_test_cases': None,
+        }
+
+        return None
+
+    def set(self, file_test_cases: FileTestCases) -> None:  # noqa: A003
+        """
+        Cache test cases of a test file that were requested from the cache before and missed.
+
+        Arguments:
+            file_test_cases (FileTestCases): extracted test cases of the file.
+        """
+        entry = self.used_entries[file_test_cases.file_path]
+        entry['file_test_cases'] = file_test_cases_to_dict(file_test_cases=file_test_cases)
+
+    def save(self) -> None:
+        """
+        Save the cache.
+
+        Only entries of files requested during the run are saved, so deleted test files are evicted. The cache is
+        written to a temporary file that replaces it, so an interrupted save never leaves a partially written cache.
+        """
+        if not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True)
+
+        entries = {
+            file_path: entry for file_path, entry in self.used_entries.items()
+            if entry['file_test_cases'] is not None
+        }
+        temporary_path = self.path.with_name(f'.{self.path.name}.{os.getpid()}.tmp')
+
+        try:
+            with open(temporary_path, 'w') as file:
+                json.dump({'version': self.version, 'entries': entries}, file)
+
+            temporary_path.replace(self.path)
+
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+    def _hit(self, file_path: str, entry: dict) -> FileTestCases:
+        self.hits += 1
+        self.used_entries[file_path] = entry
+        return file_test_cases_from_dict(file_path=file_path, data=entry['file_test_cases'])
+
+
+class BlobRenderCache:
+    """
+    Persistent cache of test cases extracted from git blobs.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        bucket_size: int = BLOB_CACHE_BUCKET_SIZE,
+        *,
+        prefilter: bool = True,
+        engine: ExtractionEngine = ExtractionEngine.AST,
+    ) -> None:
+        """
+        Construct the object.
+
+        Cache entries are keyed by a blob SHA, so a file with the same content is parsed only once across all revisions
+        and paths it is in. Entries are split into buckets by the first characters of blob SHAs, each bucket is a file
+        in the cache directory that is read only when a blob of it is requested and written only if it changed. A
+        bucket keeps the most recently used entries only, so the cache does not grow without bound as revisions are
+        rendered.
+
+        Arguments:
+            path (str): a path to the cache directory.
+            bucket_size (int): a number of entries each bucket keeps at most.
+            prefilter (bool): whether test cases are extracted skipping blobs that cannot contain them.
+            engine (ExtractionEngine): an engine test cases are extracted with.
+        """
+        self.path = Path(path)
+        self.version = get_cache_version(prefilter=prefilter, engine=engine)
+        self.bucket_size = bucket_size
+        self.buckets: dict[str, dict] = {}
+        self.changed_buckets: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, blob_sha: str, file_path: str) -> Optional[FileTestCases]:
+        """
+        Get cached test cases of a blob.
+
+        Arguments:
+            blob_sha (str): a SHA of the blob.
+            file_path (str): a path of the blob in the revision it is rendered from.
+
+        Returns:
+            Cached test cases of the blob as `FileTestCases` or `None` if the blob is not cached.
+        """
+        bucket_name = blob_sha[:BLOB_CACHE_BUCKET_PREFIX_LENGTH]
+        bucket = self._get_bucket(bucket_name=bucket_name)
+        entry = bucket.pop(blob_sha, None)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        bucket[blob_sha] = entry
+        self.changed_buckets.add(bucket_name)
+
+        return file_test_cases_from_dict(file_path=file_path, data=entry)
+
+    def set(self, blob_sha: str, file_test_cases: FileTestCases) -> None:  # noqa: A003
+        bucket_name = blob_sha[:BLOB_CACHE_BUCKET_PREFIX_LENGTH]
+        bucket = self._get_bucket(bucket_name=bucket_name)
+        bucket[blob_sha] = file_test_cases_to_dict(file_test_cases=file_test_cases)
+        self.changed_buckets.add(bucket_name)
+
+    def save(self) -> None:
+        """
+        Save changed buckets of the cache.
+
+        Least recently used entries of a bucket over its size are evicted. Each bucket is written to a temporary file
+        that replaces the bucket, so an interrupted save never leaves a partially written bucket behind.
+        """
+        if not self.changed_buckets:
+            return
+
+        if not self.path.exists():
+            self.path.mkdir(parents=True)
+
+        for bucket_name in sorted(self.changed_buckets):
+            entries = self.buckets[bucket_name]
+            entries = dict(list(entries.items())[-self.bucket_size:])
+
+            bucket_path = self.path / f'{bucket_name}.json'
+            temporary_bucket_path = bucket_path.with_name(f'.{bucket_path.name}.{os.getpid()}.tmp')
+
+            try:
+                with open(temporary_bucket_path, 'w') as file:
+                    json.dump({'version': self.version, 'entries': entries}, file)
+
+                temporary_bucket_path.replace(bucket_path)
+
+            finally:
+                temporary_bucket_path.unlink(missing_ok=True)
+
+        self.changed_buckets.clear()
+
+    def _get_bucket(self, bucket_name: str) -> dict:
+        if bucket_name not in self.buckets:
+            self.buckets[bucket_name] = self._read_bucket(bucket_name=bucket_name)
+
+        return self.buckets[bucket_name]
+
+    def _read_bucket(self, bucket_name: str) -> dict:
+        try:
+            with open(self.path / f'{bucket_name}.json') as file:
+                bucket = json.load(file)
+
+        except (OSError, ValueError):
+            return {}
+
+        if bucket.get('version') != self.version:
+            return {}
+
+        return bucket['entries']
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.render.main import load_intentions_json
+from intentions.render.shards import IntentionsShards
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    TestCaseIdentity = tuple[str, Optional[str], str]
+    TestCaseGroup = tuple[str, str, str]
+
+DIFF_COUNTERS = (
+    'added_test_cases',
+    'removed_test_cases',
+    'changed_test_cases',
+    'added_intentions',
+    'removed_intentions',
+    'moved_intentions',
+    'reworded_intentions',
+)
+
+
+def get_relative_intentions(test_case: dict) -> list[tuple[str, int, str]]:
+    """
+    Get intentions of a test case with code lines relative to the test function.
+
+    Relative code lines do not change when the whole test function is shifted in its file, for instance, by adding a
+    test function above it, so such a test case is not reported as changed.
+
+    Arguments:
+        test_case (dict): a rendered test case.
+
+    Returns:
+        Types, relative code lines and descriptions of intentions as `list`.
+    """
+    function_code_line = test_case['function_code_line']
+
+    return [
+        (intention['type'], intention['code_line'] - function_code_line, intention['description'])
+        for intention in test_case['intentions']
+    ]
+
+
+def hash_test_case(group: TestCaseGroup, case_description: Optional[str], test_case: dict) -> bytes:
+    """
+    Hash the content of a test case that is compared by the diff.
+
+    Values are only strings, numbers and `None`, so their `repr` is canonical and much cheaper to build than JSON.
+
+    Arguments:
+        group (TestCaseGroup): a domain, component and layer of the test case.
+        case_description (str): a case description the test case is stored by.
+        test_case (dict): a rendered test case.
+
+    Returns:
+        A content hash as `bytes`.
+    """
+    content = [group, case_description, test_case['case_name'], get_relative_intentions(test_case=test_case)]
+
+    content.extend(
+        [intention.get('budget_ms'), intention.get('budget_bytes')]
+        for intention in test_case['intentions']
+        if 'budget_ms' in intention or 'budget_bytes' in intention
+    )
+
+    return hashlib.blake2b(repr(content).encode(), digest_size=16).digest()
+
+
+def index_test_cases(storage: Mapping) -> dict[TestCaseIdentity, tuple[bytes, TestCaseGroup, dict]]:
+    """
+    Index rendered test cases by their stable identity.
+
+    Arguments:
+        storage (Mapping): test cases by domain, component, layer and case description as the intentions JSON has.
+
+    Returns:
+        A content hash, a describe group and a test case by a file path, class name and function name as `dict`.
+    """
+    test_cases_index = {}
+
+    for domain, components in storage.items():
+        for component, layers in components.items():
+            for layer, case_descriptions in layers.items():
+                group = (domain, component, layer)
+
+                for case_description, test_cases in case_descriptions.items():
+                    for test_case in test_cases:
+                        identity = (test_case['file_path'], test_case['class_name'], test_case['function_name'])
+                        test_cases_index[identity] = (
+                            hash_test_case(group=group, case_description=case_description, test_case=test_case),
+                            group,
+                            test_case,
+                        )
+
+    return test_cases_index
+
+
+def diff_intentions(old_test_case: dict, new_test_case: dict) -> dict:
+    """
+    Diff intentions of two versions of a test case.
+
+    Intentions of the same type and description are matched first in their order, they are moved if their code lines
+    relative to the test function differ. Intentions left unmatched are matched by type in their order and are
+    reworded. Intentions left unmatched after that are removed or added.
+
+    Arguments:
+        old_test_case (dict): the old version of the test case.
+        new_test_case (dict): the new version of the test case.
+
+    Returns:
+        Added, removed, moved and reworded intentions as `dict`.
+    """
+    old_intentions = get_relative_intentions(test_case=old_test_case)
+    new_intentions = get_relative_intentions(test_case=new_test_case)
+
+    unmatched_old_intentions = {}
+
+    for old_index, (intention_type, _, description) in enumerate(old_intentions):
+        unmatched_old_intentions.setdefault((intention_type, description), []).append(old_index)
+
+    matched_old_indices = set()
+    unmatched_new_indices = []
+    moved_intentions = []
+
+    for new_index, (intention_type, code_line, description) in enumerate(new_intentions):
+        old_indices = unmatched_old_intentions.get((intention_type, description))
+
+        if not old_indices:
+            unmatched_new_indices.append(new_index)
+            continue
+
+        old_index = old_indices.pop(0)
+        matched_old_indices.add(old_index)
+
+        if old_intentions[old_index][1] != code_line:
+            moved_intentions.append({
+                'type': intention_type,
+                'description': description,
+                'old_code_line': old_test_case['intentions'][old_index]['code_line'],
+                'new_code_line': new_test_case['intentions'][new_index]['code_line'],
+            })
+
+    unmatched_old_indices = [index for index in range(len(old_intentions)) if index not in matched_old_indices]
+    reworded_intentions = []
+    added_intentions = []
+
+    for new_index in unmatched_new_indices:
+        intention_type = new_intentions[new_index][0]
+        old_index = next(
+            (index for index in unmatched_old_indices if old_intentions[index][0] == intention_type),
+            None,
+        )
+
+        if old_index is None:
+            added_intentions.append(new_test_case['intentions'][new_index])
+            continue
+
+        unmatched_old_indices.remove(old_index)
+        reworded_intentions.append({
+            'type': intention_type,
+            'old_description': old_intentions[old_index][2],
+            'new_description': new_intentions[new_index][2],
+            'code_line': new_test_case['intentions'][new_index]['code_line'],
+        })
+
+    return {
+        'added_intentions': added_intentions,
+        'removed_intentions': [old_test_case['intentions'][index] for index in unmatched_old_indices],
+        'moved_intentions': moved_intentions,
+        'reworded_intentions': reworded_intentions,
+    }
+
+
+def load_render(path: str) -> Mapping:
+    """
+    Load a render of intentions to diff.
+
+    Arguments:
+        path (str): a path to an intentions JSON file of any format or to a directory with intentions shards.
+
+    Returns:
+        Test cases by domain, component, layer and case description as `Mapping`.
+    """
+    if Path(path).is_dir():
+        return IntentionsShards(directory=path)
+
+    return load_intentions_json(path=path)
+
+
+def diff_renders(old_storage: Mapping, new_storage: Mapping) -> dict:
+    """
+    Diff two renders of intentions.
+
+    Test cases are matched by their file path, class name and function name. Test cases with the same content hash
+    are skipped without comparing them, so the diff costs a hash per test case plus a comparison per changed one.
+    Changes are grouped by the domain, component and layer of the new version of a test case, removed test cases are
+    grouped by their old ones.
+
+    Arguments:
+        old_storage (Mapping): the old render, for instance, of the base branch.
+        new_storage (Mapping): the new render, for instance, of a pull request.
+
+    Returns:
+        Counters of changes and added, removed and changed test cases by domain, component and layer as `dict`.
+    """
+    old_test_cases = index_test_cases(storage=old_storage)
+    new_test_cases = index_test_cases(storage=new_storage)
+
+    summary = dict.fromkeys(DIFF_COUNTERS, 0)
+    groups = {}
+
+    def get_group_diff(group: TestCaseGroup) -> dict:
+        domain, component, layer = group
+
+        return groups.setdefault(domain, {}).setdefault(component, {}).setdefault(layer, {
+            'added_test_cases': [],
+            'removed_test_cases': [],
+            'changed_test_cases': [],
+        })
+
+    for identity, (new_hash, new_group, new_test_case) in new_test_cases.items():
+        old_test_case_entry = old_test_cases.get(identity)
+
+        if old_test_case_entry is None:
+            get_group_diff(group=new_group)['added_test_cases'].append(new_test_case)
+            summary['added_test_cases'] += 1
+            continue
+
+        old_hash, old_group, old_test_case = old_test_case_entry
+
+        if old_hash == new_hash:
+            continue
+
+        test_case_diff = {
+            'file_path': identity[0],
+            'class_name': identity[1],
+            'function_name': identity[2],
+            'function_code_line': new_test_case['function_code_line'],
+        }
+
+        if old_group != new_group:
+            test_case_diff['old_group'] = list(old_group)
+
+        test_case_diff.update(diff_intentions(old_test_case=old_test_case, new_test_case=new_test_case))
+
+        get_group_diff(group=new_group)['changed_test_cases'].append(test_case_diff)
+        summary['changed_test_cases'] += 1
+
+        for counter in ('added_intentions', 'removed_intentions', 'moved_intentions', 'reworded_intentions'):
+            summary[counter] += len(test_case_diff[counter])
+
+    for identity, (_, old_group, old_test_case) in old_test_cases.items():
+        if identity not in new_test_cases:
+            get_group_diff(group=old_group)['removed_test_cases'].append(old_test_case)
+            summary['removed_test_cases'] += 1
+
+    return {'summary': summary, 'groups': groups}
@@ -1,23 +1,35 @@
-from dataclasses import dataclass
+from __future__ import annotations
 
-from intentions.render.enums import Intention
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
 
+from intentions.dto import (
+    Describe,
+    with_slots,
+)
 
-@dataclass
-class Describe:
-    domain: str
-    component: str
-    layer: str
+if TYPE_CHECKING:
+    from intentions.enums import Intention
 
 
+@with_slots
 @dataclass
 class TestCaseIntention:
 
     type: Intention  # noqa: A003
     code_line: int
     description: str
+    budget_ms: Optional[float] = None
+    budget_bytes: Optional[int] = None
 
 
+@with_slots
 @dataclass
 class TestCase:
 
@@ -28,3 +40,94 @@ class TestCase:
     function_name: str
     function_code_line: int
     intentions: list[TestCaseIntention]
+
+
+@with_slots
+@dataclass
+class TestFunction:
+
+    function_name: str
+    function_code_line: int
+    class_name: Optional[str]
+    class_code_line: Optional[int]
+    describe: Describe
+    intentions: list[TestCaseIntention]
+
+
+@with_slots
+@dataclass
+class DescribedTestCase:
+
+    describe: Describe
+    case_description: Optional[str]
+    test_case: TestCase
+
+
+@dataclass
+class FileError:
+
+    file_path: str
+    code_line: Optional[int]
+    message: str
+
+
+@dataclass
+class FileProfile:
+
+    file_path: str
+    elapsed: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    bytes_read: int = 0
+    nodes: int = 0
+
+
+@dataclass
+class FileTestCases:
+
+    file_path: str
+    test_cases: list[DescribedTestCase] = field(default_factory=list)
+    error: Optional[FileError] = None
+    skipped: bool = False
+    profile: Optional[FileProfile] = None
+
+
+@dataclass
+class RenderProfile:
+
+    elapsed: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    files: int = 0
+    skipped_files: int = 0
+    cached_files: int = 0
+    bytes_read: int = 0
+    nodes: int = 0
+    test_cases: int = 0
+    slowest_files: list[FileProfile] = field(default_factory=list)
+
+
+@dataclass
+class RenderSummary:
+
+    files: int = 0
+    skipped_files: int = 0
+    test_cases: int = 0
+    errors: list[FileError] = field(default_factory=list)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    profile: Optional[RenderProfile] = None
+
+
+@dataclass
+class ShardsSummary:
+
+    written: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+
+@dataclass
+class SearchResult:
+
+    score: float
+    described_test_case: DescribedTestCase
+    intentions: list[TestCaseIntention]
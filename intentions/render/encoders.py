@@ -1,8 +1,34 @@
 from __future__ import annotations
 
+import json
+import sys
 from enum import Enum
 from json import JSONEncoder
-from typing import Union
+from json.encoder import encode_basestring_ascii
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    TextIO,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+    )
+
+    from intentions.render.dto import (
+        DescribedTestCase,
+        TestCase,
+        TestCaseIntention,
+    )
+
+JSON_INDENT = 4
+COMPACT_JSON_SEPARATORS = (',', ':')
+
+TABLES_FORMAT = 'intentions-tables'
+TABLES_FORMAT_VERSION = 1
 
 
 class JsonEncoderWithEnumSupport(JSONEncoder):
@@ -12,3 +38,517 @@ class JsonEncoderWithEnumSupport(JSONEncoder):
             return obj.value
 
         return super().default(obj)
+
+
+def convert_test_case_to_dict(test_case: TestCase) -> dict:
+    """
+    Convert a test case to a dictionary of JSON native types.
+
+    Unlike `dataclasses.asdict`, it does not deep copy values and converts intention types to their values, so the
+    dictionary is encoded without the `JSONEncoder.default` fallback.
+
+    Arguments:
+        test_case (TestCase): a test case to convert.
+
+    Returns:
+        A test case as `dict`.
+    """
+    return {
+        'file_path': test_case.file_path,
+        'class_name': test_case.class_name,
+        'class_code_line': test_case.class_code_line,
+        'case_name': test_case.case_name,
+        'function_name': test_case.function_name,
+        'function_code_line': test_case.function_code_line,
+        'intentions': [convert_intention_to_dict(intention=intention) for intention in test_case.intentions],
+    }
+
+
+def convert_intention_to_dict(intention: TestCaseIntention) -> dict:
+    """
+    Convert an intention to a dictionary of JSON native types.
+
+    Budgets are added only if they are given, so intentions without budgets are encoded as before budgets existed.
+
+    Arguments:
+        intention (TestCaseIntention): an intention to convert.
+
+    Returns:
+        An intention as `dict`.
+    """
+    intention_dict = {
+        'type': intention.type.value,
+        'code_line': intention.code_line,
+        'description': intention.description,
+    }
+
+    if intention.budget_ms is not None:
+        intention_dict['budget_ms'] = intention.budget_ms
+
+    if intention.budget_bytes is not None:
+        intention_dict['budget_bytes'] = intention.budget_bytes
+
+    return intention_dict
+
+
+def encode_string(value: Optional[str]) -> str:
+    return 'null' if value is None else encode_basestring_ascii(value)
+
+
+def encode_key(key: Optional[str]) -> str:
+    return encode_basestring_ascii('null' if key is None else key)
+
+
+def encode_number(value: Optional[Union[int, float]]) -> str:
+    return 'null' if value is None else json.dumps(value)
+
+
+def encode_members(members: list[str], opening: str, closing: str, level: int, *, compact: bool) -> str:
+    """
+    Enclose encoded members of a JSON object or array the way `json.dumps` does.
+
+    Arguments:
+        members (list): encoded members, key and value pairs of an object or values of an array.
+        opening (str): an opening bracket.
+        closing (str): a closing bracket.
+        level (int): a nesting level of the object or array.
+        compact (bool): whether to encode without indentation and whitespaces.
+
+    Returns:
+        An encoded object or array as `str`.
+    """
+    if not members:
+        return f'{opening}{closing}'
+
+    if compact:
+        return f'{opening}{",".join(members)}{closing}'
+
+    member_indent = '\n' + ' ' * (JSON_INDENT * (level + 1))
+    closing_indent = '\n' + ' ' * (JSON_INDENT * level)
+
+    return f'{opening}{member_indent}{("," + member_indent).join(members)}{closing_indent}{closing}'
+
+
+def encode_intention(intention: TestCaseIntention, level: int = 0, *, compact: bool = False) -> str:
+    key_separator = ':' if compact else ': '
+
+    members = [
+        f'"type"{key_separator}"{intention.type.value}"',
+        f'"code_line"{key_separator}{intention.code_line}',
+        f'"description"{key_separator}{encode_basestring_ascii(intention.description)}',
+    ]
+
+    if intention.budget_ms is not None:
+        members.append(f'"budget_ms"{key_separator}{encode_number(intention.budget_ms)}')
+
+    if intention.budget_bytes is not None:
+        members.append(f'"budget_bytes"{key_separator}{encode_number(intention.budget_bytes)}')
+
+    return encode_members(members=members, opening='{', closing='}', level=level, compact=compact)
+
+
+def get_test_case_members(test_case: TestCase, level: int, *, compact: bool) -> list[str]:
+    key_separator = ':' if compact else ': '
+
+    intentions = [
+        encode_intention(intention=intention, level=level + 2, compact=compact) for intention in test_case.intentions
+    ]
+
+    return [
+        f'"file_path"{key_separator}{encode_basestring_ascii(test_case.file_path)}',
+        f'"class_name"{key_separator}{encode_string(test_case.class_name)}',
+        f'"class_code_line"{key_separator}{encode_number(test_case.class_code_line)}',
+        f'"case_name"{key_separator}{encode_basestring_ascii(test_case.case_name)}',
+        f'"function_name"{key_separator}{encode_basestring_ascii(test_case.function_name)}',
+        f'"function_code_line"{key_separator}{test_case.function_code_line}',
+        f'"intentions"{key_separator}'
+        f'{encode_members(members=intentions, opening="[", closing="]", level=level + 1, compact=compact)}',
+    ]
+
+
+def encode_test_case(test_case: TestCase, level: int = 0, *, compact: bool = False) -> str:
+    """
+    Encode a test case into JSON straight from its object.
+
+    The output is the same `json.dumps` gives for `convert_test_case_to_dict`, but no intermediate dictionaries are
+    built and strings are encoded with the C accelerated encoder right away, which is several times faster.
+
+    Arguments:
+        test_case (TestCase): a test case to encode.
+        level (int): a nesting level of the test case to indent it with.
+        compact (bool): whether to encode without indentation and whitespaces.
+
+    Returns:
+        An encoded test case as `str`.
+    """
+    members = get_test_case_members(test_case=test_case, level=level, compact=compact)
+    return encode_members(members=members, opening='{', closing='}', level=level, compact=compact)
+
+
+def encode_layers(layers: dict, level: int = 0, *, compact: bool = False) -> str:
+    key_separator = ':' if compact else ': '
+    layer_members = []
+
+    for layer, case_descriptions in layers.items():
+        case_description_members = []
+
+        for case_description, test_cases in case_descriptions.items():
+            encoded_test_cases = [
+                encode_test_case(test_case=test_case, level=level + 3, compact=compact) for test_case in test_cases
+            ]
+            encoded_case_description = encode_members(
+                members=encoded_test_cases,
+                opening='[',
+                closing=']',
+                level=level + 2,
+                compact=compact,
+            )
+            case_description_members.append(f'{encode_key(case_description)}{key_separator}{encoded_case_description}')
+
+        encoded_layer = encode_members(
+            members=case_description_members,
+            opening='{',
+            closing='}',
+            level=level + 1,
+            compact=compact,
+        )
+        layer_members.append(f'{encode_key(layer)}{key_separator}{encoded_layer}')
+
+    return encode_members(members=layer_members, opening='{', closing='}', level=level, compact=compact)
+
+
+def encode_components(components: dict, level: int = 0, *, compact: bool = False) -> str:
+    """
+    Encode components of a domain into the intentions JSON straight from test case objects.
+
+    Arguments:
+        components (dict): test cases by component, layer and case description.
+        level (int): a nesting level of the components to indent them with.
+        compact (bool): whether to encode without indentation and whitespaces.
+
+    Returns:
+        Encoded components as `str`.
+    """
+    key_separator = ':' if compact else ': '
+
+    members = [
+        f'{encode_key(component)}{key_separator}{encode_layers(layers=layers, level=level + 1, compact=compact)}'
+        for component, layers in components.items()
+    ]
+
+    return encode_members(members=members, opening='{', closing='}', level=level, compact=compact)
+
+
+def iter_intentions_json(storage: dict, *, compact: bool = False) -> Iterator[str]:
+    """
+    Encode test cases storage into intentions JSON chunks, one domain per chunk.
+
+    The storage is emptied while it is encoded, so only one encoded domain is held in memory at a time. Test cases are
+    encoded straight from their objects. Indented output is the same as `json.dump` with the indent of 4 spaces gives.
+
+    Arguments:
+        storage (dict): test cases stored by domain, component, layer and case description.
+        compact (bool): whether to encode without indentation and whitespaces.
+
+    Yields:
+        Chunks of the intentions JSON as `str`.
+    """
+    if not storage:
+        yield '{}'
+        return
+
+    if compact:
+        item_separator, key_separator, indent = COMPACT_JSON_SEPARATORS[0], COMPACT_JSON_SEPARATORS[1], ''
+    else:
+        item_separator, key_separator, indent = ',', ': ', '\n' + ' ' * JSON_INDENT
+
+    yield '{'
+
+    is_first_domain = True
+
+    while storage:
+        domain = next(iter(storage))
+        encoded_components = encode_components(components=storage.pop(domain), level=1, compact=compact)
+
+        separator = '' if is_first_domain else item_separator
+        is_first_domain = False
+
+        yield f'{separator}{indent}{encode_key(domain)}{key_separator}{encoded_components}'
+
+    yield '\n}' if not compact else '}'
+
+
+def encode_described_test_case_line(described_test_case: DescribedTestCase) -> str:
+    """
+    Encode a described test case into a line of the intentions JSON Lines.
+
+    A line is a compact test case object with its domain, component, layer and case description first.
+
+    Arguments:
+        described_test_case (DescribedTestCase): a described test case to encode.
+
+    Returns:
+        An encoded line without the line break as `str`.
+    """
+    describe = described_test_case.describe
+    members = [
+        f'"domain":{encode_basestring_ascii(describe.domain)}',
+        f'"component":{encode_basestring_ascii(describe.component)}',
+        f'"layer":{encode_basestring_ascii(describe.layer)}',
+        f'"case_description":{encode_string(described_test_case.case_description)}',
+        *get_test_case_members(test_case=described_test_case.test_case, level=0, compact=True),
+    ]
+
+    return f'{{{",".join(members)}}}'
+
+
+def write_intentions_lines(described_test_cases: Iterable[DescribedTestCase], file: TextIO) -> int:
+    """
+    Write described test cases into the intentions JSON Lines as they come, one test case per line.
+
+    Unlike the intentions JSON, test cases are not grouped by domain, component and layer first, so they are written
+    with bounded memory however many of them there are. Use `load_intentions_json` to read them back grouped.
+
+    Arguments:
+        described_test_cases (Iterable): described test cases, for instance, `iter_test_cases` gives.
+        file (TextIO): a file to write to.
+
+    Returns:
+        A number of written test cases as `int`.
+    """
+    test_cases = 0
+
+    for described_test_case in described_test_cases:
+        file.write(encode_described_test_case_line(described_test_case=described_test_case))
+        file.write('\n')
+        test_cases += 1
+
+    return test_cases
+
+
+def is_intentions_line(data: object) -> bool:
+    return isinstance(data, dict) and 'domain' in data and isinstance(data.get('intentions'), list)
+
+
+def group_intentions_lines(lines: Iterable[dict]) -> dict:
+    """
+    Group decoded lines of the intentions JSON Lines into the intentions JSON structure.
+
+    Test cases without a case description are grouped under the `null` key, as JSON object keys are always strings.
+
+    Arguments:
+        lines (Iterable): decoded test cases with their domains, components, layers and case descriptions.
+
+    Returns:
+        Test cases by domain, component, layer and case description as `dict`.
+    """
+    storage = {}
+
+    for line in lines:
+        case_description = line.pop('case_description')
+        (
+            storage
+            .setdefault(line.pop('domain'), {})
+            .setdefault(line.pop('component'), {})
+            .setdefault(line.pop('layer'), {})
+            .setdefault('null' if case_description is None else case_description, [])
+            .append(line)
+        )
+
+    return storage
+
+
+class StringTable:
+    """
+    Table of unique strings referred to by their indices.
+    """
+
+    def __init__(self) -> None:
+        """
+        Construct the object.
+        """
+        self.strings: list[str] = []
+        self.indices: dict[str, int] = {}
+
+    def get_index(self, string: Optional[str]) -> Optional[int]:
+        if string is None:
+            return None
+
+        index = self.indices.get(string)
+
+        if index is None:
+            index = len(self.strings)
+            self.indices[string] = index
+            self.strings.append(string)
+
+        return index
+
+
+def convert_test_case_to_row(  # noqa: PLR0913
+    string_table: StringTable,
+    domain: str,
+    component: str,
+    layer: str,
+    case_description: Optional[str],
+    test_case: TestCase,
+) -> list:
+    intentions = []
+
+    for intention in test_case.intentions:
+        intention_row = [
+            string_table.get_index(intention.type.value),
+            intention.code_line,
+            string_table.get_index(intention.description),
+        ]
+
+        if intention.budget_ms is not None or intention.budget_bytes is not None:
+            intention_row.extend((intention.budget_ms, intention.budget_bytes))
+
+        intentions.append(intention_row)
+
+    return [
+        string_table.get_index(domain),
+        string_table.get_index(component),
+        string_table.get_index(layer),
+        string_table.get_index(case_description),
+        string_table.get_index(test_case.file_path),
+        string_table.get_index(test_case.class_name),
+        test_case.class_code_line,
+        string_table.get_index(test_case.case_name),
+        string_table.get_index(test_case.function_name),
+        test_case.function_code_line,
+        intentions,
+    ]
+
+
+def iter_intentions_tables_json(storage: dict) -> Iterator[str]:
+    """
+    Encode test cases storage into chunks of the intentions JSON with string tables, one test case per chunk.
+
+    Each string, for instance, a file path or a description shared by many intentions, is stored once in the string
+    table and test cases refer to it by its index. Test cases are flat rows in the order of the storage, so the storage
+    is restored by `expand_intentions_tables` exactly. The string table is encoded last, after all test cases refer to
+    their strings.
+
+    Arguments:
+        storage (dict): test cases stored by domain, component, layer and case description, emptied while encoded.
+
+    Yields:
+        Chunks of the intentions JSON as `str`.
+    """
+    string_table = StringTable()
+
+    yield f'{{"format":"{TABLES_FORMAT}","version":{TABLES_FORMAT_VERSION},"test_cases":['
+
+    is_first_test_case = True
+
+    while storage:
+        domain = next(iter(storage))
+
+        for component, layers in storage.pop(domain).items():
+            for layer, case_descriptions in layers.items():
+                for case_description, test_cases in case_descriptions.items():
+                    for test_case in test_cases:
+                        row = convert_test_case_to_row(
+                            string_table=string_table,
+                            domain=domain,
+                            component=component,
+                            layer=layer,
+                            case_description=case_description,
+                            test_case=test_case,
+                        )
+
+                        separator = '' if is_first_test_case else ','
+                        is_first_test_case = False
+
+                        yield f'{separator}\n{json.dumps(row, separators=COMPACT_JSON_SEPARATORS)}'
+
+    yield f'\n],"strings":{json.dumps(string_table.strings, separators=COMPACT_JSON_SEPARATORS)}}}'
+
+
+def is_intentions_tables(data: object) -> bool:
+    return isinstance(data, dict) and data.get('format') == TABLES_FORMAT
+
+
+def expand_intentions_tables(data: dict) -> dict:
+    """
+    Expand the intentions JSON with string tables to the intentions JSON structure.
+
+    Strings of the string table are interned, so each of them is held in memory once, however many test cases and
+    intentions refer to it. Test cases without a case description are grouped under the `null` key, as in the
+    intentions JSON file.
+
+    Arguments:
+        data (dict): decoded intentions JSON with string tables.
+
+    Returns:
+        Test cases by domain, component, layer and case description as `dict`.
+
+    Raises:
+        ValueError: if the version of the format is not supported.
+    """
+    if data.get('version') != TABLES_FORMAT_VERSION:
+        message = f'Intentions tables format version {data.get("version")} is not supported.'
+        raise ValueError(message)
+
+    strings = [sys.intern(string) for string in data['strings']]
+    storage = {}
+
+    for (
+        domain, component, layer, case_description, file_path, class_name, class_code_line, case_name, function_name,
+        function_code_line, intentions,
+    ) in data['test_cases']:
+        test_cases = (
+            storage
+            .setdefault(strings[domain], {})
+            .setdefault(strings[component], {})
+            .setdefault(strings[layer], {})
+            .setdefault('null' if case_description is None else strings[case_description], [])
+        )
+
+        expanded_intentions = []
+
+        for type_, code_line, description, *budgets in intentions:
+            intention = {'type': strings[type_], 'code_line': code_line, 'description': strings[description]}
+
+            if budgets:
+                budget_ms, budget_bytes = budgets
+
+                if budget_ms is not None:
+                    intention['budget_ms'] = budget_ms
+
+                if budget_bytes is not None:
+                    intention['budget_bytes'] = budget_bytes
+
+            expanded_intentions.append(intention)
+
+        test_cases.append({
+            'file_path': strings[file_path],
+            'class_name': None if class_name is None else strings[class_name],
+            'class_code_line': class_code_line,
+            'case_name': strings[case_name],
+            'function_name': strings[function_name],
+            'function_code_line': function_code_line,
+            'intentions': expanded_intentions,
+        })
+
+    return storage
+
+
+def write_intentions_json(storage: dict, file: TextIO, *, compact: bool = False, tables: bool = False) -> None:
+    """
+    Write test cases storage into the intentions JSON file domain by domain.
+
+    Arguments:
+        storage (dict): test cases stored by domain, component, layer and case description, emptied while written.
+        file (TextIO): a file to write to.
+        compact (bool): whether to write without indentation and whitespaces.
+        tables (bool): whether to write strings once in a string table that test cases refer to by indices.
+    """
+    if tables:
+        chunks = iter_intentions_tables_json(storage=storage)
+    else:
+        chunks = iter_intentions_json(storage=storage, compact=compact)
+
+    for chunk in chunks:
+        file.write(chunk)
@@ -1,8 +1,9 @@
 from enum import Enum
 
+from intentions.enums import Intention  # noqa: F401
 
-class Intention(Enum):
 
-    WHEN = 'when'
-    CASE = 'case'
-    EXPECT = 'expect'
+class ExtractionEngine(Enum):
+
+    AST = 'ast'
+    SCANNER = 'scanner'
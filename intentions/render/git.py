@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.render.cache import BlobRenderCache
+from intentions.render.dto import (
+    FileTestCases,
+    RenderSummary,
+)
+from intentions.render.enums import ExtractionEngine
+from intentions.render.main import (
+    INTENTIONS_FOLDER_PATH,
+    INTENTIONS_JSON_PATH,
+    extract_test_cases,
+    save_intentions_json,
+    store_test_cases,
+    summarize_file_test_cases,
+)
+from intentions.render.walker import (
+    WalkFilter,
+    is_test_file_path,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+INTENTIONS_GIT_CACHE_PATH = f'{INTENTIONS_FOLDER_PATH}/git-cache'
+
+GIT_BLOB_MODES = ('100644', '100755')
+GIT_BATCH_HEADER_FIELDS = 3
+
+
+def iter_git_test_files(
+    revision: str,
+    repository: str = '.',
+    directory: str = '',
+    walk_filter: Optional[WalkFilter] = None,
+) -> Iterator[tuple[str, str]]:
+    """
+    Iterate over test files of a git revision without checking it out.
+
+    Symbolic links and submodules are skipped. Test file patterns, include and exclude globs are matched against paths
+    relative to the directory. If the revision or the repository does not exist, `subprocess.CalledProcessError` of
+    `git ls-tree` is raised.
+
+    Arguments:
+        revision (str): a revision to list test files of, for instance, a branch name or a commit SHA.
+        repository (str): a path to the git repository.
+        directory (str): a path to a directory with test files relative to the root of the repository.
+        walk_filter (WalkFilter): which test files of the directory to render.
+
+    Yields:
+        Paths to test files relative to the root of the repository and SHAs of their blobs as `tuple`.
+    """
+    directory = directory.strip('/')
+    command = ['git', '-C', repository, 'ls-tree', '-r', '-z', '--full-tree', revision]
+
+    if directory:
+        command.extend(('--', directory))
+
+    process = subprocess.run(command, check=True, capture_output=True)  # noqa: S603
+
+    for entry in process.stdout.split(b'\0'):
+        if not entry:
+            continue
+
+        information, path = entry.split(b'\t', 1)
+        mode, object_type, blob_sha = information.decode().split(' ')
+        path = os.fsdecode(path)
+
+        if object_type != 'blob' or mode not in GIT_BLOB_MODES:
+            continue
+
+        relative_path = path[len(directory) + 1:] if directory else path
+
+        if is_test_file_path(relative_path=relative_path, walk_filter=walk_filter):
+            yield path, blob_sha
+
+
+class GitBlobReader:
+    """
+    Reader of git blobs over a single long-lived `git cat-file --batch` process.
+    """
+
+    def __init__(self, repository: str = '.') -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            repository (str): a path to the git repository.
+        """
+        self.process = subprocess.Popen(
+            ['git', '-C', repository, 'cat-file', '--batch'],  # noqa: S603, S607
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def __enter__(self) -> GitBlobReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def read(self, blob_sha: str) -> bytes:
+        """
+        Read content of a blob.
+
+        Arguments:
+            blob_sha (str): a SHA of the blob.
+
+        Returns:
+            Content of the blob as `bytes`.
+
+        Raises:
+            ValueError: if there is no such blob in the repository.
+        """
+        self.process.stdin.write(f'{blob_sha}\n'.encode())
+        self.process.stdin.flush()
+
+        header = self.process.stdout.readline().decode().split()
+
+        if len(header) != GIT_BATCH_HEADER_FIELDS:
+            message = f'There is no git blob {blob_sha}.'
+            raise ValueError(message)
+
+        content = self.process.stdout.read(int(header[2]))
+        self.process.stdout.read(1)
+
+        return content
+
+    def close(self) -> None:
+        self.process.stdin.close()
+        self.process.wait()
+        self.process.stdout.close()
+
+
+def render_git_test_cases(  # noqa: PLR0913
+    revision: str,
+    summary: RenderSummary,
+    repository: str = '.',
+    directory: str = '',
+    *,
+    cache: bool = False,
+    prefilter: bool = True,
+    walk_filter: Optional[WalkFilter] = None,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+) -> Iterator[FileTestCases]:
+    """
+    Render described test cases of a git revision file by file without checking it out.
+
+    Contents of test files are streamed from the repository over a single `git cat-file` process. Skipped files and
+    files that cannot be parsed are not yielded, they are accounted in the summary instead.
+
+    Arguments:
+        revision (str): a revision to render, for instance, a branch name or a commit SHA.
+        summary (RenderSummary): a summary to account rendered files and test cases in.
+        repository (str): a path to the git repository.
+        directory (str): a path to a directory with test files relative to the root of the repository.
+        cache (bool): whether to parse only blobs that were not parsed before in any revision.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+        walk_filter (WalkFilter): which test files of the directory to render.
+        engine (ExtractionEngine): an engine to extract test cases with.
+
+    Yields:
+        Described test cases of each rendered file as `FileTestCases`.
+    """
+    blob_cache = None
+
+    if cache:
+        blob_cache = BlobRenderCache(path=INTENTIONS_GIT_CACHE_PATH, prefilter=prefilter, engine=engine)
+
+    test_files = iter_git_test_files(
+        revision=revision,
+        repository=repository,
+        directory=directory,
+        walk_filter=walk_filter,
+    )
+
+    with GitBlobReader(repository=repository) as blob_reader:
+        for file_path, blob_sha in test_files:
+            file_test_cases = None if blob_cache is None else blob_cache.get(blob_sha=blob_sha, file_path=file_path)
+
+            if file_test_cases is None:
+                file_test_cases = extract_test_cases(
+                    file_path=file_path,
+                    prefilter=prefilter,
+                    content=blob_reader.read(blob_sha=blob_sha),
+                    engine=engine,
+                )
+
+                if blob_cache is not None:
+                    blob_cache.set(blob_sha=blob_sha, file_test_cases=file_test_cases)
+
+            if summarize_file_test_cases(summary=summary, file_test_cases=file_test_cases):
+                yield file_test_cases
+
+    if blob_cache is not None:
+        blob_cache.save()
+        summary.cache_hits = blob_cache.hits
+        summary.cache_misses = blob_cache.misses
+
+
+def create_intentions_json_from_git(  # noqa: PLR0913
+    revision: str,
+    repository: str = '.',
+    directory: str = '',
+    path: str = INTENTIONS_JSON_PATH,
+    *,
+    cache: bool = False,
+    compact: bool = False,
+    prefilter: bool = True,
+    walk_filter: Optional[WalkFilter] = None,
+    tables: bool = False,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+) -> RenderSummary:
+    """
+    Render test cases of a git revision into the intentions JSON file without checking it out.
+
+    Paths of test cases are relative to the root of the repository.
+
+    Arguments:
+        revision (str): a revision to render, for instance, a branch name or a commit SHA.
+        repository (str): a path to the git repository.
+        directory (str): a path to a directory with test files relative to the root of the repository.
+        path (str): a path to the intentions JSON file, so renders of different revisions could be kept side by side.
+        cache (bool): whether to parse only blobs that were not parsed before in any revision, the cache is stored in
+            the intentions folder.
+        compact (bool): whether to write the intentions JSON file without indentation.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+        walk_filter (WalkFilter): which test files of the directory to render.
+        tables (bool): whether to write each string once in a string table.
+        engine (ExtractionEngine): an engine to extract test cases with, `ast` by default.
+
+    Returns:
+        A number of rendered, skipped files and test cases, errors of files that cannot be parsed and cache usage as
+        `RenderSummary`.
+    """
+    storage = {}
+    summary = RenderSummary()
+
+    rendered_file_test_cases = render_git_test_cases(
+        revision=revision,
+        summary=summary,
+        repository=repository,
+        directory=directory,
+        cache=cache,
+        prefilter=prefilter,
+        walk_filter=walk_filter,
+        engine=engine,
+    )
+
+    for file_test_cases in rendered_file_test_cases:
+        store_test_cases(storage=storage, file_test_cases=file_test_cases)
+
+    save_intentions_json(storage=storage, path=path, compact=compact, tables=tables)
+
+    return summary
@@ -0,0 +1,483 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from itertools import groupby
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from intentions.dto import Describe
+from intentions.enums import Intention
+from intentions.render.dto import (
+    DescribedTestCase,
+    SearchResult,
+    TestCase,
+    TestCaseIntention,
+)
+from intentions.render.search import (
+    SearchIndexBuilder,
+    search_test_case_ids,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+    )
+    from types import TracebackType
+
+    from intentions.render.dto import FileTestCases
+
+INTENTIONS_INDEX_PATH = './.intentions/intentions.sqlite3'
+
+INDEX_SCHEMA = """
+CREATE TABLE describes (
+    id INTEGER PRIMARY KEY,
+    domain TEXT NOT NULL,
+    component TEXT NOT NULL,
+    layer TEXT NOT NULL
+);
+
+CREATE TABLE test_cases (
+    id INTEGER PRIMARY KEY,
+    describe_id INTEGER NOT NULL REFERENCES describes (id),
+    case_description TEXT,
+    file_path TEXT NOT NULL,
+    class_name TEXT,
+    class_code_line INTEGER,
+    case_name TEXT NOT NULL,
+    function_name TEXT NOT NULL,
+    function_code_line INTEGER NOT NULL
+);
+
+CREATE TABLE intentions (
+    id INTEGER PRIMARY KEY,
+    test_case_id INTEGER NOT NULL REFERENCES test_cases (id),
+    type TEXT NOT NULL,
+    code_line INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    budget_ms REAL,
+    budget_bytes INTEGER
+);
+"""
+
+INDEX_INDEXES = """
+CREATE UNIQUE INDEX describes_domain_component_layer ON describes (domain, component, layer);
+CREATE INDEX describes_component ON describes (component);
+CREATE INDEX describes_layer ON describes (layer);
+CREATE INDEX test_cases_describe_id ON test_cases (describe_id);
+CREATE INDEX test_cases_file_path ON test_cases (file_path);
+CREATE INDEX test_cases_function_name ON test_cases (function_name);
+CREATE INDEX intentions_test_case_id ON intentions (test_case_id);
+"""
+
+
+def write_intentions_index(
+    file_test_cases: Iterable[FileTestCases],
+    path: str = INTENTIONS_INDEX_PATH,
+    *,
+    search: bool = False,
+) -> None:
+    """
+    Write described test cases into the intentions SQLite index.
+
+    The index is built from scratch in a single transaction into a temporary file with indexes created after all rows
+    are inserted, then the temporary file replaces the index, so readers never see a partially written index.
+
+    Arguments:
+        file_test_cases (Iterable): described test cases of test files.
+        path (str): a path to the index.
+        search (bool): whether to build an inverted index of intention descriptions to search test cases by.
+    """
+    index_path = Path(path)
+    temporary_index_path = index_path.with_name(f'.{index_path.name}.{os.getpid()}.tmp')
+
+    if not index_path.parent.exists():
+        index_path.parent.mkdir(parents=True)
+
+    temporary_index_path.unlink(missing_ok=True)
+
+    try:
+        connection = sqlite3.connect(temporary_index_path)
+
+        try:
+            connection.execute('PRAGMA journal_mode = OFF')
+            connection.execute('PRAGMA synchronous = OFF')
+            connection.executescript(INDEX_SCHEMA)
+            insert_test_cases(connection=connection, file_test_cases=file_test_cases, search=search)
+
+        finally:
+            connection.close()
+
+        temporary_index_path.replace(index_path)
+
+    finally:
+        temporary_index_path.unlink(missing_ok=True)
+
+
+def insert_test_cases(
+    connection: sqlite3.Connection,
+    file_test_cases: Iterable[FileTestCases],
+    *,
+    search: bool,
+) -> None:
+    """
+    Insert described test cases into an empty intentions SQLite index in a single transaction.
+
+    Arguments:
+        connection (sqlite3.Connection): a connection to the index.
+        file_test_cases (Iterable): described test cases of test files.
+        search (bool): whether to build an inverted index of intention descriptions to search test cases by.
+    """
+    search_index_builder = SearchIndexBuilder(connection=connection) if search else None
+
+    describe_ids = {}
+    test_case_id = 0
+    intention_id = 0
+
+    with connection:
+        for rendered_file_test_cases in file_test_cases:
+            test_case_rows = []
+            intention_rows = []
+            posting_rows = []
+
+            for described_test_case in rendered_file_test_cases.test_cases:
+                describe = described_test_case.describe
+                describe_key = (describe.domain, describe.component, describe.layer)
+
+                if describe_key not in describe_ids:
+                    describe_ids[describe_key] = len(describe_ids) + 1
+                    connection.execute(
+                        'INSERT INTO describes (id, domain, component, layer) VALUES (?, ?, ?, ?)',
+                        (describe_ids[describe_key], *describe_key),
+                    )
+
+                test_case_id += 1
+                test_case = described_test_case.test_case
+
+                test_case_rows.append((
+                    test_case_id,
+                    describe_ids[describe_key],
+                    described_test_case.case_description,
+                    test_case.file_path,
+                    test_case.class_name,
+                    test_case.class_code_line,
+                    test_case.case_name,
+                    test_case.function_name,
+                    test_case.function_code_line,
+                ))
+
+                for intention in test_case.intentions:
+                    intention_id += 1
+                    intention_rows.append((
+                        intention_id,
+                        test_case_id,
+                        intention.type.value,
+                        intention.code_line,
+                        intention.description,
+                        intention.budget_ms,
+                        intention.budget_bytes,
+                    ))
+
+                    if search_index_builder is not None:
+                        posting_rows.extend(
+                            search_index_builder.add(intention_id=intention_id, description=intention.description),
+                        )
+
+            connection.executemany('INSERT INTO test_cases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', test_case_rows)
+            connection.executemany('INSERT INTO intentions VALUES (?, ?, ?, ?, ?, ?, ?)', intention_rows)
+
+            if search_index_builder is not None:
+                connection.executemany('INSERT INTO postings VALUES (?, ?, ?)', posting_rows)
+
+        if search_index_builder is not None:
+            search_index_builder.finish()
+
+        connection.executescript(INDEX_INDEXES)
+
+
+class IntentionsIndex:
+    """
+    Intentions SQLite index query implementation.
+    """
+
+    def __init__(self, path: str = INTENTIONS_INDEX_PATH) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            path (str): a path to the index.
+
+        Raises:
+            FileNotFoundError: if the index does not exist.
+        """
+        if not Path(path).exists():
+            message = f'Intentions index does not exist: {path}'
+            raise FileNotFoundError(message)
+
+        self.connection = sqlite3.connect(f'{Path(path).resolve().as_uri()}?mode=ro', uri=True)
+
+    def __enter__(self) -> IntentionsIndex:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def get_describes(
+        self,
+        domain: Optional[str] = None,
+        component: Optional[str] = None,
+        layer: Optional[str] = None,
+    ) -> list[Describe]:
+        """
+        Get descriptions of test cases.
+
+        Arguments:
+            domain (str): a domain to filter descriptions by.
+            component (str): a component to filter descriptions by.
+            layer (str): a layer to filter descriptions by.
+
+        Returns:
+            Descriptions in the order they are rendered as `list`.
+        """
+        conditions, parameters = self._get_conditions(domain=domain, component=component, layer=layer)
+
+        rows = self.connection.execute(
+            'SELECT domain, component, layer FROM describes '  # noqa: S608
+            f'{self._get_where_clause(conditions)} '
+            'ORDER BY id',
+            parameters,
+        )
+
+        return [Describe(domain=domain, component=component, layer=layer) for domain, component, layer in rows]
+
+    def get_file_paths(
+        self,
+        domain: Optional[str] = None,
+        component: Optional[str] = None,
+        layer: Optional[str] = None,
+    ) -> set[str]:
+        """
+        Get paths to test files with test cases.
+
+        Arguments:
+            domain (str): a domain of test cases to filter test files by.
+            component (str): a component of test cases to filter test files by.
+            layer (str): a layer of test cases to filter test files by.
+
+        Returns:
+            Paths to test files as they are rendered as `set`.
+        """
+        conditions, parameters = self._get_conditions(domain=domain, component=component, layer=layer)
+
+        rows = self.connection.execute(
+            'SELECT DISTINCT test_cases.file_path FROM test_cases '  # noqa: S608
+            'JOIN describes ON describes.id = test_cases.describe_id '
+            f'{self._get_where_clause(conditions)}',
+            parameters,
+        )
+
+        return {file_path for file_path, in rows}
+
+    def get_test_cases(  # noqa: PLR0913
+        self,
+        domain: Optional[str] = None,
+        component: Optional[str] = None,
+        layer: Optional[str] = None,
+        file_path: Optional[str] = None,
+        function_name: Optional[str] = None,
+    ) -> Iterator[DescribedTestCase]:
+        """
+        Get described test cases.
+
+        Test cases are fetched lazily, so only the test case being yielded is held in memory.
+
+        Arguments:
+            domain (str): a domain to filter test cases by.
+            component (str): a component to filter test cases by.
+            layer (str): a layer to filter test cases by.
+            file_path (str): a path to a test file to filter test cases by.
+            function_name (str): a name of a test function to filter test cases by.
+
+        Yields:
+            Described test cases in the order they are rendered as `DescribedTestCase`.
+        """
+        conditions, parameters = self._get_conditions(
+            domain=domain,
+            component=component,
+            layer=layer,
+            file_path=file_path,
+            function_name=function_name,
+        )
+
+        yield from self._iter_test_cases(conditions=conditions, parameters=parameters)
+
+    def search(  # noqa: PLR0913
+        self,
+        query: str,
+        intention_type: Optional[Intention] = None,
+        domain: Optional[str] = None,
+        component: Optional[str] = None,
+        layer: Optional[str] = None,
+        limit: int = 10,
+    ) -> list[SearchResult]:
+        """
+        Search test cases by descriptions of their intentions.
+
+        Arguments:
+            query (str): a text to search, test cases matching more of its words are ranked higher.
+            intention_type (Intention): a type of intentions to search in, all intentions are searched by default.
+            domain (str): a domain to filter test cases by.
+            component (str): a component to filter test cases by.
+            layer (str): a layer to filter test cases by.
+            limit (int): a maximum number of test cases to return.
+
+        Raises:
+            ValueError: if the index is built without search.
+
+        Returns:
+            Found test cases from the most relevant to the least one as `list`.
+        """
+        is_searchable = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postings'",
+        ).fetchone()
+
+        if is_searchable is None:
+            raise ValueError('Intentions index is built without search.')
+
+        conditions, parameters = self._get_conditions(domain=domain, component=component, layer=layer)
+
+        found_test_cases = search_test_case_ids(
+            connection=self.connection,
+            query=query,
+            intention_type=intention_type,
+            describe_conditions=' AND '.join(conditions),
+            describe_parameters=parameters,
+            limit=limit,
+        )
+
+        if not found_test_cases:
+            return []
+
+        test_case_ids = [test_case_id for test_case_id, _, _ in found_test_cases]
+        intention_ids = [intention_id for _, _, intention_ids in found_test_cases for intention_id in intention_ids]
+
+        test_cases = dict(
+            zip(
+                sorted(test_case_ids),
+                self._iter_test_cases(
+                    conditions=[f'test_cases.id IN ({", ".join("?" * len(test_case_ids))})'],
+                    parameters=test_case_ids,
+                ),
+            ),
+        )
+
+        intentions = {
+            intention_id: TestCaseIntention(
+                type=Intention(type_),
+                code_line=code_line,
+                description=description,
+                budget_ms=budget_ms,
+                budget_bytes=budget_bytes,
+            )
+            for intention_id, type_, code_line, description, budget_ms, budget_bytes in self.connection.execute(
+                'SELECT id, type, code_line, description, budget_ms, budget_bytes FROM intentions '  # noqa: S608
+                f'WHERE id IN ({", ".join("?" * len(intention_ids))})',
+                intention_ids,
+            )
+        }
+
+        return [
+            SearchResult(
+                score=score,
+                described_test_case=test_cases[test_case_id],
+                intentions=[intentions[intention_id] for intention_id in intention_ids],
+            )
+            for test_case_id, score, intention_ids in found_test_cases
+        ]
+
+    def _iter_test_cases(self, conditions: list[str], parameters: list) -> Iterator[DescribedTestCase]:
+        rows = self.connection.execute(
+            'SELECT '  # noqa: S608
+            '    describes.domain, describes.component, describes.layer, test_cases.case_description, '
+            '    test_cases.file_path, test_cases.class_name, test_cases.class_code_line, test_cases.case_name, '
+            '    test_cases.function_name, test_cases.function_code_line, test_cases.id, '
+            '    intentions.type, intentions.code_line, intentions.description, intentions.budget_ms, '
+            '    intentions.budget_bytes '
+            'FROM test_cases '
+            'JOIN describes ON describes.id = test_cases.describe_id '
+            'JOIN intentions ON intentions.test_case_id = test_cases.id '
+            f'{self._get_where_clause(conditions)} '
+            'ORDER BY test_cases.id, intentions.id',
+            parameters,
+        )
+
+        for _, grouped_rows in groupby(rows, key=lambda row: row[10]):
+            test_case_rows = list(grouped_rows)
+            (
+                domain_, component_, layer_, case_description, file_path_, class_name, class_code_line, case_name,
+                function_name_, function_code_line, *_,
+            ) = test_case_rows[0]
+
+            yield DescribedTestCase(
+                describe=Describe(domain=domain_, component=component_, layer=layer_),
+                case_description=case_description,
+                test_case=TestCase(
+                    file_path=file_path_,
+                    class_name=class_name,
+                    class_code_line=class_code_line,
+                    case_name=case_name,
+                    function_name=function_name_,
+                    function_code_line=function_code_line,
+                    intentions=[
+                        TestCaseIntention(
+                            type=Intention(row[11]),
+                            code_line=row[12],
+                            description=row[13],
+                            budget_ms=row[14],
+                            budget_bytes=row[15],
+                        )
+                        for row in test_case_rows
+                    ],
+                ),
+            )
+
+    @staticmethod
+    def _get_conditions(**filters: Optional[str]) -> tuple[list[str], list[str]]:
+        columns = {
+            'domain': 'describes.domain',
+            'component': 'describes.component',
+            'layer': 'describes.layer',
+            'file_path': 'test_cases.file_path',
+            'function_name': 'test_cases.function_name',
+        }
+
+        conditions = []
+        parameters = []
+
+        for name, value in filters.items():
+            if value is None:
+                continue
+
+            conditions.append(f'{columns[name]} = ?')
+            parameters.append(value)
+
+        return conditions, parameters
+
+    @staticmethod
+    def _get_where_clause(conditions: list[str]) -> str:
+        if not conditions:
+            return ''
+
+        return 'WHERE ' + ' AND '.join(conditions)
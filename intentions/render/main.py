@@ -1,142 +1,869 @@
+from __future__ import annotations
+
 import ast
 import json
-from dataclasses import asdict
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Union,
+)
 
-from intentions.render.ast_ import AstNodeVisitor
+from intentions.enums import Intention
+from intentions.render.ast_ import iter_described_test_functions
+from intentions.render.cache import RenderCache
 from intentions.render.dto import (
+    DescribedTestCase,
+    FileError,
+    FileTestCases,
+    RenderSummary,
+    ShardsSummary,
     TestCase,
-    TestCaseIntention,
 )
-from intentions.render.encoders import JsonEncoderWithEnumSupport
-from intentions.render.enums import Intention
-from intentions.utils import (
-    convert_test_function_name_to_case_name,
-    is_test_function,
+from intentions.render.encoders import (
+    convert_test_case_to_dict,
+    expand_intentions_tables,
+    group_intentions_lines,
+    is_intentions_line,
+    is_intentions_tables,
+    write_intentions_json,
+    write_intentions_lines,
+)
+from intentions.render.enums import ExtractionEngine
+from intentions.render.index import (
+    INTENTIONS_INDEX_PATH,
+    write_intentions_index,
+)
+from intentions.render.prefilter import (
+    MMAP_FILE_SIZE_THRESHOLD,
+    may_contain_test_cases,
+)
+from intentions.render.profiling import (
+    EXTRACT_PHASE,
+    NULL_FILE_PROFILER,
+    PARSE_PHASE,
+    PREFILTER_PHASE,
+    READ_PHASE,
+    STORE_PHASE,
+    WALK_PHASE,
+    WRITE_PHASE,
+    FileProfiler,
+    RenderProfiler,
+    measure_phase,
 )
+from intentions.render.scanner import scan_test_functions
+from intentions.render.shards import (
+    INTENTIONS_SHARDS_PATH,
+    save_intentions_shards,
+)
+from intentions.render.walker import (
+    WalkFilter,
+    iter_test_files,
+)
+from intentions.utils import convert_test_function_name_to_case_name
 
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+    )
 
-def collect_test_files(directory: str) -> list[Path]:
-    test_files = []
+    from intentions.render.dto import TestFunction
 
-    for path in Path(directory).rglob('test_*.py'):
-        test_files.append(path)
+INTENTIONS_FOLDER_PATH = './.intentions'
+INTENTIONS_JSON_PATH = f'{INTENTIONS_FOLDER_PATH}/intentions.json'
+INTENTIONS_LINES_PATH = f'{INTENTIONS_FOLDER_PATH}/intentions.jsonl'
+INTENTIONS_CACHE_PATH = f'{INTENTIONS_FOLDER_PATH}/cache.json'
 
-    return test_files
 
+FILES_PER_WORKER_CHUNK = 4
 
-def collect_test_cases(storage: dict, file: Path) -> None:
-    file_text = file.read_text()
-    file_as_ast = ast.parse(file_text)
 
-    ast_node_visitor = AstNodeVisitor()
-    ast_node_visitor.visit(file_as_ast)
+def collect_test_files(directory: str, walk_filter: Optional[WalkFilter] = None) -> list[Path]:
+    return list(iter_test_files(directory=directory, walk_filter=walk_filter))
 
-    nodes = ast_node_visitor.get_nodes()
 
-    for node in nodes:
-        if not isinstance(node, ast.FunctionDef):
-            continue
+def parse_test_content(content: Union[bytes, mmap.mmap], *, prefilter: bool = True) -> Optional[ast.Module]:
+    """
+    Parse raw content of a test file.
 
-        function_node = node
+    Arguments:
+        content (bytes): raw content of a test file.
+        prefilter (bool): whether to skip parsing content that cannot contain described test cases.
 
-        if not is_test_function(name=function_node.name):
-            continue
+    Returns:
+        A parsed test file as `ast.Module` or `None` if the content is skipped by the prefilter.
+    """
+    if prefilter and not may_contain_test_cases(content=content):
+        return None
 
-        test_case_intentions = []
-        test_case_case_description = None
+    return ast.parse(content)
+
+
+def read_test_content(file: Path, stack: ExitStack) -> Union[bytes, mmap.mmap]:
+    """
+    Read raw content of a test file.
+
+    Large files are memory-mapped, so neither a copy of their content nor a decoded copy is made before parsing.
+
+    Arguments:
+        file (Path): a path to a test file.
+        stack (ExitStack): a stack to close the file and its memory map with once the content is not needed.
+
+    Returns:
+        Raw content of the test file as `bytes` or `mmap.mmap` for large files.
+    """
+    test_file = stack.enter_context(open(file, 'rb'))  # noqa: SIM115
+    file_size = os.fstat(test_file.fileno()).st_size
+
+    if file_size < MMAP_FILE_SIZE_THRESHOLD:
+        return test_file.read()
 
-        for node in function_node.body:
-            if not isinstance(node, ast.With):
-                continue
+    return stack.enter_context(mmap.mmap(test_file.fileno(), 0, access=mmap.ACCESS_READ))
 
-            with_node = node
 
-            for with_node_item in with_node.items:
-                if not isinstance(with_node_item.context_expr.func, ast.Name):
-                    continue
+def parse_test_file(file: Path, *, prefilter: bool = True) -> Optional[ast.Module]:
+    """
+    Parse a test file from its raw content.
 
-                with_node_item_name = with_node_item.context_expr.func.id
+    Arguments:
+        file (Path): a path to a test file.
+        prefilter (bool): whether to skip parsing files that cannot contain described test cases.
 
-                if with_node_item_name not in ('when', 'case', 'expect'):
-                    continue
+    Returns:
+        A parsed test file as `ast.Module` or `None` if the file is skipped by the prefilter.
+    """
+    with ExitStack() as stack:
+        return parse_test_content(content=read_test_content(file=file, stack=stack), prefilter=prefilter)
 
-                with_node_item_code_line = with_node_item.context_expr.args[0].lineno
-                with_node_item_description = with_node_item.context_expr.args[0].value
 
-                if with_node_item_name == 'case':
-                    test_case_case_description = with_node_item_description
+def extract_test_cases(
+    file_path: str,
+    *,
+    prefilter: bool = True,
+    content: Optional[bytes] = None,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+    profile: bool = False,
+) -> FileTestCases:
+    """
+    Extract described test cases from a test file.
 
-                test_sase_intention = TestCaseIntention(
-                    type=Intention(with_node_item_name),
-                    code_line=with_node_item_code_line,
-                    description=with_node_item_description,
+    It is a top-level function, so it could be sent to process pool workers. A file that cannot be parsed does not
+    raise, it is reported as an error of the file instead.
+
+    Arguments:
+        file_path (str): a path to a test file.
+        prefilter (bool): whether to skip parsing files that cannot contain described test cases.
+        content (bytes): raw content of the test file if it is not read from the path, for instance, a git blob.
+        engine (ExtractionEngine): an engine to extract test cases with, the scanner one falls back to `ast` for files
+            it cannot handle.
+        profile (bool): whether to measure phases of the extraction into the profile of the file.
+
+    Returns:
+        Described test cases of the file and an error if the file cannot be parsed as `FileTestCases`.
+    """
+    file = Path(file_path)
+    file_test_cases = FileTestCases(file_path=file.as_posix())
+    file_profiler = NULL_FILE_PROFILER
+
+    if profile:
+        file_profiler = FileProfiler(file_path=file_test_cases.file_path)
+        file_test_cases.profile = file_profiler.profile
+
+    try:
+        with ExitStack() as stack:
+            with file_profiler.phase(name=READ_PHASE):
+                if content is None:
+                    content = read_test_content(file=file, stack=stack)
+
+            file_profiler.count_bytes(content=content)
+
+            with file_profiler.phase(name=PREFILTER_PHASE):
+                if prefilter and not may_contain_test_cases(content=content):
+                    file_test_cases.skipped = True
+                    return file_test_cases
+
+            test_functions = None
+
+            if engine is ExtractionEngine.SCANNER:
+                with file_profiler.phase(name=PARSE_PHASE):
+                    test_functions = scan_test_functions(content=content)
+
+            if test_functions is None:
+                with file_profiler.phase(name=PARSE_PHASE):
+                    file_as_ast = ast.parse(content)
+
+                file_profiler.count_nodes(node=file_as_ast)
+                test_functions = iter_described_test_functions(node=file_as_ast)
+
+            with file_profiler.phase(name=EXTRACT_PHASE):
+                file_test_cases.test_cases = convert_test_functions(
+                    file_path=file_test_cases.file_path,
+                    test_functions=test_functions,
                 )
 
-                test_case_intentions.append(test_sase_intention)
+    except SyntaxError as error:
+        file_test_cases.test_cases = []
+        file_test_cases.error = FileError(file_path=file.as_posix(), code_line=error.lineno, message=error.msg)
 
-        if not test_case_intentions:
-            continue
+    except ValueError as error:
+        file_test_cases.test_cases = []
+        file_test_cases.error = FileError(file_path=file.as_posix(), code_line=None, message=str(error))
 
-        class_name = None
-        class_code_line = None
+    return file_test_cases
 
-        parent_node = ast_node_visitor.get_parent(function_node)
 
-        if isinstance(parent_node, ast.ClassDef):
-            class_name = parent_node.name
-            class_code_line = parent_node.lineno
+def convert_test_functions(file_path: str, test_functions: Iterable[TestFunction]) -> list[DescribedTestCase]:
+    """
+    Convert described test functions of a test file to described test cases.
 
-        if isinstance(parent_node, ast.ClassDef):
-            describe = ast_node_visitor.get_describe(decorators=parent_node.decorator_list)
+    Test functions without intentions are not test cases. A case description of a test case is a description of its
+    last `case` intention.
 
-        else:
-            describe = ast_node_visitor.get_describe(decorators=function_node.decorator_list)
+    Arguments:
+        file_path (str): a path to the test file.
+        test_functions (Iterable): described test functions of the test file.
 
-        if describe is None:
+    Returns:
+        Described test cases as `list`.
+    """
+    described_test_cases = []
+
+    for test_function in test_functions:
+        if not test_function.intentions:
             continue
 
-        if describe.domain not in storage:
-            storage[describe.domain] = {}
+        test_case_case_description = None
+
+        for intention in test_function.intentions:
+            if intention.type is Intention.CASE:
+                test_case_case_description = intention.description
+
+        test_case = TestCase(
+            case_name=convert_test_function_name_to_case_name(test_function_name=test_function.function_name),
+            function_name=test_function.function_name,
+            function_code_line=test_function.function_code_line,
+            intentions=test_function.intentions,
+            class_name=test_function.class_name,
+            class_code_line=test_function.class_code_line,
+            file_path=file_path,
+        )
+
+        described_test_cases.append(
+            DescribedTestCase(
+                describe=test_function.describe,
+                case_description=test_case_case_description,
+                test_case=test_case,
+            ),
+        )
+
+    return described_test_cases
 
-        if describe.component not in storage[describe.domain]:
-            storage[describe.domain][describe.component] = {}
 
-        if describe.layer not in storage[describe.domain][describe.component]:
-            storage[describe.domain][describe.component][describe.layer] = {}
+def get_test_cases_group(storage: dict, described_test_case: DescribedTestCase) -> list:
+    describe = described_test_case.describe
+    test_case_case_description = described_test_case.case_description
 
-        if test_case_case_description not in storage[describe.domain][describe.component][describe.layer]:
-            storage[describe.domain][describe.component][describe.layer][test_case_case_description] = []
+    if describe.domain not in storage:
+        storage[describe.domain] = {}
 
-        test_function = TestCase(
-            case_name=convert_test_function_name_to_case_name(test_function_name=function_node.name),
-            function_name=function_node.name,
-            function_code_line=function_node.lineno,
-            intentions=test_case_intentions,
-            class_name=class_name,
-            class_code_line=class_code_line,
-            file_path=file.as_posix(),
-        )
+    if describe.component not in storage[describe.domain]:
+        storage[describe.domain][describe.component] = {}
 
-        test_case_as_dict = asdict(test_function)
+    if describe.layer not in storage[describe.domain][describe.component]:
+        storage[describe.domain][describe.component][describe.layer] = {}
 
-        storage[describe.domain][describe.component][describe.layer][test_case_case_description].append(
-            test_case_as_dict,
+    if test_case_case_description not in storage[describe.domain][describe.component][describe.layer]:
+        storage[describe.domain][describe.component][describe.layer][test_case_case_description] = []
+
+    return storage[describe.domain][describe.component][describe.layer][test_case_case_description]
+
+
+def store_test_cases(storage: dict, file_test_cases: FileTestCases) -> None:
+    for described_test_case in file_test_cases.test_cases:
+        test_cases_group = get_test_cases_group(storage=storage, described_test_case=described_test_case)
+        test_cases_group.append(described_test_case.test_case)
+
+
+def collect_test_cases(storage: dict, file: Path) -> None:
+    file_test_cases = extract_test_cases(file_path=file.as_posix())
+
+    if file_test_cases.error is not None:
+        error = file_test_cases.error
+        raise SyntaxError(error.message, (error.file_path, error.code_line, None, None))
+
+    for described_test_case in file_test_cases.test_cases:
+        test_cases_group = get_test_cases_group(storage=storage, described_test_case=described_test_case)
+        test_cases_group.append(convert_test_case_to_dict(test_case=described_test_case.test_case))
+
+
+def iter_file_test_cases(
+    test_files: Iterable[Path],
+    workers: int = 1,
+    *,
+    prefilter: bool = True,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+    profile: bool = False,
+) -> Iterator[FileTestCases]:
+    """
+    Extract described test cases from test files one file after another.
+
+    With a single worker, test files are parsed as they come, so a walk of test files is streamed straight into the
+    extraction. With more than one worker, files are parsed in a process pool. Results are yielded in the order of the
+    given files regardless of the number of workers, so merging them gives the same result as the serial extraction.
+
+    Arguments:
+        test_files (Iterable): paths to test files.
+        workers (int): a number of processes to parse test files with.
+        prefilter (bool): whether to skip parsing files that cannot contain described test cases.
+        engine (ExtractionEngine): an engine to extract test cases with.
+        profile (bool): whether to measure phases of the extraction of each file.
+
+    Yields:
+        Described test cases of each file as `FileTestCases`.
+    """
+    if workers <= 1:
+        for test_file in test_files:
+            yield extract_test_cases(
+                file_path=test_file.as_posix(),
+                prefilter=prefilter,
+                engine=engine,
+                profile=profile,
+            )
+
+        return
+
+    file_paths = [test_file.as_posix() for test_file in test_files]
+
+    if len(file_paths) <= 1:
+        for file_path in file_paths:
+            yield extract_test_cases(file_path=file_path, prefilter=prefilter, engine=engine, profile=profile)
+
+        return
+
+    chunk_size = max(1, len(file_paths) // (workers * FILES_PER_WORKER_CHUNK))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            partial(extract_test_cases, prefilter=prefilter, engine=engine, profile=profile),
+            file_paths,
+            chunksize=chunk_size,
         )
 
 
-def create_intentions_json(directory: str) -> None:
-    test_files = collect_test_files(directory=directory)
+def iter_cached_file_test_cases(  # noqa: PLR0913
+    test_files: Iterable[Path],
+    workers: int = 1,
+    cache: Optional[RenderCache] = None,
+    *,
+    prefilter: bool = True,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+    profile: bool = False,
+) -> Iterator[FileTestCases]:
+    """
+    Extract described test cases from test files serving unchanged files from the cache.
+
+    Only files that were added or modified since the cache was saved are parsed. The cache is saved once all files are
+    yielded.
+
+    Arguments:
+        test_files (Iterable): paths to test files.
+        workers (int): a number of processes to parse test files with.
+        cache (RenderCache): a cache of test cases, test files are always parsed if it is not provided.
+        prefilter (bool): whether to skip parsing files that cannot contain described test cases.
+        engine (ExtractionEngine): an engine to extract test cases with.
+        profile (bool): whether to measure phases of the extraction of each parsed file.
+
+    Yields:
+        Described test cases of each file as `FileTestCases`.
+    """
+    if cache is None:
+        yield from iter_file_test_cases(
+            test_files=test_files,
+            workers=workers,
+            prefilter=prefilter,
+            engine=engine,
+            profile=profile,
+        )
+        return
 
-    storage = {}
+    cached_file_test_cases = []
+    changed_test_files = []
 
     for test_file in test_files:
-        collect_test_cases(storage=storage, file=test_file)
+        file_test_cases = cache.get(file=test_file)
+        cached_file_test_cases.append(file_test_cases)
+
+        if file_test_cases is None:
+            changed_test_files.append(test_file)
+
+    extracted_file_test_cases = iter_file_test_cases(
+        test_files=changed_test_files,
+        workers=workers,
+        prefilter=prefilter,
+        engine=engine,
+        profile=profile,
+    )
+
+    for file_test_cases in cached_file_test_cases:
+        if file_test_cases is None:
+            file_test_cases = next(extracted_file_test_cases)
+            cache.set(file_test_cases=file_test_cases)
+
+        yield file_test_cases
+
+    cache.save()
+
+
+def summarize_file_test_cases(summary: RenderSummary, file_test_cases: FileTestCases) -> bool:
+    """
+    Account described test cases of a test file in the render summary.
+
+    Arguments:
+        summary (RenderSummary): a summary to account the test file in.
+        file_test_cases (FileTestCases): described test cases of the test file.
+
+    Returns:
+        Whether the test file is rendered, so it is neither skipped nor failed to be parsed as `bool`.
+    """
+    summary.files += 1
 
-    intentions_folder_path = Path('./.intentions')
+    if file_test_cases.skipped:
+        summary.skipped_files += 1
+        return False
 
-    if not intentions_folder_path.exists():
-        intentions_folder_path.mkdir(parents=True)
+    if file_test_cases.error is not None:
+        summary.errors.append(file_test_cases.error)
+        return False
 
-    with open('./.intentions/intentions.json', 'w') as file:
-        json.dump(storage, file, indent=4, cls=JsonEncoderWithEnumSupport)
+    summary.test_cases += len(file_test_cases.test_cases)
+
+    return True
+
+
+def save_intentions_json(
+    storage: dict,
+    path: str = INTENTIONS_JSON_PATH,
+    *,
+    compact: bool = False,
+    tables: bool = False,
+) -> None:
+    """
+    Save test cases storage into the intentions JSON file atomically.
+
+    The storage is written into a temporary file next to the intentions JSON file that then replaces it, so readers
+    never see a partially written file.
+
+    Arguments:
+        storage (dict): test cases stored by domain, component, layer and case description, emptied while written.
+        path (str): a path to the intentions JSON file.
+        compact (bool): whether to write the intentions JSON file without indentation.
+        tables (bool): whether to write the intentions JSON file with string tables.
+    """
+    intentions_json_path = Path(path)
+
+    if not intentions_json_path.parent.exists():
+        intentions_json_path.parent.mkdir(parents=True)
+
+    temporary_intentions_json_path = intentions_json_path.with_name(f'.{intentions_json_path.name}.{os.getpid()}.tmp')
+
+    try:
+        with open(temporary_intentions_json_path, 'w') as file:
+            write_intentions_json(storage=storage, file=file, compact=compact, tables=tables)
+
+        temporary_intentions_json_path.replace(intentions_json_path)
+
+    finally:
+        temporary_intentions_json_path.unlink(missing_ok=True)
+
+
+def load_intentions_json(path: str = INTENTIONS_JSON_PATH) -> dict:
+    """
+    Load the intentions JSON file in any of its formats.
+
+    The intentions JSON file with string tables and the intentions JSON Lines are expanded to the same structure the
+    intentions JSON file has.
+
+    Arguments:
+        path (str): a path to the intentions JSON file.
+
+    Returns:
+        Test cases by domain, component, layer and case description as `dict`.
+    """
+    with open(path, 'rb') as file:
+        content = file.read()
+
+    try:
+        data = json.loads(content)
+
+    except ValueError:
+        return group_intentions_lines(lines=(json.loads(line) for line in content.splitlines() if line.strip()))
+
+    if is_intentions_tables(data=data):
+        return expand_intentions_tables(data=data)
+
+    if is_intentions_line(data=data):
+        return group_intentions_lines(lines=[data])
+
+    return data
+
+
+def get_cache_path(path: str) -> str:
+    """
+    Get a path to the cache of test cases rendered into the output.
+
+    The cache is stored next to the output, so renders into different outputs do not evict entries of each other.
+
+    Arguments:
+        path (str): a path to the output file or directory.
+
+    Returns:
+        A path to the cache as `str`.
+    """
+    output_path = Path(path)
+    return output_path.with_name(f'.{output_path.name}.cache.json').as_posix()
+
+
+def render_test_cases(  # noqa: PLR0913
+    directory: str,
+    summary: RenderSummary,
+    workers: int = 1,
+    *,
+    cache: bool = False,
+    cache_path: str = INTENTIONS_CACHE_PATH,
+    prefilter: bool = True,
+    walk_filter: Optional[WalkFilter] = None,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+    profiler: Optional[RenderProfiler] = None,
+) -> Iterator[FileTestCases]:
+    """
+    Render described test cases of the directory file by file.
+
+    Skipped files and files that cannot be parsed are not yielded, they are accounted in the summary instead.
+
+    Arguments:
+        directory (str): a path to a directory with test files.
+        summary (RenderSummary): a summary to account rendered files and test cases in.
+        workers (int): a number of processes to parse test files with.
+        cache (bool): whether to parse only test files changed since the previous render.
+        cache_path (str): a path to the cache of test cases.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+        walk_filter (WalkFilter): which test files of the directory to render.
+        engine (ExtractionEngine): an engine to extract test cases with.
+        profiler (RenderProfiler): a profiler to account the walk and phases of each file in if profiling is on.
+
+    Yields:
+        Described test cases of each rendered file as `FileTestCases`.
+    """
+    test_files = iter_test_files(directory=directory, walk_filter=walk_filter)
+    render_cache = RenderCache(path=cache_path, prefilter=prefilter, engine=engine) if cache else None
+
+    if profiler is not None:
+        test_files = profiler.iter_phase(name=WALK_PHASE, items=test_files)
+
+    rendered_file_test_cases = iter_cached_file_test_cases(
+        test_files=test_files,
+        workers=workers,
+        cache=render_cache,
+        prefilter=prefilter,
+        engine=engine,
+        profile=profiler is not None,
+    )
+
+    for file_test_cases in rendered_file_test_cases:
+        if profiler is not None:
+            profiler.add_file(file_test_cases=file_test_cases)
+
+        if summarize_file_test_cases(summary=summary, file_test_cases=file_test_cases):
+            yield file_test_cases
+
+    if render_cache is not None:
+        summary.cache_hits = render_cache.hits
+        summary.cache_misses = render_cache.misses
+
+
+def iter_test_cases(  # noqa: PLR0913
+    directory: str,
+    workers: int = 1,
+    *,
+    cache: bool = False,
+    cache_path: str = INTENTIONS_CACHE_PATH,
+    prefilter: bool = True,
+    walk_filter: Optional[WalkFilter] = None,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+    summary: Optional[RenderSummary] = None,
+) -> Iterator[DescribedTestCase]:
+    """
+    Iterate over described test cases of the directory lazily, file by file.
+
+    Nothing is stored, so test cases could be consumed, for instance, written with `write_intentions_lines`, with
+    bounded memory however many of them there are.
+
+    Arguments:
+        directory (str): a path to a directory with test files.
+        workers (int): a number of processes to parse test files with, test files are parsed serially by default.
+        cache (bool): whether to parse only test files changed since the previous render.
+        cache_path (str): a path to the cache of test cases, use a cache per output of the test cases.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+        walk_filter (WalkFilter): which test files of the directory to render.
+        engine (ExtractionEngine): an engine to extract test cases with, `ast` by default.
+        summary (RenderSummary): a summary to account rendered files and test cases in if it is needed.
+
+    Yields:
+        Described test cases in the order of test files and their test functions as `DescribedTestCase`.
+    """
+    rendered_file_test_cases = render_test_cases(
+        directory=directory,
+        summary=RenderSummary() if summary is None else summary,
+        workers=workers,
+        cache=cache,
+        cache_path=cache_path,
+        prefilter=prefilter,
+        walk_filter=walk_filter,
+        engine=engine,
+    )
+
+    for file_test_cases in rendered_file_test_cases:
+        yield from file_test_cases.test_cases
+
+
+def create_intentions_json(  # noqa: PLR0913
+    directory: str,
+    path: str = INTENTIONS_JSON_PATH,
+    workers: int = 1,
+    *,
+    cache: bool = False,
+    compact: bool = False,
+    prefilter: bool = True,
+    walk_filter: Optional[WalkFilter] = None,
+    tables: bool = False,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+    profiler: Optional[RenderProfiler] = None,
+) -> RenderSummary:
+    """
+    Render test cases of the directory into the intentions JSON file.
+
+    Arguments:
+        directory (str): a path to a directory with test files.
+        path (str): a path to the intentions JSON file.
+        workers (int): a number of processes to parse test files with, test files are parsed serially by default.
+        cache (bool): whether to parse only test files changed since the previous render, the cache is stored next to
+            the intentions JSON file.
+        compact (bool): whether to write the intentions JSON file without indentation.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+        walk_filter (WalkFilter): which test files of the directory to render.
+        tables (bool): whether to write each string once in a string table that test cases refer to by indices, use
+            `load_intentions_json` to read it back.
+        engine (ExtractionEngine): an engine to extract test cases with, `ast` by default.
+        profiler (RenderProfiler): a profiler to measure phases of the render with, profiling is off by default.
+
+    Returns:
+        A number of rendered, skipped files and test cases, errors of files that cannot be parsed, cache usage and a
+        profile of the render if profiling is on as `RenderSummary`.
+    """
+    storage = {}
+    summary = RenderSummary()
+
+    if profiler is not None:
+        profiler.start()
+
+    rendered_file_test_cases = render_test_cases(
+        directory=directory,
+        summary=summary,
+        workers=workers,
+        cache=cache,
+        cache_path=get_cache_path(path=path),
+        prefilter=prefilter,
+        walk_filter=walk_filter,
+        engine=engine,
+        profiler=profiler,
+    )
+
+    for file_test_cases in rendered_file_test_cases:
+        with measure_phase(profiler=profiler, name=STORE_PHASE):
+            store_test_cases(storage=storage, file_test_cases=file_test_cases)
+
+    with measure_phase(profiler=profiler, name=WRITE_PHASE):
+        save_intentions_json(storage=storage, path=path, compact=compact, tables=tables)
+
+    if profiler is not None:
+        summary.profile = profiler.finish()
+
+    return summary
+
+
+def create_intentions_lines(  # noqa: PLR0913
+    directory: str,
+    path: str = INTENTIONS_LINES_PATH,
+    workers: int = 1,
+    *,
+    cache: bool = False,
+    prefilter: bool = True,
+    walk_filter: Optional[WalkFilter] = None,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+) -> RenderSummary:
+    """
+    Render test cases of the directory into the intentions JSON Lines file atomically.
+
+    Each test case is written on its own line as soon as it is rendered, so memory does not grow with a number of test
+    cases. Use `load_intentions_json` to read it back grouped as the intentions JSON file is.
+
+    Arguments:
+        directory (str): a path to a directory with test files.
+        path (str): a path to the intentions JSON Lines file.
+        workers (int): a number of processes to parse test files with, test files are parsed serially by default.
+        cache (bool): whether to parse only test files changed since the previous render, the cache is stored next to
+            the intentions JSON Lines file.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+        walk_filter (WalkFilter): which test files of the directory to render.
+        engine (ExtractionEngine): an engine to extract test cases with, `ast` by default.
+
+    Returns:
+        A number of rendered, skipped files and test cases, errors of files that cannot be parsed and cache usage as
+        `RenderSummary`.
+    """
+    summary = RenderSummary()
+    intentions_lines_path = Path(path)
+
+    if not intentions_lines_path.parent.exists():
+        intentions_lines_path.parent.mkdir(parents=True)
+
+    temporary_intentions_lines_path = intentions_lines_path.with_name(
+        f'.{intentions_lines_path.name}.{os.getpid()}.tmp',
+    )
+
+    described_test_cases = iter_test_cases(
+        directory=directory,
+        workers=workers,
+        cache=cache,
+        cache_path=get_cache_path(path=path),
+        prefilter=prefilter,
+        walk_filter=walk_filter,
+        engine=engine,
+        summary=summary,
+    )
+
+    try:
+        with open(temporary_intentions_lines_path, 'w') as file:
+            write_intentions_lines(described_test_cases=described_test_cases, file=file)
+
+        temporary_intentions_lines_path.replace(intentions_lines_path)
+
+    finally:
+        temporary_intentions_lines_path.unlink(missing_ok=True)
+
+    return summary
+
+
+def create_intentions_shards(  # noqa: PLR0913
+    directory: str,
+    path: str = INTENTIONS_SHARDS_PATH,
+    workers: int = 1,
+    *,
+    cache: bool = False,
+    compact: bool = False,
+    prefilter: bool = True,
+    walk_filter: Optional[WalkFilter] = None,
+    by_component: bool = False,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+) -> tuple[RenderSummary, ShardsSummary]:
+    """
+    Render test cases of the directory into intentions JSON files per domain with a manifest.
+
+    Use `IntentionsShards` to load shards lazily.
+
+    Arguments:
+        directory (str): a path to a directory with test files.
+        path (str): a path to a directory to write shards and the manifest to.
+        workers (int): a number of processes to parse test files with, test files are parsed serially by default.
+        cache (bool): whether to parse only test files changed since the previous render, the cache is stored next to
+            the shards directory.
+        compact (bool): whether to write shards without indentation.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+        walk_filter (WalkFilter): which test files of the directory to render.
+        by_component (bool): whether to write a shard per domain and component instead of per domain.
+        engine (ExtractionEngine): an engine to extract test cases with, `ast` by default.
+
+    Returns:
+        A render summary and a number of written, unchanged and removed shards as `tuple`.
+    """
+    storage = {}
+    summary = RenderSummary()
+
+    rendered_file_test_cases = render_test_cases(
+        directory=directory,
+        summary=summary,
+        workers=workers,
+        cache=cache,
+        cache_path=get_cache_path(path=path),
+        prefilter=prefilter,
+        walk_filter=walk_filter,
+        engine=engine,
+    )
+
+    for file_test_cases in rendered_file_test_cases:
+        store_test_cases(storage=storage, file_test_cases=file_test_cases)
+
+    shards_summary = save_intentions_shards(
+        storage=storage,
+        directory=path,
+        compact=compact,
+        by_component=by_component,
+    )
+
+    return summary, shards_summary
+
+
+def create_intentions_index(  # noqa: PLR0913
+    directory: str,
+    path: str = INTENTIONS_INDEX_PATH,
+    workers: int = 1,
+    *,
+    cache: bool = False,
+    prefilter: bool = True,
+    search: bool = False,
+    walk_filter: Optional[WalkFilter] = None,
+    engine: ExtractionEngine = ExtractionEngine.AST,
+) -> RenderSummary:
+    """
+    Render test cases of the directory into the intentions SQLite index.
+
+    Test cases are written to the index file by file as they are rendered, so they are never held in memory all at
+    once. Use `IntentionsIndex` to query the index.
+
+    Arguments:
+        directory (str): a path to a directory with test files.
+        path (str): a path to the intentions index.
+        workers (int): a number of processes to parse test files with, test files are parsed serially by default.
+        cache (bool): whether to parse only test files changed since the previous render, the cache is stored next to
+            the intentions index.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+        search (bool): whether to build an inverted index of intention descriptions to search test cases by.
+        walk_filter (WalkFilter): which test files of the directory to render.
+        engine (ExtractionEngine): an engine to extract test cases with, `ast` by default.
+
+    Returns:
+        A number of rendered, skipped files and test cases, errors of files that cannot be parsed and cache usage as
+        `RenderSummary`.
+    """
+    summary = RenderSummary()
+
+    rendered_file_test_cases = render_test_cases(
+        directory=directory,
+        summary=summary,
+        workers=workers,
+        cache=cache,
+        cache_path=get_cache_path(path=path),
+        prefilter=prefilter,
+        walk_filter=walk_filter,
+        engine=engine,
+    )
+
+    write_intentions_index(file_test_cases=rendered_file_test_cases, path=path, search=search)
+
+    return summary
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import re
+from typing import (
+    TYPE_CHECKING,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import mmap
+
+MMAP_FILE_SIZE_THRESHOLD = 64 * 1024
+
+DESCRIBE_MARKER = re.compile(rb'\bdescribe\s*\(')
+INTENTION_MARKER = re.compile(rb'\b(?:when|case|expect)\s*\(')
+
+
+def may_contain_test_cases(content: Union[bytes, mmap.mmap]) -> bool:
+    """
+    Check whether raw content of a test file may contain described test cases.
+
+    Test cases are extracted only from functions and classes decorated by `describe` with `when`, `case` or `expect`
+    intentions inside, so content without both of the markers cannot produce test cases. The check may give false
+    positives, for instance, on markers in comments, but never false negatives.
+
+    Arguments:
+        content (bytes): raw content of a test file, memory-mapped for large files.
+
+    Returns:
+        Whether the content may contain described test cases as `bool`.
+    """
+    if DESCRIBE_MARKER.search(content) is None:
+        return False
+
+    if INTENTION_MARKER.search(content) is None:
+        return False
+
+    return True
@@ -0,0 +1,255 @@
+"""
+Phase-level profiling of rendering.
+
+A render is split into phases: walking the directory, reading, prefiltering, parsing test files, extracting test cases
+from them, storing test cases and writing the intentions JSON file. Phases of each test file are measured where it is
+extracted, in a worker process too, and travel back with its test cases to be aggregated by `RenderProfiler`.
+
+Profiling is off unless a profiler is given, then the only cost is a few no-op calls per test file.
+"""
+from __future__ import annotations
+
+import ast
+import heapq
+import json
+import time
+from contextlib import (
+    contextmanager,
+    nullcontext,
+)
+from dataclasses import asdict
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from intentions.render.dto import (
+    FileProfile,
+    FileTestCases,
+    RenderProfile,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+    )
+    from contextlib import AbstractContextManager
+
+WALK_PHASE = 'walk'
+READ_PHASE = 'read'
+PREFILTER_PHASE = 'prefilter'
+PARSE_PHASE = 'parse'
+EXTRACT_PHASE = 'extract'
+STORE_PHASE = 'store'
+WRITE_PHASE = 'write'
+
+SLOWEST_FILES = 10
+
+NULL_PHASE = nullcontext()
+
+Item = TypeVar('Item')
+
+
+class FileProfiler:
+    """
+    Profiler of extraction of test cases from a single test file.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            file_path (str): a path to the test file.
+        """
+        self.profile = FileProfile(file_path=file_path)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            elapsed = time.perf_counter() - started_at
+            self.profile.phases[name] = self.profile.phases.get(name, 0.0) + elapsed
+            self.profile.elapsed += elapsed
+
+    def count_bytes(self, content: Union[bytes, memoryview]) -> None:
+        self.profile.bytes_read += len(content)
+
+    def count_nodes(self, node: ast.AST) -> None:
+        """
+        Count nodes of a parsed syntax tree.
+
+        Nodes are counted out of any phase, so counting does not skew timings of the file.
+
+        Arguments:
+            node (ast.AST): a root node of the syntax tree.
+        """
+        self.profile.nodes += sum(1 for _ in ast.walk(node))
+
+
+class NullFileProfiler:
+    """
+    Profiler of a test file that measures nothing, it is used when profiling is off.
+    """
+
+    def phase(self, name: str) -> AbstractContextManager[None]:  # noqa: ARG002
+        return NULL_PHASE
+
+    def count_bytes(self, content: Union[bytes, memoryview]) -> None:
+        pass
+
+    def count_nodes(self, node: ast.AST) -> None:
+        pass
+
+
+NULL_FILE_PROFILER = NullFileProfiler()
+
+
+class RenderProfiler:
+    """
+    Profiler of a render that aggregates phases and counters of all test files.
+    """
+
+    def __init__(
+        self,
+        slowest_files: int = SLOWEST_FILES,
+        on_profile: Optional[Callable[[RenderProfile], None]] = None,
+    ) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            slowest_files (int): a number of the slowest test files to keep profiles of.
+            on_profile (Callable): a function to call with the profile once the render is finished, for instance, to
+                forward it to metrics.
+        """
+        self.slowest_files = slowest_files
+        self.on_profile = on_profile
+        self.profile = RenderProfile()
+        self.started_at = time.perf_counter()
+        self._slowest_files_heap = []
+
+    def start(self) -> None:
+        self.profile = RenderProfile()
+        self.started_at = time.perf_counter()
+        self._slowest_files_heap = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            self.profile.phases[name] = self.profile.phases.get(name, 0.0) + time.perf_counter() - started_at
+
+    def iter_phase(self, name: str, items: Iterable[Item]) -> Iterator[Item]:
+        """
+        Iterate over items measuring only the time spent to get each of them in the phase.
+
+        It is useful to measure a lazy walk that is interleaved with processing of what it yields.
+
+        Arguments:
+            name (str): a name of the phase.
+            items (Iterable): items to iterate over.
+
+        Yields:
+            The items in their order.
+        """
+        iterator = iter(items)
+
+        while True:
+            with self.phase(name=name):
+                try:
+                    item = next(iterator)
+
+                except StopIteration:
+                    return
+
+            yield item
+
+    def add_file(self, file_test_cases: FileTestCases) -> None:
+        """
+        Account a rendered test file in the profile.
+
+        Test files served from the cache have no profile, they are counted, but add nothing to phases.
+
+        Arguments:
+            file_test_cases (FileTestCases): described test cases of the test file with its profile.
+        """
+        self.profile.files += 1
+        self.profile.skipped_files += file_test_cases.skipped
+        self.profile.test_cases += len(file_test_cases.test_cases)
+
+        file_profile = file_test_cases.profile
+
+        if file_profile is None:
+            self.profile.cached_files += 1
+            return
+
+        self.profile.bytes_read += file_profile.bytes_read
+        self.profile.nodes += file_profile.nodes
+
+        for name, elapsed in file_profile.phases.items():
+            self.profile.phases[name] = self.profile.phases.get(name, 0.0) + elapsed
+
+        if self.slowest_files <= 0:
+            return
+
+        heap_item = (file_profile.elapsed, self.profile.files, file_profile)
+
+        if len(self._slowest_files_heap) < self.slowest_files:
+            heapq.heappush(self._slowest_files_heap, heap_item)
+        else:
+            heapq.heappushpop(self._slowest_files_heap, heap_item)
+
+    def finish(self) -> RenderProfile:
+        """
+        Finish the render profile and pass it to the hook.
+
+        Returns:
+            Total elapsed time, time of each phase, counters and the slowest test files as `RenderProfile`.
+        """
+        self.profile.elapsed = time.perf_counter() - self.started_at
+        slowest_files_heap = sorted(self._slowest_files_heap, key=lambda heap_item: heap_item[:2], reverse=True)
+        self.profile.slowest_files = [file_profile for _, _, file_profile in slowest_files_heap]
+
+        if self.on_profile is not None:
+            self.on_profile(self.profile)
+
+        return self.profile
+
+
+def measure_phase(profiler: Optional[RenderProfiler], name: str) -> AbstractContextManager[None]:
+    return NULL_PHASE if profiler is None else profiler.phase(name=name)
+
+
+def convert_render_profile_to_dict(profile: RenderProfile) -> dict:
+    return asdict(profile)
+
+
+def save_render_profile(profile: RenderProfile, path: str) -> None:
+    """
+    Save the render profile as JSON.
+
+    Arguments:
+        profile (RenderProfile): a profile of the render.
+        path (str): a path to the JSON file.
+    """
+    profile_path = Path(path)
+
+    if not profile_path.parent.exists():
+        profile_path.parent.mkdir(parents=True)
+
+    with open(profile_path, 'w') as file:
+        json.dump(convert_render_profile_to_dict(profile=profile), file, indent=4)
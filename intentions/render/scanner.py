@@ -0,0 +1,365 @@
+"""
+Extraction of described test functions from the token structure of a test file without building its syntax tree.
+
+A single regular expression finds strings, comments, brackets and line breaks, which is enough to split a file into
+logical lines and to follow blocks by indentation. Only headers of classes and functions, their decorators and with
+statements in bodies of described test functions are looked into. Common forms of `describe` decorators and intentions
+are matched by regular expressions, other forms are parsed with `ast` one statement at a time.
+"""
+from __future__ import annotations
+
+import ast
+import re
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Union,
+)
+
+from intentions.dto import Describe
+from intentions.enums import Intention
+from intentions.render.ast_ import (
+    get_describe,
+    get_with_intentions,
+)
+from intentions.render.dto import (
+    TestCaseIntention,
+    TestFunction,
+)
+from intentions.utils import is_test_function
+
+if TYPE_CHECKING:
+    import mmap
+
+LOGICAL_LINE_TOKENS = re.compile(
+    r'(?P<string>"""(?:[^"\\]|\\.|"(?!""))*"""|\'\'\'(?:[^\'\\]|\\.|\'(?!\'\'))*\'\'\''
+    r'|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')'
+    r'|(?P<comment>#[^\n]*)'
+    r'|(?P<open>[(\[{])'
+    r'|(?P<close>[)\]}])'
+    r'|(?P<continuation>\\\n)'
+    r'|(?P<newline>\n)'
+    r'|(?P<error>["\'])',
+    re.DOTALL,
+)
+CODING_COOKIE = re.compile(r'^[ \t\f]*#.*?coding[:=]', re.MULTILINE)
+STATEMENT_KEYWORD = re.compile(r'(class|def|async|with)\b')
+CLASS_HEADER = re.compile(r'class\s+(\w+)')
+FUNCTION_HEADER = re.compile(r'def\s+(\w+)')
+
+STRING_LITERAL = r'"[^"\\\n]*"|\'[^\'\\\n]*\''
+NUMBER_LITERAL = r'(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d[\d_]*)?'
+
+DESCRIBE_DECORATOR = re.compile(
+    rf'@\s*describe\s*\(\s*domain\s*=\s*(?P<domain>{STRING_LITERAL})\s*,'
+    rf'\s*component\s*=\s*(?P<component>{STRING_LITERAL})\s*,'
+    rf'\s*layer\s*=\s*(?P<layer>{STRING_LITERAL})\s*,?\s*\)',
+)
+INTENTION_WITH = re.compile(
+    rf'with\s+(?P<type>when|case|expect)\s*\(\s*(?P<description>{STRING_LITERAL})'
+    rf'(?P<budgets>(?:\s*,\s*budget_(?:ms|bytes)\s*=\s*{NUMBER_LITERAL})*)\s*,?\s*\)\s*:',
+)
+INTENTION_BUDGET = re.compile(rf'(budget_ms|budget_bytes)\s*=\s*({NUMBER_LITERAL})')
+
+MODULE_BLOCK = 'module'
+CLASS_BLOCK = 'class'
+FUNCTION_BLOCK = 'function'
+OTHER_BLOCK = 'other'
+
+
+class ScannerFallbackError(Exception):
+    """
+    The test file has a construct the scanner cannot handle, so it is to be parsed with `ast` instead.
+    """
+
+
+def split_logical_lines(text: str) -> list[tuple[int, int, int]]:
+    """
+    Split source code into logical lines.
+
+    Line breaks inside brackets, strings and after backslashes do not end logical lines, comments are cut off.
+
+    Arguments:
+        text (str): source code with `\\n` line breaks.
+
+    Returns:
+        Start and end offsets of code of each logical line and its line number as `list`.
+
+    Raises:
+        ScannerFallbackError: if strings or brackets are not balanced.
+    """
+    logical_lines = []
+    depth = 0
+    start = 0
+    code_end = None
+    line = 1
+    start_line = 1
+
+    for match in LOGICAL_LINE_TOKENS.finditer(text):
+        kind = match.lastgroup
+
+        if kind == 'newline':
+            if depth == 0:
+                logical_lines.append((start, match.start() if code_end is None else code_end, start_line))
+                start = match.end()
+                start_line = line + 1
+                code_end = None
+
+            line += 1
+
+        elif kind == 'comment':
+            code_end = match.start()
+
+        elif kind == 'string':
+            line += text.count('\n', match.start(), match.end())
+            code_end = None
+
+        elif kind == 'open':
+            depth += 1
+            code_end = None
+
+        elif kind == 'close':
+            depth -= 1
+            code_end = None
+
+        elif kind == 'continuation':
+            line += 1
+
+        else:
+            raise ScannerFallbackError
+
+    if depth != 0:
+        raise ScannerFallbackError
+
+    logical_lines.append((start, len(text) if code_end is None else code_end, start_line))
+
+    return logical_lines
+
+
+def parse_statement(code: str, line: int) -> ast.stmt:
+    """
+    Parse a single statement of a logical line with `ast`.
+
+    A block header is given a body to be parsed on its own.
+
+    Arguments:
+        code (str): code of the logical line without indentation.
+        line (int): a number of the line the logical line starts on.
+
+    Returns:
+        A parsed statement with line numbers of the test file as `ast.stmt`.
+
+    Raises:
+        ScannerFallbackError: if the statement cannot be parsed on its own.
+    """
+    if code.endswith(':'):
+        code = f'{code} pass'
+
+    try:
+        statement = ast.parse(code).body[0]
+
+    except SyntaxError as error:
+        raise ScannerFallbackError from error
+
+    return ast.increment_lineno(statement, line - 1)
+
+
+def scan_describe(decorators: list[tuple[str, int]]) -> Optional[Describe]:
+    """
+    Get a description of a class or function from its decorators.
+
+    Arguments:
+        decorators (list): code and line numbers of decorators in their order.
+
+    Returns:
+        An object and domain of the first `describe` decorator as `Describe` or `None` if there is none.
+    """
+    for code, line in decorators:
+        if 'describe' not in code:
+            continue
+
+        match = DESCRIBE_DECORATOR.fullmatch(code)
+
+        if match is not None:
+            return Describe(
+                domain=match.group('domain')[1:-1],
+                component=match.group('component')[1:-1],
+                layer=match.group('layer')[1:-1],
+            )
+
+        decorator = parse_statement(code=f'{code}\ndef function(): pass', line=line)
+        describe = get_describe(decorators=decorator.decorator_list)
+
+        if describe is not None:
+            return describe
+
+    return None
+
+
+def scan_intentions(code: str, line: int) -> list[TestCaseIntention]:
+    """
+    Get intentions of a with statement.
+
+    Arguments:
+        code (str): code of the with statement without indentation.
+        line (int): a number of the line the with statement starts on.
+
+    Returns:
+        Intentions the with statement enters as `list`.
+    """
+    match = INTENTION_WITH.match(code)
+
+    if match is None:
+        return get_with_intentions(with_node=parse_statement(code=code, line=line))
+
+    budgets = {'budget_ms': None, 'budget_bytes': None}
+
+    for budget_name, budget_value in INTENTION_BUDGET.findall(match.group('budgets')):
+        budgets[budget_name] = float(budget_value) if any(char in budget_value for char in '.eE') else int(budget_value)
+
+    return [
+        TestCaseIntention(
+            type=Intention(match.group('type')),
+            code_line=line + code.count('\n', 0, match.start('description')),
+            description=match.group('description')[1:-1],
+            budget_ms=budgets['budget_ms'],
+            budget_bytes=budgets['budget_bytes'],
+        ),
+    ]
+
+
+def scan_test_functions(content: Union[bytes, mmap.mmap]) -> Optional[list[TestFunction]]:
+    """
+    Scan described test functions of a test file without building its syntax tree.
+
+    Test functions are the same `iter_described_test_functions` gives for the parsed file. Unlike parsing, the scanner
+    does not check the syntax of code it does not look into, so files with syntax errors are reported only if the
+    error is in a construct the scanner cannot handle.
+
+    Arguments:
+        content (bytes): raw content of a test file.
+
+    Returns:
+        Described test functions as `list` or `None` if the file is to be parsed with `ast` instead.
+    """
+    try:
+        text = str(content, 'utf-8-sig')
+
+    except UnicodeDecodeError:
+        return None
+
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+
+        if '\r' in text:
+            return None
+
+    second_line_end = text.find('\n', text.find('\n') + 1)
+
+    if CODING_COOKIE.search(text, 0, len(text) if second_line_end == -1 else second_line_end) is not None:
+        return None
+
+    try:
+        return _scan_test_functions(text=text)
+
+    except ScannerFallbackError:
+        return None
+
+
+def _scan_test_function(
+    statement: str,
+    line: int,
+    class_block: Optional[tuple[str, int, Optional[Describe]]],
+    decorators: list[tuple[str, int]],
+) -> Optional[TestFunction]:
+    function_match = FUNCTION_HEADER.match(statement)
+
+    if function_match is None:
+        raise ScannerFallbackError
+
+    function_name = function_match.group(1)
+
+    if not is_test_function(name=function_name):
+        return None
+
+    if class_block is not None:
+        class_name, class_code_line, describe = class_block
+    else:
+        class_name, class_code_line, describe = None, None, scan_describe(decorators=decorators)
+
+    if describe is None:
+        return None
+
+    return TestFunction(
+        function_name=function_name,
+        function_code_line=line,
+        class_name=class_name,
+        class_code_line=class_code_line,
+        describe=describe,
+        intentions=[],
+    )
+
+
+def _scan_test_functions(text: str) -> list[TestFunction]:
+    test_functions = []
+    blocks = [(-1, MODULE_BLOCK, None)]
+    decorators = []
+
+    for start, end, line in split_logical_lines(text=text):
+        code = text[start:end].rstrip()
+        statement = code.lstrip(' ')
+
+        if not statement:
+            continue
+
+        if statement[0] in '\t\f':
+            raise ScannerFallbackError
+
+        indent = len(code) - len(statement)
+
+        while blocks[-1][0] >= indent:
+            blocks.pop()
+
+        block_indent, block_type, block = blocks[-1]
+
+        if statement[0] == '@':
+            if block_type in (MODULE_BLOCK, CLASS_BLOCK):
+                decorators.append((statement, line))
+
+            continue
+
+        keyword_match = STATEMENT_KEYWORD.match(statement)
+        keyword = None if keyword_match is None else keyword_match.group(1)
+
+        if keyword == 'class' and block_type in (MODULE_BLOCK, CLASS_BLOCK):
+            class_match = CLASS_HEADER.match(statement)
+
+            if class_match is None:
+                raise ScannerFallbackError
+
+            describe = scan_describe(decorators=decorators)
+            blocks.append((indent, CLASS_BLOCK, (class_match.group(1), line, describe)))
+
+        elif keyword == 'def' and block_type in (MODULE_BLOCK, CLASS_BLOCK):
+            test_function = _scan_test_function(
+                statement=statement,
+                line=line,
+                class_block=block if block_type == CLASS_BLOCK else None,
+                decorators=decorators,
+            )
+
+            if test_function is not None:
+                test_functions.append(test_function)
+
+            blocks.append((indent, FUNCTION_BLOCK if test_function else OTHER_BLOCK, test_function))
+
+        elif keyword == 'with' and block_type == FUNCTION_BLOCK:
+            block.intentions.extend(scan_intentions(code=statement, line=line))
+            blocks.append((indent, OTHER_BLOCK, None))
+
+        elif keyword in ('class', 'def', 'async') or statement.endswith(':'):
+            blocks.append((indent, OTHER_BLOCK, None))
+
+        decorators = []
+
+    return test_functions
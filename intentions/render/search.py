@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from intentions.enums import Intention
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+SEARCH_SCHEMA = """
+CREATE TABLE terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL,
+    inverse_document_frequency REAL NOT NULL
+);
+
+CREATE TABLE postings (
+    term_id INTEGER NOT NULL REFERENCES terms (id),
+    intention_id INTEGER NOT NULL REFERENCES intentions (id),
+    term_frequency INTEGER NOT NULL,
+    PRIMARY KEY (term_id, intention_id)
+) WITHOUT ROWID;
+"""
+
+SEARCH_INDEXES = """
+CREATE UNIQUE INDEX terms_term ON terms (term);
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndexBuilder:
+    """
+    Inverted index of intention descriptions builder implementation.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            connection (sqlite3.Connection): a connection to the intentions index being written.
+        """
+        self.connection = connection
+        self.connection.executescript(SEARCH_SCHEMA)
+
+        self.term_ids = {}
+        self.document_frequencies = Counter()
+        self.documents = 0
+
+    def add(self, intention_id: int, description: str) -> list[tuple[int, int, int]]:
+        """
+        Add an intention description to the index.
+
+        Arguments:
+            intention_id (int): an identifier of the intention.
+            description (str): a description of the intention.
+
+        Returns:
+            Postings of the description's terms to insert as `list`.
+        """
+        self.documents += 1
+
+        postings = []
+
+        for term, term_frequency in Counter(tokenize(text=description)).items():
+            term_id = self.term_ids.get(term)
+
+            if term_id is None:
+                term_id = len(self.term_ids) + 1
+                self.term_ids[term] = term_id
+
+            self.document_frequencies[term_id] += 1
+            postings.append((term_id, intention_id, term_frequency))
+
+        return postings
+
+    def finish(self) -> None:
+        """
+        Write terms with their inverse document frequencies once all descriptions are added.
+        """
+        self.connection.executemany(
+            'INSERT INTO terms (id, term, inverse_document_frequency) VALUES (?, ?, ?)',
+            (
+                (term_id, term, math.log(1 + self.documents / self.document_frequencies[term_id]))
+                for term, term_id in self.term_ids.items()
+            ),
+        )
+
+        self.connection.executescript(SEARCH_INDEXES)
+
+
+def search_test_case_ids(  # noqa: PLR0913
+    connection: sqlite3.Connection,
+    query: str,
+    intention_type: Optional[Intention] = None,
+    describe_conditions: str = '',
+    describe_parameters: Optional[list[str]] = None,
+    limit: int = 10,
+) -> list[tuple[int, float, list[int]]]:
+    """
+    Search test cases by descriptions of their intentions.
+
+    Test cases are ranked by a number of distinct query terms their intentions match first and by the sum of TF-IDF of
+    matched terms then. Only posting lists of the query terms are read.
+
+    Arguments:
+        connection (sqlite3.Connection): a connection to the intentions index.
+        query (str): a text to search.
+        intention_type (Intention): a type of intentions to search in, all intentions are searched by default.
+        describe_conditions (str): conditions on the `describes` table to filter test cases by.
+        describe_parameters (list): parameters of the conditions.
+        limit (int): a maximum number of test cases to return.
+
+    Returns:
+        Identifiers of found test cases with their scores and identifiers of matched intentions as `list`.
+    """
+    terms = sorted(set(tokenize(text=query)))
+
+    if not terms:
+        return []
+
+    conditions = [f'terms.term IN ({", ".join("?" * len(terms))})']
+    parameters = list(terms)
+
+    if intention_type is not None:
+        conditions.append('intentions.type = ?')
+        parameters.append(intention_type.value)
+
+    if describe_conditions:
+        conditions.append(describe_conditions)
+        parameters.extend(describe_parameters or [])
+
+    rows = connection.execute(
+        'SELECT '  # noqa: S608
+        '    intentions.test_case_id, '
+        '    COUNT(DISTINCT terms.id) AS matched_terms, '
+        '    SUM(postings.term_frequency * terms.inverse_document_frequency) AS score, '
+        '    GROUP_CONCAT(DISTINCT intentions.id) AS intention_ids '
+        'FROM terms '
+        'JOIN postings ON postings.term_id = terms.id '
+        'JOIN intentions ON intentions.id = postings.intention_id '
+        'JOIN test_cases ON test_cases.id = intentions.test_case_id '
+        'JOIN describes ON describes.id = test_cases.describe_id '
+        f'WHERE {" AND ".join(conditions)} '
+        'GROUP BY intentions.test_case_id '
+        'ORDER BY matched_terms DESC, score DESC, intentions.test_case_id '
+        'LIMIT ?',
+        [*parameters, limit],
+    )
+
+    return [
+        (test_case_id, score, sorted(int(intention_id) for intention_id in intention_ids.split(',')))
+        for test_case_id, _, score, intention_ids in rows
+    ]
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+from urllib.parse import quote
+
+from intentions.render.dto import ShardsSummary
+from intentions.render.encoders import (
+    COMPACT_JSON_SEPARATORS,
+    JSON_INDENT,
+    encode_components,
+    encode_layers,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+INTENTIONS_SHARDS_PATH = './.intentions/shards'
+MANIFEST_FILE_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def get_shard_path(domain: str, component: Optional[str] = None) -> str:
+    """
+    Get a path to a shard relative to the shards directory.
+
+    Names are percent-encoded, so any domain and component name makes a single safe file or directory name.
+
+    Arguments:
+        domain (str): a domain of the shard.
+        component (str): a component of the shard if shards are split by components.
+
+    Returns:
+        A path to the shard as `str`.
+    """
+    if component is None:
+        return f'{quote(domain, safe="")}.json'
+
+    return f'{quote(domain, safe="")}/{quote(component, safe="")}.json'
+
+
+def encode_shard(data: dict, *, compact: bool = False) -> bytes:
+    if compact:
+        return json.dumps(data, separators=COMPACT_JSON_SEPARATORS).encode()
+
+    return json.dumps(data, indent=JSON_INDENT).encode()
+
+
+def count_test_cases(layers: dict) -> int:
+    return sum(len(test_cases) for case_descriptions in layers.values() for test_cases in case_descriptions.values())
+
+
+def write_file_atomically(path: Path, content: bytes) -> None:
+    if not path.parent.exists():
+        path.parent.mkdir(parents=True)
+
+    temporary_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+
+    try:
+        temporary_path.write_bytes(content)
+        temporary_path.replace(path)
+
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
+def read_manifest(directory: str) -> Optional[dict]:
+    manifest_path = Path(directory) / MANIFEST_FILE_NAME
+
+    try:
+        manifest = json.loads(manifest_path.read_bytes())
+
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+
+    return manifest
+
+
+def remove_shard(shards_directory: Path, shard_path: str) -> None:
+    """
+    Remove a shard and the directory of its domain if it becomes empty.
+
+    Arguments:
+        shards_directory (Path): a path to a directory with shards.
+        shard_path (str): a path to the shard relative to the shards directory.
+    """
+    path = shards_directory / shard_path
+    path.unlink(missing_ok=True)
+
+    if path.parent == shards_directory:
+        return
+
+    try:
+        path.parent.rmdir()
+
+    except OSError:
+        return
+
+
+def save_intentions_shards(
+    storage: dict,
+    directory: str = INTENTIONS_SHARDS_PATH,
+    *,
+    compact: bool = False,
+    by_component: bool = False,
+) -> ShardsSummary:
+    """
+    Save test cases storage into one intentions JSON file per domain, or per domain and component, with a manifest.
+
+    A shard holds components of its domain, or layers of its component, in the same structure the intentions JSON file
+    does. The manifest lists each shard's domain, component, path, number of test cases and content hash. Shards whose
+    content hash is the same as in the previous manifest are not written again, and shards of domains and components
+    that are gone are removed along with directories of domains they leave empty. The manifest is written last, so it
+    never refers to shards that are not written yet.
+
+    Arguments:
+        storage (dict): test cases stored by domain, component, layer and case description, emptied while written.
+        directory (str): a path to a directory to write shards and the manifest to.
+        compact (bool): whether to write shards without indentation.
+        by_component (bool): whether to write a shard per domain and component instead of per domain.
+
+    Returns:
+        A number of written, unchanged and removed shards as `ShardsSummary`.
+    """
+    shards_directory = Path(directory)
+    summary = ShardsSummary()
+
+    previous_manifest = read_manifest(directory=directory)
+    previous_hashes = {}
+
+    if previous_manifest is not None:
+        previous_hashes = {shard['path']: shard['sha256'] for shard in previous_manifest['shards']}
+
+    shards = []
+
+    while storage:
+        domain = next(iter(storage))
+        components = storage.pop(domain)
+
+        if by_component:
+            shard_contents = [
+                (component, layers, encode_layers(layers=layers, compact=compact))
+                for component, layers in components.items()
+            ]
+        else:
+            shard_contents = [(None, None, encode_components(components=components, compact=compact))]
+
+        for component, layers, content in shard_contents:
+            shard_path = get_shard_path(domain=domain, component=component)
+            encoded_content = content.encode()
+            content_hash = hashlib.sha256(encoded_content).hexdigest()
+
+            if component is None:
+                test_cases = sum(count_test_cases(layers=component_layers) for component_layers in components.values())
+            else:
+                test_cases = count_test_cases(layers=layers)
+
+            if previous_hashes.get(shard_path) == content_hash and (shards_directory / shard_path).exists():
+                summary.unchanged += 1
+            else:
+                write_file_atomically(path=shards_directory / shard_path, content=encoded_content)
+                summary.written += 1
+
+            shards.append({
+                'domain': domain,
+                'component': component,
+                'path': shard_path,
+                'test_cases': test_cases,
+                'size': len(encoded_content),
+                'sha256': content_hash,
+            })
+
+    shard_paths = {shard['path'] for shard in shards}
+
+    for previous_shard_path in previous_hashes:
+        if previous_shard_path not in shard_paths:
+            remove_shard(shards_directory=shards_directory, shard_path=previous_shard_path)
+            summary.removed += 1
+
+    manifest = {'version': MANIFEST_VERSION, 'by_component': by_component, 'shards': shards}
+    write_file_atomically(path=shards_directory / MANIFEST_FILE_NAME, content=encode_shard(data=manifest))
+
+    return summary
+
+
+class IntentionsShards(Mapping):
+    """
+    Lazy loader of sharded intentions.
+
+    It is a read-only mapping of domains to their components that reads only the manifest on construction. A shard is
+    read the first time its domain, or its component, is accessed and is kept afterwards. Counts of test cases are
+    served from the manifest without reading shards at all.
+    """
+
+    def __init__(self, directory: str = INTENTIONS_SHARDS_PATH, *, verify: bool = False) -> None:
+        """
+        Construct the object.
+
+        Arguments:
+            directory (str): a path to a directory with shards and the manifest.
+            verify (bool): whether to check content hashes of shards when they are read.
+
+        Raises:
+            FileNotFoundError: if there is no valid manifest in the directory.
+        """
+        manifest = read_manifest(directory=directory)
+
+        if manifest is None:
+            message = f'There is no intentions shards manifest in {directory}.'
+            raise FileNotFoundError(message)
+
+        self.directory = Path(directory)
+        self.verify = verify
+        self.by_component = manifest['by_component']
+        self.shards: dict[str, dict[Optional[str], dict]] = {}
+        self.loaded_shards: dict[str, dict] = {}
+
+        for shard in manifest['shards']:
+            self.shards.setdefault(shard['domain'], {})[shard['component']] = shard
+
+    def __getitem__(self, domain: str) -> dict:
+        domain_shards = self.shards[domain]
+
+        if not self.by_component:
+            return self._load_shard(shard=domain_shards[None])
+
+        return {component: self._load_shard(shard=shard) for component, shard in domain_shards.items()}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.shards)
+
+    def __len__(self) -> int:
+        return len(self.shards)
+
+    def get_component(self, domain: str, component: str) -> dict:
+        """
+        Get layers of a component reading only the shard the component is in.
+
+        As for any mapping, `KeyError` is raised if there is no such domain or component.
+
+        Arguments:
+            domain (str): a domain of the component.
+            component (str): a component to get.
+
+        Returns:
+            Test cases of the component by layer and case description as `dict`.
+        """
+        if not self.by_component:
+            return self[domain][component]
+
+        return self._load_shard(shard=self.shards[domain][component])
+
+    def get_test_cases_count(self, domain: Optional[str] = None) -> int:
+        return sum(
+            shard['test_cases']
+            for shard_domain, domain_shards in self.shards.items()
+            if domain is None or shard_domain == domain
+            for shard in domain_shards.values()
+        )
+
+    def _load_shard(self, shard: dict) -> dict:
+        if shard['path'] in self.loaded_shards:
+            return self.loaded_shards[shard['path']]
+
+        content = (self.directory / shard['path']).read_bytes()
+
+        if self.verify and hashlib.sha256(content).hexdigest() != shard['sha256']:
+            message = f'Intentions shard {shard["path"]} does not match its hash in the manifest.'
+            raise ValueError(message)
+
+        self.loaded_shards[shard['path']] = json.loads(content)
+
+        return self.loaded_shards[shard['path']]
@@ -0,0 +1,429 @@
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from fnmatch import (
+    fnmatch,
+    translate,
+)
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+TEST_FILE_PATTERNS = ('test_*.py', '*_test.py')
+EXCLUDED_DIRECTORIES = (
+    '.git',
+    '.hg',
+    '.svn',
+    '.intentions',
+    '.venv',
+    '.tox',
+    '.nox',
+    'node_modules',
+    '__pycache__',
+    '.mypy_cache',
+    '.pytest_cache',
+    '.ruff_cache',
+    '*.egg-info',
+)
+ROOT_EXCLUDED_DIRECTORIES = (
+    'venv',
+    'build',
+    'dist',
+)
+GITIGNORE_FILE_NAME = '.gitignore'
+COMPILED_PATTERNS_CACHE_SIZE = 64
+
+
+@dataclass
+class WalkFilter:
+
+    patterns: tuple[str, ...] = TEST_FILE_PATTERNS
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    excluded_directories: tuple[str, ...] = EXCLUDED_DIRECTORIES
+    root_excluded_directories: tuple[str, ...] = ROOT_EXCLUDED_DIRECTORIES
+    gitignore: bool = False
+
+
+@dataclass
+class GitignoreRule:
+
+    base: str
+    pattern: str
+    negated: bool
+    directory_only: bool
+    anchored: bool
+
+
+@lru_cache(maxsize=COMPILED_PATTERNS_CACHE_SIZE)
+def compile_patterns(patterns: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile globs into a single regular expression.
+
+    Names of all walked entries are matched against the same few globs, so a single compiled expression is much
+    cheaper than matching each glob with `fnmatch` one by one.
+
+    Arguments:
+        patterns (tuple): globs to compile.
+
+    Returns:
+        A regular expression that matches any of the globs as `re.Pattern`.
+    """
+    if not patterns:
+        return re.compile(r'(?!)')
+
+    return re.compile('|'.join(f'(?:{translate(pattern)})' for pattern in patterns))
+
+
+def is_test_file_name(name: str, patterns: tuple[str, ...] = TEST_FILE_PATTERNS) -> bool:
+    return compile_patterns(patterns).match(name) is not None
+
+
+def matches_any(name: str, relative_path: str, patterns: tuple[str, ...]) -> bool:
+    return any(fnmatch(relative_path, pattern) or fnmatch(name, pattern) for pattern in patterns)
+
+
+def read_gitignore_rules(path: Path, base: str) -> list[GitignoreRule]:
+    """
+    Read rules of a `.gitignore` file.
+
+    Blank lines, comments, negations, directory only and anchored patterns are supported. Rules are scoped to the
+    directory the file is in.
+
+    Arguments:
+        path (Path): a path to the `.gitignore` file.
+        base (str): a path to the directory the file is in relative to the walked directory.
+
+    Returns:
+        Rules of the file as `list`, empty if the file does not exist.
+    """
+    try:
+        with open(path) as file:
+            lines = file.read().splitlines()
+
+    except OSError:
+        return []
+
+    rules = []
+
+    for line in lines:
+        pattern = line.rstrip()
+
+        if not pattern or pattern.startswith('#'):
+            continue
+
+        negated = pattern.startswith('!')
+        pattern = pattern[1:] if negated else pattern
+
+        directory_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+
+        if pattern.startswith('**/'):
+            pattern = pattern[3:]
+
+        anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+
+        if pattern:
+            rules.append(
+                GitignoreRule(
+                    base=base,
+                    pattern=pattern,
+                    negated=negated,
+                    directory_only=directory_only,
+                    anchored=anchored,
+                ),
+            )
+
+    return rules
+
+
+def is_ignored(rules: list[GitignoreRule], name: str, relative_path: str, *, is_directory: bool) -> bool:
+    """
+    Check whether a path is ignored by `.gitignore` rules.
+
+    As git does, the last matching rule wins, so negations re-include paths ignored by rules before them.
+
+    Arguments:
+        rules (list): rules of `.gitignore` files of the path's directory and its parents.
+        name (str): a name of the path.
+        relative_path (str): the path relative to the walked directory.
+        is_directory (bool): whether the path is a directory.
+
+    Returns:
+        Whether the path is ignored as `bool`.
+    """
+    ignored = False
+
+    for rule in rules:
+        if rule.directory_only and not is_directory:
+            continue
+
+        if rule.anchored:
+            rule_relative_path = relative_path[len(rule.base) + 1:] if rule.base else relative_path
+
+            if not fnmatch(rule_relative_path, rule.pattern):
+                continue
+
+        elif not fnmatch(name, rule.pattern):
+            continue
+
+        ignored = not rule.negated
+
+    return ignored
+
+
+def iter_test_files(directory: str, walk_filter: Optional[WalkFilter] = None) -> Iterator[Path]:
+    """
+    Iterate over test files of the directory.
+
+    Unlike `Path.rglob`, excluded and ignored directories are pruned before they are descended into, and `Path`
+    objects are created only for matched test files. Entries of each directory are walked sorted by their names, so test
+    files are always yielded in the same order. Symbolic links to directories are not followed.
+
+    Include and exclude globs are matched against both a name and a path relative to the directory.
+
+    Arguments:
+        directory (str): a path to a directory with test files.
+        walk_filter (WalkFilter): test file patterns, include and exclude globs, excluded directories and whether to
+            respect `.gitignore` files, pytest default test file patterns and common tooling directories by default.
+            Directories such as `build` are common names for packages of tests too, so they are excluded only right in
+            the walked directory.
+
+    Yields:
+        Paths to test files as `Path`.
+    """
+    if walk_filter is None:
+        walk_filter = WalkFilter()
+
+    yield from _walk_directory(path=directory, relative_directory='', walk_filter=walk_filter, gitignore_rules=[])
+
+
+def get_walk_order_key(file_path: str) -> tuple[str, ...]:
+    """
+    Get a key to sort paths to test files in the order they are walked in.
+
+    Entries of each directory are walked sorted by their names and directories are descended into in place, so paths
+    are walked in the order of their parts.
+
+    Arguments:
+        file_path (str): a path to a test file with `/` separators.
+
+    Returns:
+        Parts of the path as `tuple`.
+    """
+    return tuple(file_path.split('/'))
+
+
+def is_test_file(directory: str, path: Path, walk_filter: Optional[WalkFilter] = None) -> bool:
+    """
+    Check whether a path is a test file that is yielded by walking the directory.
+
+    It is useful to check a single changed file without walking the whole directory again.
+
+    Arguments:
+        directory (str): a path to a walked directory with test files.
+        path (Path): a path to check.
+        walk_filter (WalkFilter): which test files of the directory are walked.
+
+    Returns:
+        Whether the path is a test file of the directory as `bool`.
+    """
+    if walk_filter is None:
+        walk_filter = WalkFilter()
+
+    relative_path = os.path.relpath(path, directory).replace(os.sep, '/')
+
+    if relative_path.startswith('../') or relative_path in ('.', '..'):
+        return False
+
+    *directory_names, file_name = relative_path.split('/')
+
+    relative_directory = ''
+    gitignore_rules = []
+
+    for directory_name in directory_names:
+        gitignore_rules = _get_gitignore_rules(
+            path=Path(directory, relative_directory).as_posix(),
+            relative_directory=relative_directory,
+            walk_filter=walk_filter,
+            gitignore_rules=gitignore_rules,
+        )
+        relative_directory = f'{relative_directory}/{directory_name}' if relative_directory else directory_name
+
+        if not _is_directory_walked(
+            name=directory_name,
+            relative_path=relative_directory,
+            walk_filter=walk_filter,
+            gitignore_rules=gitignore_rules,
+        ):
+            return False
+
+    gitignore_rules = _get_gitignore_rules(
+        path=Path(directory, relative_directory).as_posix(),
+        relative_directory=relative_directory,
+        walk_filter=walk_filter,
+        gitignore_rules=gitignore_rules,
+    )
+
+    return _is_file_walked(
+        name=file_name,
+        relative_path=relative_path,
+        walk_filter=walk_filter,
+        gitignore_rules=gitignore_rules,
+    )
+
+
+def is_test_file_path(relative_path: str, walk_filter: Optional[WalkFilter] = None) -> bool:
+    """
+    Check whether a relative path is a test file that is walked without accessing the file system.
+
+    It is useful to filter paths that are not on the file system, for instance, paths of a git tree. `.gitignore`
+    files are not respected, as there is nothing to read them from.
+
+    Arguments:
+        relative_path (str): a path relative to a walked directory with `/` separators.
+        walk_filter (WalkFilter): which test files are walked.
+
+    Returns:
+        Whether the path is a walked test file as `bool`.
+    """
+    if walk_filter is None:
+        walk_filter = WalkFilter()
+
+    *directory_names, file_name = relative_path.split('/')
+    relative_directory = ''
+
+    for directory_name in directory_names:
+        relative_directory = f'{relative_directory}/{directory_name}' if relative_directory else directory_name
+
+        if not _is_directory_walked(
+            name=directory_name,
+            relative_path=relative_directory,
+            walk_filter=walk_filter,
+            gitignore_rules=[],
+        ):
+            return False
+
+    return _is_file_walked(name=file_name, relative_path=relative_path, walk_filter=walk_filter, gitignore_rules=[])
+
+
+def _get_gitignore_rules(
+    path: str,
+    relative_directory: str,
+    walk_filter: WalkFilter,
+    gitignore_rules: list[GitignoreRule],
+) -> list[GitignoreRule]:
+    if not walk_filter.gitignore:
+        return gitignore_rules
+
+    directory_gitignore_rules = read_gitignore_rules(
+        path=Path(path, GITIGNORE_FILE_NAME),
+        base=relative_directory,
+    )
+
+    if not directory_gitignore_rules:
+        return gitignore_rules
+
+    return gitignore_rules + directory_gitignore_rules
+
+
+def _is_directory_walked(
+    name: str,
+    relative_path: str,
+    walk_filter: WalkFilter,
+    gitignore_rules: list[GitignoreRule],
+) -> bool:
+    if compile_patterns(walk_filter.excluded_directories).match(name) is not None:
+        return False
+
+    if name == relative_path and compile_patterns(walk_filter.root_excluded_directories).match(name) is not None:
+        return False
+
+    if matches_any(name=name, relative_path=relative_path, patterns=walk_filter.exclude):
+        return False
+
+    return not (
+        gitignore_rules
+        and is_ignored(rules=gitignore_rules, name=name, relative_path=relative_path, is_directory=True)
+    )
+
+
+def _is_file_walked(
+    name: str,
+    relative_path: str,
+    walk_filter: WalkFilter,
+    gitignore_rules: list[GitignoreRule],
+) -> bool:
+    if not is_test_file_name(name=name, patterns=walk_filter.patterns):
+        return False
+
+    if matches_any(name=name, relative_path=relative_path, patterns=walk_filter.exclude):
+        return False
+
+    if walk_filter.include and not matches_any(name=name, relative_path=relative_path, patterns=walk_filter.include):
+        return False
+
+    return not (
+        gitignore_rules
+        and is_ignored(rules=gitignore_rules, name=name, relative_path=relative_path, is_directory=False)
+    )
+
+
+def _walk_directory(
+    path: str,
+    relative_directory: str,
+    walk_filter: WalkFilter,
+    gitignore_rules: list[GitignoreRule],
+) -> Iterator[Path]:
+    gitignore_rules = _get_gitignore_rules(
+        path=path,
+        relative_directory=relative_directory,
+        walk_filter=walk_filter,
+        gitignore_rules=gitignore_rules,
+    )
+
+    try:
+        with os.scandir(path) as directory_entries:
+            entries = sorted(directory_entries, key=lambda entry: entry.name)
+
+    except OSError:
+        return
+
+    for entry in entries:
+        relative_path = f'{relative_directory}/{entry.name}' if relative_directory else entry.name
+
+        if entry.is_dir(follow_symlinks=False):
+            if _is_directory_walked(
+                name=entry.name,
+                relative_path=relative_path,
+                walk_filter=walk_filter,
+                gitignore_rules=gitignore_rules,
+            ):
+                yield from _walk_directory(
+                    path=entry.path,
+                    relative_directory=relative_path,
+                    walk_filter=walk_filter,
+                    gitignore_rules=gitignore_rules,
+                )
+
+            continue
+
+        if not _is_file_walked(
+            name=entry.name,
+            relative_path=relative_path,
+            walk_filter=walk_filter,
+            gitignore_rules=gitignore_rules,
+        ):
+            continue
+
+        if entry.is_file():
+            yield Path(entry.path)
@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Optional,
+    Union,
+)
+
+from intentions.render.dto import RenderSummary
+from intentions.render.main import (
+    INTENTIONS_JSON_PATH,
+    collect_test_files,
+    extract_test_cases,
+    save_intentions_json,
+    store_test_cases,
+    summarize_file_test_cases,
+)
+from intentions.render.walker import (
+    WalkFilter,
+    compile_patterns,
+    get_walk_order_key,
+    is_test_file,
+)
+
+if TYPE_CHECKING:
+    import threading
+
+    from intentions.render.dto import FileTestCases
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o00004000
+IN_CLOEXEC = 0o02000000
+
+INOTIFY_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+INOTIFY_EVENT = struct.Struct('iIII')
+INOTIFY_READ_SIZE = 64 * 1024
+
+STOP_CHECK_INTERVAL = 0.5
+
+
+def is_excluded_directory(name: str, walk_filter: WalkFilter) -> bool:
+    return compile_patterns(walk_filter.excluded_directories).match(name) is not None
+
+
+def get_stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+
+    except FileNotFoundError:
+        return None
+
+
+class InotifyWatcher:
+    """
+    Test files watcher implementation based on Linux inotify.
+    """
+
+    def __init__(self, directory: str, walk_filter: Optional[WalkFilter] = None) -> None:
+        """
+        Construct the object.
+
+        Excluded directories are not watched.
+
+        Arguments:
+            directory (str): a path to a directory with test files to watch recursively.
+            walk_filter (WalkFilter): which test files of the directory to watch.
+
+        Raises:
+            OSError: if inotify is not available.
+        """
+        if not sys.platform.startswith('linux'):
+            raise OSError('inotify is available only on Linux.')
+
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.file_descriptor = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+
+        if self.file_descriptor < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed.')
+
+        self.directory = directory
+        self.walk_filter = walk_filter or WalkFilter()
+        self.directories = {}
+
+        self._add_watches(directory=Path(directory))
+
+    def wait(self, timeout: float) -> Optional[set[Path]]:
+        """
+        Wait for changes of test files.
+
+        Arguments:
+            timeout (float): a maximum number of seconds to wait for changes.
+
+        Returns:
+            Paths to changed test files as `set` or `None` if events are lost and all test files must be rescanned.
+        """
+        readable, _, _ = select.select([self.file_descriptor], [], [], timeout)
+
+        if not readable:
+            return set()
+
+        changed_paths = set()
+
+        try:
+            events = os.read(self.file_descriptor, INOTIFY_READ_SIZE)
+
+        except BlockingIOError:
+            return changed_paths
+
+        offset = 0
+
+        while offset < len(events):
+            watch_descriptor, mask, _, name_length = INOTIFY_EVENT.unpack_from(events, offset)
+            offset += INOTIFY_EVENT.size
+            name = os.fsdecode(events[offset:offset + name_length].rstrip(b'\0'))
+            offset += name_length
+
+            if mask & IN_Q_OVERFLOW:
+                return None
+
+            if mask & IN_IGNORED:
+                self.directories.pop(watch_descriptor, None)
+                continue
+
+            directory = self.directories.get(watch_descriptor)
+
+            if directory is None or not name:
+                continue
+
+            path = directory / name
+
+            if mask & IN_ISDIR:
+                if is_excluded_directory(name=name, walk_filter=self.walk_filter):
+                    continue
+
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    changed_paths.update(self._add_watches(directory=path))
+
+                if mask & (IN_DELETE | IN_MOVED_FROM):
+                    return None
+
+                continue
+
+            if is_test_file(directory=self.directory, path=path, walk_filter=self.walk_filter):
+                changed_paths.add(path)
+
+        return changed_paths
+
+    def close(self) -> None:
+        os.close(self.file_descriptor)
+
+    def _add_watch(self, directory: Path) -> None:
+        watch_descriptor = self.libc.inotify_add_watch(
+            self.file_descriptor,
+            os.fsencode(directory),
+            INOTIFY_WATCH_MASK,
+        )
+
+        if watch_descriptor >= 0:
+            self.directories[watch_descriptor] = directory
+
+    def _add_watches(self, directory: Path) -> set[Path]:
+        test_files = set()
+
+        for path, directory_names, file_names in os.walk(directory):
+            directory_names[:] = [
+                directory_name for directory_name in directory_names
+                if not is_excluded_directory(name=directory_name, walk_filter=self.walk_filter)
+            ]
+
+            self._add_watch(directory=Path(path))
+
+            for file_name in file_names:
+                test_file = Path(path) / file_name
+
+                if is_test_file(directory=self.directory, path=test_file, walk_filter=self.walk_filter):
+                    test_files.add(test_file)
+
+        return test_files
+
+
+class PollingWatcher:
+    """
+    Test files watcher implementation based on polling of modification times.
+    """
+
+    def __init__(self, directory: str, interval: float = 1.0, walk_filter: Optional[WalkFilter] = None) -> None:
+        """
+        Construct the object.
+
+        Only directories whose modification time changed are listed again on each poll to find added and deleted test
+        files, other directories cost a single `stat` call. Excluded directories are not polled.
+
+        Arguments:
+            directory (str): a path to a directory with test files to watch recursively.
+            interval (float): a number of seconds between polls.
+            walk_filter (WalkFilter): which test files of the directory to watch.
+        """
+        self.directory = directory
+        self.walk_filter = walk_filter or WalkFilter()
+        self.interval = interval
+        self.directories = {}
+        self.files = {}
+
+        self._scan_directory(directory=Path(directory))
+
+    def wait(self, timeout: float) -> set[Path]:
+        """
+        Wait for changes of test files.
+
+        Arguments:
+            timeout (float): a maximum number of seconds to wait for changes.
+
+        Returns:
+            Paths to changed test files as `set`.
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            changed_paths = self._poll()
+
+            if changed_paths:
+                return changed_paths
+
+            remaining_time = deadline - time.monotonic()
+
+            if remaining_time <= 0:
+                return changed_paths
+
+            time.sleep(min(self.interval, remaining_time))
+
+    def close(self) -> None:
+        return
+
+    def _poll(self) -> set[Path]:
+        changed_paths = set()
+
+        for directory, modification_time in list(self.directories.items()):
+            directory_stat = get_stat(path=directory)
+
+            if directory_stat is None:
+                del self.directories[directory]
+                continue
+
+            if directory_stat.st_mtime_ns != modification_time:
+                changed_paths.update(self._scan_directory(directory=directory))
+
+        for file, file_stat in list(self.files.items()):
+            current_file_stat = get_stat(path=file)
+
+            if current_file_stat is None:
+                del self.files[file]
+                changed_paths.add(file)
+                continue
+
+            if (current_file_stat.st_mtime_ns, current_file_stat.st_size) != file_stat:
+                self.files[file] = (current_file_stat.st_mtime_ns, current_file_stat.st_size)
+                changed_paths.add(file)
+
+        return changed_paths
+
+    def _scan_directory(self, directory: Path) -> set[Path]:
+        added_paths = set()
+
+        self.directories[directory] = directory.stat().st_mtime_ns
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                path = Path(entry.path)
+
+                if entry.is_dir(follow_symlinks=False):
+                    if is_excluded_directory(name=entry.name, walk_filter=self.walk_filter):
+                        continue
+
+                    if path not in self.directories:
+                        added_paths.update(self._scan_directory(directory=path))
+
+                    continue
+
+                if path in self.files:
+                    continue
+
+                if not is_test_file(directory=self.directory, path=path, walk_filter=self.walk_filter):
+                    continue
+
+                entry_stat = entry.stat()
+                self.files[path] = (entry_stat.st_mtime_ns, entry_stat.st_size)
+                added_paths.add(path)
+
+        return added_paths
+
+
+def create_watcher(
+    directory: str,
+    *,
+    polling: bool = False,
+    poll_interval: float = 1.0,
+    walk_filter: Optional[WalkFilter] = None,
+) -> Union[InotifyWatcher, PollingWatcher]:
+    """
+    Create a test files watcher.
+
+    Arguments:
+        directory (str): a path to a directory with test files to watch recursively.
+        polling (bool): whether to poll test files even if inotify is available.
+        poll_interval (float): a number of seconds between polls.
+        walk_filter (WalkFilter): which test files of the directory to watch.
+
+    Returns:
+        An inotify based watcher if it is available, polling watcher otherwise.
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(directory=directory, walk_filter=walk_filter)
+
+        except (OSError, AttributeError):
+            pass
+
+    return PollingWatcher(directory=directory, interval=poll_interval, walk_filter=walk_filter)
+
+
+def save_watched_intentions_json(
+    file_test_cases: dict[str, FileTestCases],
+    path: str,
+    *,
+    compact: bool,
+) -> RenderSummary:
+    storage = {}
+    summary = RenderSummary()
+
+    for watched_file_test_cases in file_test_cases.values():
+        if summarize_file_test_cases(summary=summary, file_test_cases=watched_file_test_cases):
+            store_test_cases(storage=storage, file_test_cases=watched_file_test_cases)
+
+    save_intentions_json(storage=storage, path=path, compact=compact)
+
+    return summary
+
+
+def update_file_test_cases(
+    file_test_cases: dict[str, FileTestCases],
+    changed_paths: set[Path],
+    *,
+    prefilter: bool,
+) -> dict[str, FileTestCases]:
+    """
+    Update test cases of changed test files.
+
+    Test files are kept in the order they are walked in, so added test files are put among the others rather than to
+    the end and the intentions JSON file is the same as a fresh render.
+
+    Arguments:
+        file_test_cases (dict): test cases of watched test files by their paths.
+        changed_paths (set): paths to changed test files, deleted ones are dropped.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+
+    Returns:
+        Test cases of watched test files by their paths as `dict`.
+    """
+    is_file_added = False
+
+    for changed_path in changed_paths:
+        file_path = changed_path.as_posix()
+
+        if not changed_path.is_file():
+            file_test_cases.pop(file_path, None)
+            continue
+
+        is_file_added = is_file_added or file_path not in file_test_cases
+        file_test_cases[file_path] = extract_test_cases(file_path=file_path, prefilter=prefilter)
+
+    if not is_file_added:
+        return file_test_cases
+
+    return dict(sorted(file_test_cases.items(), key=lambda item: get_walk_order_key(file_path=item[0])))
+
+
+def watch_intentions_json(  # noqa: PLR0913
+    directory: str,
+    path: str = INTENTIONS_JSON_PATH,
+    *,
+    compact: bool = False,
+    prefilter: bool = True,
+    debounce: float = 0.2,
+    polling: bool = False,
+    poll_interval: float = 1.0,
+    stop_event: Optional[threading.Event] = None,
+    on_update: Optional[Callable[[RenderSummary], None]] = None,
+    walk_filter: Optional[WalkFilter] = None,
+) -> None:
+    """
+    Keep the intentions JSON file up to date with test files of the directory.
+
+    Test cases of all test files are held in memory, so on each change only changed test files are parsed again.
+    Changes that come within the debounce interval of each other are applied together with a single write of the
+    intentions JSON file.
+
+    Arguments:
+        directory (str): a path to a directory with test files.
+        path (str): a path to the intentions JSON file.
+        compact (bool): whether to write the intentions JSON file without indentation.
+        prefilter (bool): whether to skip parsing files that do not mention `describe` and intentions at all.
+        debounce (float): a number of seconds without changes to wait for before the intentions JSON file is written.
+        polling (bool): whether to poll test files even if inotify is available.
+        poll_interval (float): a number of seconds between polls.
+        stop_event (threading.Event): an event to stop watching on, watching lasts until interrupted by default.
+        on_update (Callable): a function to call with a render summary each time the intentions JSON file is written.
+        walk_filter (WalkFilter): which test files of the directory to watch.
+    """
+    watcher = create_watcher(
+        directory=directory,
+        polling=polling,
+        poll_interval=poll_interval,
+        walk_filter=walk_filter,
+    )
+
+    try:
+        file_test_cases = {
+            test_file.as_posix(): extract_test_cases(file_path=test_file.as_posix(), prefilter=prefilter)
+            for test_file in collect_test_files(directory=directory, walk_filter=walk_filter)
+        }
+
+        summary = save_watched_intentions_json(file_test_cases=file_test_cases, path=path, compact=compact)
+
+        if on_update is not None:
+            on_update(summary)
+
+        while stop_event is None or not stop_event.is_set():
+            changed_paths = watcher.wait(timeout=STOP_CHECK_INTERVAL)
+
+            if changed_paths is not None and not changed_paths:
+                continue
+
+            while changed_paths is not None:
+                debounced_changed_paths = watcher.wait(timeout=debounce)
+
+                if debounced_changed_paths is None:
+                    changed_paths = None
+                    break
+
+                if not debounced_changed_paths:
+                    break
+
+                changed_paths.update(debounced_changed_paths)
+
+            if changed_paths is None:
+                changed_paths = {Path(file_path) for file_path in file_test_cases}
+                changed_paths.update(collect_test_files(directory=directory, walk_filter=walk_filter))
+
+            file_test_cases = update_file_test_cases(
+                file_test_cases=file_test_cases,
+                changed_paths=changed_paths,
+                prefilter=prefilter,
+            )
+
+            summary = save_watched_intentions_json(file_test_cases=file_test_cases, path=path, compact=compact)
+
+            if on_update is not None:
+                on_update(summary)
+
+    finally:
+        watcher.close()
@@ -30,7 +30,12 @@ setup(
     license='MIT',
     author='Dmytro Striletskyi',
     author_email='dmytro.striletskyi@gmail.com',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*', 'tests', 'tests.*']),
+    entry_points={
+        'pytest11': [
+            'intentions = intentions.plugin.main',
+        ],
+    },
     classifiers=[
         'Operating System :: OS Independent',
         'Intended Audience :: Developers',
@@ -1,6 +1,10 @@
 import os
+import shutil
+
 import pytest
 
+pytest_plugins = ['pytester']
+
 
 @pytest.fixture
 def remove_intentions_json():
@@ -10,3 +14,67 @@ def remove_intentions_json():
 
     if os.path.exists(intentions_json):
         os.remove(intentions_json)
+
+
+@pytest.fixture
+def remove_intentions_lines():
+    intentions_lines = './.intentions/intentions.jsonl'
+
+    yield intentions_lines
+
+    if os.path.exists(intentions_lines):
+        os.remove(intentions_lines)
+
+
+@pytest.fixture
+def remove_intentions_cache():
+    intentions_cache = './.intentions/.intentions.json.cache.json'
+
+    yield intentions_cache
+
+    if os.path.exists(intentions_cache):
+        os.remove(intentions_cache)
+
+
+@pytest.fixture
+def remove_intentions_index():
+    intentions_index = './.intentions/intentions.sqlite3'
+
+    yield intentions_index
+
+    if os.path.exists(intentions_index):
+        os.remove(intentions_index)
+
+
+@pytest.fixture
+def remove_intentions_shards():
+    intentions_shards = './.intentions/shards'
+
+    yield intentions_shards
+
+    if os.path.exists(intentions_shards):
+        shutil.rmtree(intentions_shards)
+
+
+@pytest.fixture
+def remove_intentions_git_cache():
+    intentions_git_cache = './.intentions/git-cache'
+
+    yield intentions_git_cache
+
+    if os.path.exists(intentions_git_cache):
+        shutil.rmtree(intentions_git_cache)
+
+
+@pytest.fixture
+def restore_budgets():
+    from intentions.main import (
+        configure_budgets,
+        get_budget_configuration,
+    )
+
+    policy, multiplier = get_budget_configuration()
+
+    yield
+
+    configure_budgets(policy=policy, multiplier=multiplier)
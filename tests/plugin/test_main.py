@@ -0,0 +1,641 @@
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import intentions.main
+from intentions.main import (
+    case,
+    expect,
+    when,
+)
+from intentions.plugin.durations import (
+    TestDescribes,
+    predict_makespan,
+)
+from intentions.render.main import (
+    create_intentions_index,
+    create_intentions_json,
+)
+
+TEST_FILE_FIXTURE_PATH = Path(__file__).parents[2] / 'fixtures' / 'test_file.py'
+
+
+class TestIntentionsRecorderPlugin:
+
+    def test_record_intentions(self, pytester) -> None:
+        with when('Tests folder with tests using intentions library exists'):
+            shutil.copy(TEST_FILE_FIXTURE_PATH, pytester.path / 'test_accounts_and_investments.py')
+
+        with when('Intentions JSON file is rendered from source code of the tests'):
+            create_intentions_json(directory='.')
+
+            with open('./.intentions/intentions.json', 'r') as intentions_json:
+                rendered_intentions_json = intentions_json.read()
+
+        with case('Run the tests recording their intentions'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-record')
+
+        with open('./.intentions/intentions.json', 'r') as intentions_json:
+            recorded_intentions_json = intentions_json.read()
+
+        with expect('Tests pass'):
+            result.assert_outcomes(passed=8)
+
+        with expect('Recorded intentions JSON file is the same as the rendered one'):
+            assert recorded_intentions_json == rendered_intentions_json
+
+    def test_record_intentions_with_static_fallback(self, pytester) -> None:
+        with when('Tests folder with tests using intentions library exists'):
+            shutil.copy(TEST_FILE_FIXTURE_PATH, pytester.path / 'test_accounts_and_investments.py')
+
+        with case('Run only accounts tests recording their intentions with static fallback'):
+            result = pytester.runpytest(
+                '-p', 'intentions.plugin.main',
+                '--intentions-record',
+                '--intentions-static=.',
+                '-k', 'transfer_money',
+            )
+
+        with open('./.intentions/intentions.json', 'r') as intentions_json:
+            intentions_json = json.load(intentions_json)
+
+        with expect('Only accounts tests run'):
+            result.assert_outcomes(passed=3, deselected=5)
+
+        with expect('Test cases that did not run are rendered from source code'):
+            assert len(intentions_json['investments']['investments']['service']['Invest money into stocks']) == 2
+
+    def test_record_intentions_of_multiline_with_statements(self, pytester) -> None:
+        with when('Tests folder with a test that spans its intention blocks over several lines exists'):
+            pytester.makepyfile(
+                test_accounts="""
+                    from intentions import case, describe, expect, when
+
+
+                    @describe(domain='accounts', component='accounts', layer='service')
+                    def test_transfer_money():
+                        with when(
+                            'Sender account is created',
+                        ):
+                            pass
+
+                        with case('Transfer money'), \\
+                                expect(
+                                    'Money is transferred',
+                                ):
+                            pass
+                """,
+            )
+
+        with when('Intentions JSON file is rendered from source code of the tests'):
+            create_intentions_json(directory='.')
+            rendered_intentions_json = (pytester.path / '.intentions' / 'intentions.json').read_text()
+
+        with case('Run the tests recording their intentions'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-record')
+
+        with expect('Tests pass'):
+            result.assert_outcomes(passed=1)
+
+        with expect('Recorded code lines of intentions are the same as the rendered ones'):
+            assert (pytester.path / '.intentions' / 'intentions.json').read_text() == rendered_intentions_json
+
+    def test_record_intentions_of_test_bodies_only(self, pytester) -> None:
+        with when('Tests folder with a test that enters intentions in a fixture, a helper and a nested block exists'):
+            pytester.makepyfile(
+                test_accounts="""
+                    import pytest
+
+                    from intentions import case, describe, expect, when
+
+
+                    @pytest.fixture
+                    def account():
+                        with when('Account fixture is created'):
+                            return 'account'
+
+
+                    def transfer_money(account):
+                        with case('Transfer money by the helper'):
+                            return account
+
+
+                    @describe(domain='accounts', component='accounts', layer='service')
+                    def test_transfer_money(account):
+                        with when('Sender account is created'):
+                            with when('Nested block is entered'):
+                                pass
+
+                        with case('Transfer money'):
+                            transfer_money(account=account)
+
+                        with expect('Money is transferred'):
+                            pass
+                """,
+            )
+
+        with when('Intentions JSON file is rendered from source code of the tests'):
+            create_intentions_json(directory='.')
+            rendered_intentions_json = (pytester.path / '.intentions' / 'intentions.json').read_text()
+
+        with case('Run the tests recording their intentions'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-record')
+
+        with expect('Tests pass'):
+            result.assert_outcomes(passed=1)
+
+        with expect('Only intentions of the test body are recorded as they are rendered'):
+            assert (pytester.path / '.intentions' / 'intentions.json').read_text() == rendered_intentions_json
+
+    def test_load_plugin_without_renderer(self) -> None:
+        with case('Load the plugin in a fresh interpreter'):
+            modules = subprocess.run(
+                [sys.executable, '-c', 'import sys, intentions.plugin.main; print(*sorted(sys.modules))'],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.split()
+
+        with expect('Neither the renderer nor its heavy dependencies are imported'):
+            assert 'intentions.plugin.main' in modules
+            assert 'intentions.render.main' not in modules
+            assert 'sqlite3' not in modules
+            assert 'concurrent.futures' not in modules
+
+
+class TestIntentionsTimerPlugin:
+
+    def test_report_slowest_intention_blocks(self, pytester) -> None:
+        with when('Tests folder with a test that has a slow arrange block exists'):
+            pytester.makepyfile(
+                test_slow_arrange="""
+                    import time
+
+                    from intentions import case, describe, expect, when
+
+
+                    @describe(domain='accounts', component='accounts', layer='service')
+                    def test_transfer_money():
+                        with when('Sender account is created slowly'):
+                            time.sleep(0.05)
+
+                        with case('Transfer money'):
+                            pass
+
+                        with expect('Money is transferred'):
+                            pass
+                """,
+            )
+
+        with case('Run the tests measuring time of intention blocks'):
+            result = pytester.runpytest(
+                '-p', 'intentions.plugin.main',
+                '--intentions-timing',
+                '--intentions-timing-top=1',
+            )
+
+        with expect('Tests pass'):
+            result.assert_outcomes(passed=1)
+
+        with expect('The slow arrange block is reported as the slowest one'):
+            result.stdout.re_match_lines([
+                r'.*intentions timing.*',
+                r'slowest 1 blocks \(wall / cpu\):',
+                r'\s+\d+\.\d+ms\s+\d+\.\d+ms  when   test_slow_arrange.py::test_transfer_money:8 '
+                r'Sender account is created slowly',
+            ])
+
+        with expect('Arrange time is reported per domain'):
+            result.stdout.re_match_lines([r'accounts: arrange (\d{2,})\.\d+ms / .*, act .*, assert .*'])
+
+
+class TestIntentionsMemoryPlugin:
+
+    def test_report_heaviest_intention_blocks(self, pytester) -> None:
+        with when('Tests folder with a test that has a memory heavy arrange block exists'):
+            pytester.makepyfile(
+                test_heavy_arrange="""
+                    from intentions import case, describe, expect, when
+
+
+                    @describe(domain='accounts', component='accounts', layer='service')
+                    def test_transfer_money():
+                        with when('Sender account history is loaded'):
+                            history = [str(index) * 10 for index in range(100000)]
+
+                        with when('Sender account is created'):
+                            account = {'history': history}
+
+                        with case('Transfer money'):
+                            pass
+
+                        with expect('Money is transferred'):
+                            assert account
+                """,
+            )
+
+        with case('Run the tests measuring memory of intention blocks'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-memory')
+
+        with open('./.intentions/memory.json', 'r') as memory_json:
+            memory_json = json.load(memory_json)
+
+        with expect('Tests pass'):
+            result.assert_outcomes(passed=1)
+
+        with expect('The memory heavy arrange block is ranked first and attributed to the test and its describe group'):
+            heaviest_block = memory_json[0]
+
+            assert heaviest_block['node_id'] == 'test_heavy_arrange.py::test_transfer_money'
+            assert heaviest_block['description'] == 'Sender account history is loaded'
+            assert heaviest_block['code_line'] == 6
+            assert (heaviest_block['domain'], heaviest_block['component'], heaviest_block['layer']) == (
+                'accounts',
+                'accounts',
+                'service',
+            )
+            assert heaviest_block['allocated_bytes'] > 1_000_000
+            assert heaviest_block['peak_bytes'] >= heaviest_block['allocated_bytes']
+
+        with expect('The heaviest blocks are reported'):
+            result.stdout.fnmatch_lines([
+                '*intentions memory*',
+                '*when   test_heavy_arrange.py::test_transfer_money:6*',
+            ])
+
+    def test_trace_only_sampled_intention_blocks(self, pytester) -> None:
+        with when('Tests folder with a test that checks whether its blocks are traced exists'):
+            pytester.makepyfile(
+                test_sampled_blocks="""
+                    import tracemalloc
+
+                    from intentions import case, describe, expect, when
+
+
+                    @describe(domain='accounts', component='accounts', layer='service')
+                    def test_transfer_money():
+                        assert not tracemalloc.is_tracing()
+
+                        with when('Sender account is created'):
+                            assert not tracemalloc.is_tracing()
+
+                        with case('Transfer money'):
+                            assert tracemalloc.is_tracing()
+
+                        with expect('Money is transferred'):
+                            assert not tracemalloc.is_tracing()
+
+                        assert not tracemalloc.is_tracing()
+                """,
+            )
+
+        with case('Run the tests measuring memory of each second intention block'):
+            result = pytester.runpytest(
+                '-p', 'intentions.plugin.main',
+                '--intentions-memory',
+                '--intentions-memory-sample-rate=2',
+            )
+
+        with open('./.intentions/memory.json', 'r') as memory_json:
+            memory_json = json.load(memory_json)
+
+        with expect('Allocations are traced only within the sampled block'):
+            result.assert_outcomes(passed=1)
+
+        with expect('Only the sampled block is reported'):
+            assert [block['description'] for block in memory_json] == ['Transfer money']
+
+
+class TestIntentionsBudgetPlugin:
+
+    def test_report_exceeded_budgets(self, pytester) -> None:
+        with when('Tests folder with a test that exceeds a time budget exists'):
+            pytester.makepyfile(
+                test_slow_act="""
+                    import time
+
+                    from intentions import case, describe, expect, when
+
+
+                    @describe(domain='accounts', component='accounts', layer='service')
+                    def test_transfer_money():
+                        with case('Transfer money', budget_ms=1):
+                            time.sleep(0.01)
+                """,
+            )
+
+        with case('Run the tests only recording exceeded budgets'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-budget-policy', 'record')
+
+        with expect('Tests pass'):
+            result.assert_outcomes(passed=1)
+
+        with expect('The block that exceeded its budget is reported'):
+            result.stdout.fnmatch_lines([
+                '*intentions budgets*',
+                '1 blocks exceeded their budgets:',
+                "case('Transfer money') at *test_slow_act.py:8 exceeds its budget: took *ms of 1.00ms.",
+            ])
+
+        with case('Run the tests with the default fail policy'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main')
+
+        with expect('Test fails'):
+            result.assert_outcomes(failed=1)
+
+        with expect('Budgets are not reported without budget options'):
+            result.stdout.no_fnmatch_line('*intentions budgets*')
+
+    def test_configure_budgets_by_environment_variables(self, pytester, monkeypatch) -> None:
+        with when('Tests folder with a test that exceeds a time budget exists'):
+            pytester.makepyfile(
+                test_slow_act="""
+                    import time
+
+                    from intentions import case, describe, expect, when
+
+
+                    @describe(domain='accounts', component='accounts', layer='service')
+                    def test_transfer_money():
+                        with case('Transfer money', budget_ms=1):
+                            time.sleep(0.01)
+                """,
+            )
+
+        with when('Budget policy environment variable is to warn and budgets are not configured yet'):
+            monkeypatch.setenv('INTENTIONS_BUDGET_POLICY', 'warn')
+            monkeypatch.setattr(intentions.main, 'budget_policy', None)
+
+        with case('Run the tests'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main')
+
+        with expect('Test passes and the block that exceeded its budget is reported'):
+            result.assert_outcomes(passed=1, warnings=1)
+            result.stdout.fnmatch_lines(['*intentions budgets*', '1 blocks exceeded their budgets:'])
+
+        with when('Budget policy environment variable is not valid and budgets are not configured yet'):
+            monkeypatch.setenv('INTENTIONS_BUDGET_POLICY', 'warning')
+            monkeypatch.setattr(intentions.main, 'budget_policy', None)
+
+        with case('Run the tests'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main')
+
+        with expect('Usage error tells the variable'):
+            assert result.ret == pytest.ExitCode.USAGE_ERROR
+            result.stderr.fnmatch_lines(['*INTENTIONS_BUDGET_POLICY must be one of fail, warn, record*'])
+
+
+class TestIntentionsTracerPlugin:
+
+    def test_trace_intention_blocks(self, pytester) -> None:
+        with when('Tests folder with tests using intentions library exists'):
+            shutil.copy(TEST_FILE_FIXTURE_PATH, pytester.path / 'test_accounts_and_investments.py')
+
+        with case('Run the tests tracing their intention blocks'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-trace')
+
+        with open('./.intentions/trace.json', 'r') as trace_json:
+            trace_json = json.load(trace_json)
+
+        with expect('Tests pass'):
+            result.assert_outcomes(passed=8)
+
+        with expect('The process is named in the trace'):
+            process_name_event = trace_json['traceEvents'][0]
+
+            assert process_name_event['ph'] == 'M'
+            assert process_name_event['args'] == {'name': 'controller'}
+
+        with expect('Each test case and its intention blocks are complete events nested in time'):
+            events = trace_json['traceEvents'][1:]
+            test_events = [event for event in events if event['cat'] == 'test']
+            block_events = [event for event in events if event['cat'] in ('when', 'case', 'expect')]
+
+            assert len(test_events) == 8
+            assert len(block_events) == len(events) - 8
+            assert trace_json['otherData'] == {'recorded_events': len(events), 'kept_events': len(events)}
+
+            block_event = block_events[0]
+            test_event = next(
+                event for event in test_events if event['args']['node_id'] == block_event['args']['node_id']
+            )
+
+            assert test_event['ts'] <= block_event['ts']
+            assert block_event['ts'] + block_event['dur'] <= test_event['ts'] + test_event['dur']
+
+        with expect('Events carry the process, thread and description of the test case'):
+            assert {event['pid'] for event in events} == {process_name_event['pid']}
+            assert all(isinstance(event['tid'], int) for event in events)
+            assert {(event['args'].get('domain'), event['args'].get('layer')) for event in events} == {
+                ('accounts', 'service'),
+                ('investments', 'service'),
+                (None, None),
+            }
+
+
+ACCOUNTS_TEST_FILE = """
+    from intentions import case, describe, expect, when
+
+
+    @describe(domain='accounts', component='accounts', layer='service')
+    def test_transfer_money():
+        with when('Sender account is created'):
+            pass
+
+        with case('Transfer money'):
+            pass
+
+        with expect('Money is transferred'):
+            pass
+
+
+    def test_helper():
+        pass
+"""
+
+INVESTMENTS_TEST_FILE = """
+    from intentions import case, describe, expect, when
+
+    raise RuntimeError('Investments tests must not be imported')
+
+
+    @describe(domain='investments', component='investments', layer='service')
+    def test_invest_money():
+        with case('Invest money into stocks'):
+            pass
+"""
+
+
+DOMAINS_TEST_FILE = """
+    from intentions import describe, when
+
+
+    @describe(domain='accounts', component='accounts', layer='service')
+    def test_open_account():
+        with when('Account is opened'):
+            pass
+
+
+    @describe(domain='investments', component='investments', layer='service')
+    def test_invest_money():
+        with when('Money is invested'):
+            pass
+"""
+
+
+class TestIntentionsSelectionPlugin:
+
+    def test_select_test_files_by_static_extraction(self, pytester) -> None:
+        with when('Tests folder with tests of accounts and investments domains exists'):
+            pytester.makepyfile(test_accounts=ACCOUNTS_TEST_FILE, test_investments=INVESTMENTS_TEST_FILE)
+
+        with case('Run only tests of accounts domain'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-domain=accounts')
+
+        with expect('Test file of investments domain is not imported and undescribed tests are deselected'):
+            result.assert_outcomes(passed=1, deselected=1)
+            result.stdout.fnmatch_lines(['intentions: 1 test files not collected, 0 unknown test files collected'])
+
+        with expect('Extracted test cases are cached for the next run'):
+            assert (pytester.path / '.intentions' / 'selection-cache.json').exists()
+
+    def test_select_described_tests_without_intention_blocks(self, pytester) -> None:
+        with when('Tests folder with a described test of accounts domain without intention blocks exists'):
+            pytester.makepyfile(
+                test_accounts="""
+                    from intentions import describe
+
+
+                    @describe(domain='accounts', component='accounts', layer='service')
+                    def test_open_account():
+                        assert True
+                """,
+            )
+
+        with case('Run only tests of accounts domain'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-domain=accounts')
+
+        with expect('Test file without extracted test cases is collected and its described test runs'):
+            result.assert_outcomes(passed=1)
+            result.stdout.fnmatch_lines(['intentions: 0 test files not collected, 1 unknown test files collected'])
+
+    def test_select_test_files_by_index(self, pytester) -> None:
+        with when('Intentions index of tests of accounts and investments domains exists'):
+            pytester.makepyfile(test_accounts=ACCOUNTS_TEST_FILE, test_investments=INVESTMENTS_TEST_FILE)
+            create_intentions_index(directory='.')
+
+        with when('Test file of accounts domain is added after the index is built'):
+            pytester.makepyfile(test_new_accounts=ACCOUNTS_TEST_FILE)
+
+        with case('Run only tests of accounts service layer by the index'):
+            result = pytester.runpytest(
+                '-p', 'intentions.plugin.main',
+                '--intentions-component=accounts',
+                '--intentions-layer=service',
+                '--intentions-index=./.intentions/intentions.sqlite3',
+            )
+
+        with expect('Test file unknown to the index is collected and narrowed down by descriptions of its tests'):
+            result.assert_outcomes(passed=2, deselected=2)
+            result.stdout.fnmatch_lines(['intentions: 1 test files not collected, 1 unknown test files collected'])
+
+
+class TestIntentionsSchedulingPlugin:
+
+    def test_record_durations(self, pytester) -> None:
+        with when('Tests folder with tests of accounts domain exists'):
+            pytester.makepyfile(test_accounts=ACCOUNTS_TEST_FILE)
+
+        with case('Run the tests with scheduling by descriptions'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-dist')
+
+        with open('./.intentions/durations.json', 'r') as durations_json:
+            durations_json = json.load(durations_json)
+
+        with expect('Tests pass'):
+            result.assert_outcomes(passed=2)
+
+        with expect('Durations of the tests are recorded for the next run'):
+            assert sorted(durations_json) == ['test_accounts.py::test_helper', 'test_accounts.py::test_transfer_money']
+            assert all(duration >= 0 for duration in durations_json.values())
+
+    def test_forget_durations_of_removed_tests(self, pytester) -> None:
+        with when('Durations of tests are recorded'):
+            pytester.makepyfile(test_accounts=ACCOUNTS_TEST_FILE)
+            pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-dist')
+
+        with when('A test is removed'):
+            pytester.makepyfile(test_accounts=ACCOUNTS_TEST_FILE.replace('def test_helper', 'def _helper'))
+
+        with case('Run the tests again'):
+            pytester.runpytest('-p', 'intentions.plugin.main', '--intentions-dist')
+
+        with open('./.intentions/durations.json', 'r') as durations_json:
+            durations_json = json.load(durations_json)
+
+        with expect('Only durations of collected tests are kept'):
+            assert sorted(durations_json) == ['test_accounts.py::test_transfer_money']
+
+    def test_distribute_tests_grouped_by_describe(self, pytester) -> None:
+        pytest.importorskip('xdist')
+
+        with when('Tests of accounts and investments domains are spread over two test files'):
+            pytester.makepyfile(
+                test_first=DOMAINS_TEST_FILE,
+                test_second=DOMAINS_TEST_FILE.replace('def test_', 'def test_other_'),
+            )
+
+        with case('Run the tests on two workers with scheduling by descriptions'):
+            result = pytester.runpytest('-p', 'intentions.plugin.main', '-n', '2', '--intentions-dist', '-v')
+
+        with expect('Tests pass'):
+            result.assert_outcomes(passed=4)
+
+        with expect('Tests of the same describe run on the same worker regardless of their test files'):
+            workers = {}
+
+            for line in result.outlines:
+                match = re.search(r'\[(gw\d+)\].* PASSED (\S+)', line)
+
+                if match is not None:
+                    workers[match.group(2)] = match.group(1)
+
+            assert workers['test_first.py::test_open_account'] == workers['test_second.py::test_other_open_account']
+            assert workers['test_first.py::test_invest_money'] == workers['test_second.py::test_other_invest_money']
+            assert workers['test_first.py::test_open_account'] != workers['test_first.py::test_invest_money']
+
+        with expect('The scheduling is summarized'):
+            result.stdout.fnmatch_lines([
+                '*intentions scheduling*',
+                '2 groups of tests on 2 workers, longest processing time first',
+                'makespan: predicted *s, actual *s',
+            ])
+
+    def test_describe_tests_without_importing_them(self, pytester) -> None:
+        with when('Tests folder with tests of investments domain that must not be imported exists'):
+            pytester.makepyfile(test_investments=INVESTMENTS_TEST_FILE)
+
+        with when('Test descriptions are known relative to the folder'):
+            test_describes = TestDescribes(root_directory=str(pytester.path))
+
+        with case('Describe a parametrized test and a test that is not described'):
+            describe = test_describes.get_describe(node_id='test_investments.py::test_invest_money[stocks]')
+            undescribed = test_describes.get_describe(node_id='test_investments.py::test_helper')
+
+        with expect('Described test is grouped by its domain, component and layer'):
+            assert (describe.domain, describe.component, describe.layer) == ('investments', 'investments', 'service')
+
+        with expect('Test that is not described has no description'):
+            assert undescribed is None
+
+    def test_predict_makespan(self) -> None:
+        with case('Predict a makespan of groups scheduled longest first onto two workers'):
+            makespan = predict_makespan(durations=[2, 3, 2, 3, 2], workers=2)
+
+        with expect('The busiest worker runs the longest group and two of the shortest ones'):
+            assert makespan == 7
@@ -0,0 +1,120 @@
+import json
+import shutil
+
+from intentions.main import (
+    case,
+    expect,
+    when,
+)
+from intentions.render.__main__ import main
+from intentions.render.diff import diff_renders
+from intentions.render.main import (
+    create_intentions_json,
+    load_intentions_json,
+)
+
+
+class TestRendersDiff:
+
+    def test_diff_renders(self, tmp_path, remove_intentions_json) -> None:
+        with when('Intentions of tests folder are rendered'):
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'test_file.py')
+            create_intentions_json(directory=tmp_path.as_posix())
+            old_storage = load_intentions_json()
+
+        with when('A test is added on top of the file, a test is renamed, an intention is reworded and one is moved'):
+            test_file = tmp_path / 'test_file.py'
+            test_file.write_text(
+                test_file.read_text()
+                .replace(
+                    '\n\n@describe(',
+                    "\n\n@describe(domain='accounts', component='accounts', layer='service')\n"
+                    'def test_open_account():\n'
+                    "    with expect('Account is opened'):\n"
+                    '        pass\n\n\n@describe(',
+                    1,
+                )
+                .replace('to_non_existing_receiver_account', 'to_missing_receiver')
+                .replace('Invest money into stocks', 'Buy stocks')
+                .replace("        with expect('No transfers", "\n        with expect('No transfers"),
+            )
+
+            create_intentions_json(directory=tmp_path.as_posix())
+            new_storage = load_intentions_json()
+
+        with case('Diff renders'):
+            renders_diff = diff_renders(old_storage=old_storage, new_storage=new_storage)
+
+        with expect('Test cases shifted by the added test are not reported as changed'):
+            assert renders_diff['summary'] == {
+                'added_test_cases': 2,
+                'removed_test_cases': 1,
+                'changed_test_cases': 3,
+                'added_intentions': 0,
+                'removed_intentions': 0,
+                'moved_intentions': 1,
+                'reworded_intentions': 2,
+            }
+
+        with expect('Added and removed test cases are grouped by their describe'):
+            accounts_diff = renders_diff['groups']['accounts']['accounts']['service']
+
+            assert [test_case['function_name'] for test_case in accounts_diff['added_test_cases']] == [
+                'test_open_account',
+                'test_transfer_money_to_missing_receiver',
+            ]
+            assert [test_case['function_name'] for test_case in accounts_diff['removed_test_cases']] == [
+                'test_transfer_money_to_non_existing_receiver_account',
+            ]
+
+        with expect('Moved intention keeps its description and has its old and new code lines'):
+            moved_intention, = accounts_diff['changed_test_cases'][0]['moved_intentions']
+
+            assert moved_intention['description'] == 'No transfers have been made'
+            assert moved_intention['new_code_line'] - moved_intention['old_code_line'] == 7
+
+        with expect('Reworded intentions have their old and new descriptions'):
+            investments_diff = renders_diff['groups']['investments']['investments']['service']
+
+            for test_case_diff in investments_diff['changed_test_cases']:
+                reworded_intention, = test_case_diff['reworded_intentions']
+
+                assert reworded_intention['type'] == 'case'
+                assert reworded_intention['old_description'] == 'Invest money into stocks'
+                assert reworded_intention['new_description'] == 'Buy stocks'
+
+    def test_diff_renders_command(self, tmp_path, remove_intentions_json) -> None:
+        with when('Tests folder with tests with and without case descriptions exists'):
+            tests_folder_path = tmp_path / 'tests'
+            tests_folder_path.mkdir()
+            shutil.copy('./fixtures/test_file.py', tests_folder_path / 'test_file.py')
+            (tests_folder_path / 'test_payments.py').write_text(
+                'from intentions import describe, when\n'
+                '\n'
+                "@describe(domain='payments', component='payments', layer='service')\n"
+                'def test_pay():\n'
+                "    with when('Payment is made'):\n"
+                '        pass\n',
+            )
+
+        with when('Intentions of tests folder are rendered into both intentions JSON formats'):
+            create_intentions_json(directory=tests_folder_path.as_posix())
+            shutil.copy('./.intentions/intentions.json', tmp_path / 'old.json')
+
+            create_intentions_json(directory=tests_folder_path.as_posix(), tables=True)
+            shutil.copy('./.intentions/intentions.json', tmp_path / 'new.json')
+
+        with case('Diff renders from the command line'):
+            main([
+                'diff',
+                (tmp_path / 'old.json').as_posix(),
+                (tmp_path / 'new.json').as_posix(),
+                '--output',
+                (tmp_path / 'diff.json').as_posix(),
+            ])
+
+        with expect('There are no changes between the same renders of different formats'):
+            renders_diff = json.loads((tmp_path / 'diff.json').read_text())
+
+            assert not any(renders_diff['summary'].values())
+            assert renders_diff['groups'] == {}
@@ -0,0 +1,133 @@
+import os
+import shutil
+import subprocess
+
+from intentions.main import (
+    case,
+    expect,
+    when,
+)
+from intentions.render.cache import BlobRenderCache
+from intentions.render.dto import FileTestCases
+from intentions.render.git import (
+    GitBlobReader,
+    create_intentions_json_from_git,
+    iter_git_test_files,
+)
+from intentions.render.main import (
+    create_intentions_json,
+    load_intentions_json,
+)
+
+
+def run_git(repository, *arguments) -> str:
+    return subprocess.run(
+        ['git', '-C', str(repository), '-c', 'user.name=test', '-c', 'user.email=test@example.com', *arguments],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+class TestGitRender:
+
+    def test_create_intentions_json_from_git(
+        self,
+        tmp_path,
+        remove_intentions_json,
+        remove_intentions_git_cache,
+    ) -> None:
+        with when('A git repository has two revisions of a test file and a file that is not a test one'):
+            run_git(tmp_path, 'init', '--quiet')
+            (tmp_path / 'tests').mkdir()
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'tests' / 'test_file.py')
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'tests' / 'helpers.py')
+            run_git(tmp_path, 'add', '.')
+            run_git(tmp_path, 'commit', '--quiet', '-m', 'Add tests')
+            first_revision = run_git(tmp_path, 'rev-parse', 'HEAD')
+
+            test_file = tmp_path / 'tests' / 'test_file.py'
+            test_file.write_text(test_file.read_text().replace('Invest money into stocks', 'Buy stocks'))
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'tests' / 'test_other_file.py')
+            run_git(tmp_path, 'add', '.')
+            run_git(tmp_path, 'commit', '--quiet', '-m', 'Change tests')
+
+        with expect('Only test files of the revision are listed with their blobs'):
+            test_files = list(iter_git_test_files(revision=first_revision, repository=tmp_path.as_posix()))
+
+            assert [file_path for file_path, _ in test_files] == ['tests/test_file.py']
+
+            with GitBlobReader(repository=tmp_path.as_posix()) as blob_reader:
+                assert blob_reader.read(blob_sha=test_files[0][1]) == open('./fixtures/test_file.py', 'rb').read()
+
+        with case('Render both revisions without checking them out'):
+            first_summary = create_intentions_json_from_git(
+                revision=first_revision,
+                repository=tmp_path.as_posix(),
+                directory='tests',
+                cache=True,
+            )
+            first_storage = load_intentions_json()
+
+            second_summary = create_intentions_json_from_git(
+                revision='HEAD',
+                repository=tmp_path.as_posix(),
+                directory='tests',
+                cache=True,
+            )
+            second_storage = load_intentions_json()
+
+        with expect('Blobs already parsed in another revision or path are served from the cache'):
+            assert (first_summary.cache_hits, first_summary.cache_misses) == (0, 1)
+            assert (second_summary.cache_hits, second_summary.cache_misses) == (1, 1)
+            assert second_summary.test_cases == 12
+
+        with expect('The render of a revision is the same as the render of its checkout'):
+            create_intentions_json(directory='./fixtures')
+            fixtures_storage = load_intentions_json()
+
+            for domain in fixtures_storage.values():
+                for component in domain.values():
+                    for layer in component.values():
+                        for test_cases in layer.values():
+                            for test_case in test_cases:
+                                test_case['file_path'] = 'tests/test_file.py'
+
+            assert first_storage == fixtures_storage
+            assert 'Buy stocks' in second_storage['investments']['investments']['service']
+
+    def test_list_test_files_with_non_utf8_names(self, tmp_path) -> None:
+        with when('A git repository has a test file whose name is not valid UTF-8'):
+            run_git(tmp_path, 'init', '--quiet')
+            test_file_path = os.path.join(os.fsencode(tmp_path), b'test_\xff.py')
+            shutil.copy('./fixtures/test_file.py', test_file_path)
+            run_git(tmp_path, 'add', '.')
+            run_git(tmp_path, 'commit', '--quiet', '-m', 'Add tests')
+
+        with case('List test files of the revision'):
+            test_files = list(iter_git_test_files(revision='HEAD', repository=tmp_path.as_posix()))
+
+        with expect('The test file is listed by its file system path'):
+            assert [file_path for file_path, _ in test_files] == [os.fsdecode(b'test_\xff.py')]
+
+    def test_evict_least_recently_used_blobs(self, tmp_path) -> None:
+        with when('Blobs of the same bucket are cached and the first one is used again'):
+            blob_cache = BlobRenderCache(path=tmp_path.as_posix(), bucket_size=2)
+
+            for blob_sha in ('aa01', 'aa02'):
+                blob_cache.set(blob_sha=blob_sha, file_test_cases=FileTestCases(file_path='test_file.py'))
+
+            blob_cache.get(blob_sha='aa01', file_path='test_file.py')
+            blob_cache.set(blob_sha='aa03', file_test_cases=FileTestCases(file_path='test_file.py'))
+
+        with case('Save the cache and read it again'):
+            blob_cache.save()
+            blob_cache = BlobRenderCache(path=tmp_path.as_posix(), bucket_size=2)
+
+        with expect('Only the most recently used blobs of the bucket are kept'):
+            assert blob_cache.get(blob_sha='aa02', file_path='test_file.py') is None
+            assert blob_cache.get(blob_sha='aa01', file_path='test_file.py') is not None
+            assert blob_cache.get(blob_sha='aa03', file_path='test_file.py') is not None
+
+        with expect('Each bucket is a file and no temporary files are left behind'):
+            assert [path.name for path in tmp_path.iterdir()] == ['aa.json']
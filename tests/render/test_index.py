@@ -0,0 +1,151 @@
+import json
+
+import pytest
+
+from intentions.enums import Intention
+from intentions.main import (
+    case,
+    expect,
+    when,
+)
+from intentions.render.encoders import convert_test_case_to_dict
+from intentions.render.index import (
+    IntentionsIndex,
+    write_intentions_index,
+)
+from intentions.render.main import (
+    create_intentions_index,
+    create_intentions_json,
+)
+
+
+class TestIntentionsIndex:
+
+    def test_get_test_cases_by_domain_and_layer(self, remove_intentions_index) -> None:
+        with when('Intentions index of tests folder with tests using intentions library exists'):
+            create_intentions_index(directory='./fixtures')
+
+        with case('Get test cases of investments domain service layer'):
+            with IntentionsIndex() as intentions_index:
+                test_cases = list(intentions_index.get_test_cases(domain='investments', layer='service'))
+
+        with expect('Only investments test cases are returned in the order they are declared'):
+            assert [test_case.test_case.function_name for test_case in test_cases] == [
+                'test_invest_money_into_stocks',
+                'test_invest_money_into_crypto',
+                'test_invest_into_non_existing_stocks',
+            ]
+
+        with expect('Test cases are returned with their intentions'):
+            assert convert_test_case_to_dict(test_case=test_cases[2].test_case) == {
+                'file_path': 'fixtures/test_file.py',
+                'class_name': None,
+                'class_code_line': None,
+                'case_name': 'Invest into non existing stocks',
+                'function_name': 'test_invest_into_non_existing_stocks',
+                'function_code_line': 64,
+                'intentions': [
+                    {'type': 'when', 'code_line': 65, 'description': 'Stock to buy does not exist'},
+                    {'type': 'case', 'code_line': 68, 'description': 'Invest money into stocks'},
+                    {'type': 'expect', 'code_line': 71, 'description': 'Stock does not exist error is raised'},
+                ],
+            }
+
+    def test_get_test_cases_same_as_intentions_json(self, remove_intentions_index, remove_intentions_json) -> None:
+        with when('Intentions index and JSON file of tests folder with tests using intentions library exist'):
+            create_intentions_index(directory='./fixtures')
+            create_intentions_json(directory='./fixtures')
+
+            with open('./.intentions/intentions.json', 'r') as intentions_json:
+                intentions_json = json.load(intentions_json)
+
+        with case('Get all test cases'):
+            with IntentionsIndex() as intentions_index:
+                test_cases = list(intentions_index.get_test_cases())
+                describes = intentions_index.get_describes()
+
+        with expect('Index has the same test cases as intentions JSON file'):
+            storage = {}
+
+            for test_case in test_cases:
+                describe = test_case.describe
+                storage.setdefault(describe.domain, {}).setdefault(describe.component, {}).setdefault(
+                    describe.layer, {},
+                ).setdefault(test_case.case_description, []).append(convert_test_case_to_dict(test_case=test_case.test_case))
+
+            assert storage == intentions_json
+
+        with expect('Index has descriptions of both domains'):
+            assert [describe.domain for describe in describes] == ['accounts', 'investments']
+
+    def test_search(self, remove_intentions_index) -> None:
+        with when('Searchable intentions index of tests folder with tests using intentions library exists'):
+            create_intentions_index(directory='./fixtures', search=True)
+
+        with case('Search test cases by words of their intentions'):
+            with IntentionsIndex() as intentions_index:
+                search_results = intentions_index.search(query='Receiver account does not exist')
+
+        with expect('Test case matching all words is ranked first'):
+            assert search_results[0].described_test_case.test_case.function_name == (
+                'test_transfer_money_to_non_existing_receiver_account'
+            )
+
+        with expect('Matched intentions of the test case are returned'):
+            assert [intention.description for intention in search_results[0].intentions] == [
+                'Receiver account does not exist',
+                'Transfer money from one sender to receiver',
+                'Receiver account does not exist error is raised',
+            ]
+
+    def test_search_by_intention_type_and_domain(self, remove_intentions_index) -> None:
+        with when('Searchable intentions index of tests folder with tests using intentions library exists'):
+            create_intentions_index(directory='./fixtures', search=True)
+
+        with case('Search test cases by words of their expect intentions in investments domain'):
+            with IntentionsIndex() as intentions_index:
+                search_results = intentions_index.search(
+                    query='does not exist',
+                    intention_type=Intention.EXPECT,
+                    domain='investments',
+                )
+
+        with expect('Only investments test case with matching expect intention is found'):
+            assert len(search_results) == 1
+            assert search_results[0].described_test_case.describe.domain == 'investments'
+            assert [
+                (intention.type, intention.code_line, intention.description)
+                for intention in search_results[0].intentions
+            ] == [
+                (Intention.EXPECT, 71, 'Stock does not exist error is raised'),
+            ]
+
+    def test_search_without_search_index(self, remove_intentions_index) -> None:
+        with when('Intentions index is built without search'):
+            create_intentions_index(directory='./fixtures')
+
+        with case('Search test cases'):
+            with IntentionsIndex() as intentions_index, pytest.raises(ValueError) as error:
+                intentions_index.search(query='Receiver account')
+
+        with expect('Error that the index is not searchable is raised'):
+            assert str(error.value) == 'Intentions index is built without search.'
+
+    def test_keep_index_when_build_fails(self, tmp_path) -> None:
+        with when('Intentions index is built'):
+            index_path = (tmp_path / 'intentions.sqlite3').as_posix()
+            create_intentions_index(directory='./fixtures', path=index_path)
+
+        with when('Rendering of test cases fails'):
+            def iter_failing_file_test_cases():
+                raise RuntimeError('Rendering failed.')
+                yield
+
+        with case('Build the intentions index again'), pytest.raises(RuntimeError):
+            write_intentions_index(file_test_cases=iter_failing_file_test_cases(), path=index_path)
+
+        with expect('The previous index is kept and no temporary file is left behind'):
+            assert [path.name for path in tmp_path.iterdir()] == ['intentions.sqlite3']
+
+            with IntentionsIndex(path=index_path) as intentions_index:
+                assert list(intentions_index.get_test_cases(domain='accounts'))
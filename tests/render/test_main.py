@@ -1,11 +1,17 @@
 import json
+import shutil
 
 from intentions.main import (
     case,
     expect,
     when,
 )
-from intentions.render.main import create_intentions_json
+from intentions.render.main import (
+    create_intentions_json,
+    create_intentions_lines,
+    iter_test_cases,
+    load_intentions_json,
+)
 
 
 class TestRender:
@@ -234,3 +240,275 @@ class TestRender:
 
             for test_case in intentions_json['investments']['investments']['service'].values():
                 assert expected_test_case not in test_case
+
+    def test_create_intentions_json_in_parallel(self, remove_intentions_json) -> None:
+        with when('Tests folder with tests using intentions library exists'):
+            path_to_tests_folder = './fixtures'
+
+        with when('Intentions JSON file is created serially'):
+            create_intentions_json(directory=path_to_tests_folder)
+
+            with open('./.intentions/intentions.json', 'r') as intentions_json:
+                serial_intentions_json = intentions_json.read()
+
+        with case('Create intentions JSON file with a process pool'):
+            create_intentions_json(directory=path_to_tests_folder, workers=2)
+
+        with open('./.intentions/intentions.json', 'r') as intentions_json:
+            parallel_intentions_json = intentions_json.read()
+
+        with expect('Intentions JSON file is the same as the one created serially'):
+            assert parallel_intentions_json == serial_intentions_json
+
+    def test_create_intentions_json_with_syntax_error(self, tmp_path, remove_intentions_json) -> None:
+        with when('Tests folder with a test file that has a syntax error exists'):
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'test_file.py')
+            (tmp_path / 'test_broken.py').write_text(
+                "@describe(domain='accounts', component='accounts', layer='service')\n"
+                'def test_broken(:\n'
+                "    with when('Broken test case'):\n"
+                '        pass\n',
+            )
+
+        with case('Create intentions JSON file'):
+            summary = create_intentions_json(directory=tmp_path.as_posix(), workers=2)
+
+        with open('./.intentions/intentions.json', 'r') as intentions_json:
+            intentions_json = json.load(intentions_json)
+
+        with expect('The file with a syntax error is reported'):
+            assert summary.files == 2
+            assert len(summary.errors) == 1
+            assert summary.errors[0].file_path == (tmp_path / 'test_broken.py').as_posix()
+            assert summary.errors[0].code_line == 2
+
+        with expect('Test cases of other files are rendered'):
+            assert intentions_json['accounts']['accounts']['service']
+
+    def test_create_intentions_json_with_cache(self, tmp_path, remove_intentions_json, remove_intentions_cache) -> None:
+        with when('Tests folder with test files exists'):
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'test_file.py')
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'test_other_file.py')
+
+        with when('Intentions JSON file is created with an empty cache'):
+            first_summary = create_intentions_json(directory=tmp_path.as_posix(), cache=True)
+
+            with open('./.intentions/intentions.json', 'r') as intentions_json:
+                first_intentions_json = intentions_json.read()
+
+        with when('One of test files is modified'):
+            test_other_file = tmp_path / 'test_other_file.py'
+            test_other_file.write_text(test_other_file.read_text() + '\n')
+
+        with case('Create intentions JSON file with the cache'):
+            second_summary = create_intentions_json(directory=tmp_path.as_posix(), cache=True)
+
+        with open('./.intentions/intentions.json', 'r') as intentions_json:
+            second_intentions_json = intentions_json.read()
+
+        with expect('All test files are parsed with an empty cache'):
+            assert first_summary.cache_hits == 0
+            assert first_summary.cache_misses == 2
+
+        with expect('Only the modified test file is parsed with the cache'):
+            assert second_summary.cache_hits == 1
+            assert second_summary.cache_misses == 1
+
+        with expect('Intentions JSON file is the same as the one created without the cache'):
+            assert second_intentions_json == first_intentions_json
+
+    def test_create_intentions_json_with_cache_per_output(self, tmp_path) -> None:
+        with when('Two tests folders with test files exist'):
+            (tmp_path / 'accounts').mkdir()
+            (tmp_path / 'investments').mkdir()
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'accounts' / 'test_file.py')
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'investments' / 'test_file.py')
+
+        with when('Intentions JSON files of both folders are created with the cache one after another'):
+            for folder in ('accounts', 'investments'):
+                create_intentions_json(
+                    directory=(tmp_path / folder).as_posix(),
+                    path=(tmp_path / f'{folder}.json').as_posix(),
+                    cache=True,
+                )
+
+        with case('Create intentions JSON file of the first folder with the cache again'):
+            summary = create_intentions_json(
+                directory=(tmp_path / 'accounts').as_posix(),
+                path=(tmp_path / 'accounts.json').as_posix(),
+                cache=True,
+            )
+
+        with expect('The cache is stored next to the intentions JSON file'):
+            assert (tmp_path / '.accounts.json.cache.json').exists()
+
+        with expect('Test files are served from the cache the other folder did not evict'):
+            assert summary.cache_hits == 1
+            assert summary.cache_misses == 0
+
+    def test_create_intentions_json_with_cache_of_other_prefilter(self, tmp_path) -> None:
+        with when('Tests folder with a broken test file that does not use intentions exists'):
+            (tmp_path / 'tests').mkdir()
+            (tmp_path / 'tests' / 'test_broken.py').write_text('def test_sum(:\n    pass\n')
+            intentions_json_path = (tmp_path / 'intentions.json').as_posix()
+
+        with when('Intentions JSON file is created with the cache skipping the file by the prefilter'):
+            create_intentions_json(directory=(tmp_path / 'tests').as_posix(), path=intentions_json_path, cache=True)
+
+        with case('Create intentions JSON file with the cache without the prefilter'):
+            summary = create_intentions_json(
+                directory=(tmp_path / 'tests').as_posix(),
+                path=intentions_json_path,
+                cache=True,
+                prefilter=False,
+            )
+
+        with expect('The file is parsed instead of being served as skipped from the cache'):
+            assert summary.cache_hits == 0
+            assert summary.skipped_files == 0
+            assert len(summary.errors) == 1
+
+    def test_create_intentions_json_compact(self, remove_intentions_json) -> None:
+        with when('Tests folder with tests using intentions library exists'):
+            path_to_tests_folder = './fixtures'
+
+        with when('Intentions JSON file is created with indentation'):
+            create_intentions_json(directory=path_to_tests_folder)
+
+            with open('./.intentions/intentions.json', 'r') as intentions_json:
+                indented_intentions_json = intentions_json.read()
+
+        with case('Create compact intentions JSON file'):
+            create_intentions_json(directory=path_to_tests_folder, compact=True)
+
+        with open('./.intentions/intentions.json', 'r') as intentions_json:
+            compact_intentions_json = intentions_json.read()
+
+        with expect('Compact intentions JSON file has no indentation'):
+            assert '\n' not in compact_intentions_json
+            assert len(compact_intentions_json) < len(indented_intentions_json)
+
+        with expect('Compact intentions JSON file has the same content as the indented one'):
+            assert json.loads(compact_intentions_json) == json.loads(indented_intentions_json)
+
+    def test_create_intentions_json_skip_files_without_intentions(self, tmp_path, remove_intentions_json) -> None:
+        with when('Tests folder with a test file that does not use intentions exists'):
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'test_file.py')
+            (tmp_path / 'test_plain.py').write_text('def test_sum():\n    assert 4 == 2 + 2\n')
+
+        with case('Create intentions JSON file'):
+            summary = create_intentions_json(directory=tmp_path.as_posix())
+
+        with expect('The test file that does not use intentions is skipped without parsing'):
+            assert summary.files == 2
+            assert summary.skipped_files == 1
+            assert summary.test_cases == 6
+
+    def test_create_intentions_json_with_budgets(self, tmp_path, remove_intentions_json) -> None:
+        with when('Tests folder with a test file that gives budgets to intentions exists'):
+            (tmp_path / 'test_budgets.py').write_text(
+                'from intentions import case, describe, expect, when\n'
+                '\n'
+                '\n'
+                "@describe(domain='accounts', component='accounts', layer='service')\n"
+                'def test_transfer_money():\n'
+                "    with when('Sender account is created', budget_bytes=1024):\n"
+                '        pass\n'
+                '\n'
+                "    with case('Transfer money', budget_ms=50):\n"
+                '        pass\n'
+                '\n'
+                "    with expect('Money is transferred'):\n"
+                '        pass\n',
+            )
+
+        with case('Create intentions JSON file'):
+            create_intentions_json(directory=tmp_path.as_posix())
+
+        with open('./.intentions/intentions.json', 'r') as intentions_json:
+            intentions_json = json.load(intentions_json)
+
+        with expect('Budgets are rendered next to intentions that give them only'):
+            test_case = intentions_json['accounts']['accounts']['service']['Transfer money'][0]
+
+            assert test_case['intentions'] == [
+                {'type': 'when', 'code_line': 6, 'description': 'Sender account is created', 'budget_bytes': 1024},
+                {'type': 'case', 'code_line': 9, 'description': 'Transfer money', 'budget_ms': 50},
+                {'type': 'expect', 'code_line': 12, 'description': 'Money is transferred'},
+            ]
+
+    def test_create_intentions_json_with_string_tables(self, tmp_path, remove_intentions_json) -> None:
+        with when('Tests folder with tests with and without case descriptions exists'):
+            shutil.copy('./fixtures/test_file.py', tmp_path / 'test_file.py')
+            (tmp_path / 'test_payments.py').write_text(
+                'from intentions import describe, when\n'
+                '\n'
+                "@describe(domain='payments', component='payments', layer='service')\n"
+                'def test_pay():\n'
+                "    with when('Payment is made'):\n"
+                '        pass\n',
+            )
+
+        with when('Intentions JSON file of the tests folder exists'):
+            create_intentions_json(directory=tmp_path.as_posix())
+            intentions_json = load_intentions_json()
+
+        with case('Create intentions JSON file with string tables'):
+            create_intentions_json(directory=tmp_path.as_posix(), tables=True)
+
+        with open('./.intentions/intentions.json', 'r') as intentions_tables_json:
+            intentions_tables_json = json.load(intentions_tables_json)
+
+        with expect('Each string is stored once'):
+            assert intentions_tables_json['strings'].count((tmp_path / 'test_file.py').as_posix()) == 1
+            assert intentions_tables_json['strings'].count('Invest money into stocks') == 1
+            assert len(intentions_tables_json['test_cases']) == 7
+
+        with expect('Intentions JSON file with string tables is expanded to the same structure'):
+            expanded_intentions_json = load_intentions_json()
+
+            assert json.dumps(expanded_intentions_json) == json.dumps(intentions_json)
+            assert expanded_intentions_json['payments']['payments']['service']['null'][0]['function_name'] == 'test_pay'
+
+        with expect('Strings of expanded test cases are held in memory once'):
+            first_test_case, second_test_case = expanded_intentions_json['accounts']['accounts']['service'][
+                'Transfer money from one sender to receiver'
+            ][:2]
+
+            assert first_test_case['file_path'] is second_test_case['file_path']
+
+    def test_create_intentions_lines(self, remove_intentions_json, remove_intentions_lines) -> None:
+        with when('Intentions JSON file of tests folder with tests using intentions library exists'):
+            create_intentions_json(directory='./fixtures')
+            intentions_json = load_intentions_json()
+
+        with case('Create intentions JSON Lines file'):
+            summary = create_intentions_lines(directory='./fixtures')
+
+        with open('./.intentions/intentions.jsonl', 'r') as intentions_lines:
+            lines = intentions_lines.read().splitlines()
+
+        with expect('Each test case is written on its own line'):
+            assert len(lines) == summary.test_cases == 6
+            assert json.loads(lines[0])['domain'] == 'accounts'
+
+        with expect('Intentions JSON Lines file is grouped to the same structure'):
+            assert load_intentions_json(path='./.intentions/intentions.jsonl') == intentions_json
+
+    def test_iter_test_cases(self) -> None:
+        with when('Tests folder with tests using intentions library exists'):
+            path_to_tests_folder = './fixtures'
+
+        with case('Iterate over test cases of tests folder'):
+            described_test_cases = iter_test_cases(directory=path_to_tests_folder)
+
+        with expect('Test cases are rendered lazily as they are consumed'):
+            first_described_test_case = next(described_test_cases)
+
+            assert first_described_test_case.describe.domain == 'accounts'
+            assert len(list(described_test_cases)) == 5
+
+        with expect('Test cases do not have instance dictionaries'):
+            assert not hasattr(first_described_test_case, '__dict__')
+            assert not hasattr(first_described_test_case.test_case, '__dict__')
+            assert not hasattr(first_described_test_case.test_case.intentions[0], '__dict__')
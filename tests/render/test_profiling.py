@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+from intentions.main import (
+    case,
+    expect,
+    when,
+)
+from intentions.render.main import create_intentions_json
+from intentions.render.profiling import (
+    RenderProfiler,
+    save_render_profile,
+)
+
+
+class TestRenderProfiler:
+
+    def test_create_intentions_json_with_profiler(self, remove_intentions_json, tmp_path) -> None:
+        with when('Tests folder with a test file without intentions exists'):
+            (tmp_path / 'tests').mkdir()
+            (tmp_path / 'tests' / 'test_plain.py').write_text('def test_plain():\n    pass\n')
+            (tmp_path / 'tests' / 'test_file.py').write_text(Path('./fixtures/test_file.py').read_text())
+
+        with when('Profiler forwards profiles to a hook'):
+            profiles = []
+            profiler = RenderProfiler(slowest_files=1, on_profile=profiles.append)
+
+        with case('Create intentions JSON file with the profiler'):
+            summary = create_intentions_json(directory=(tmp_path / 'tests').as_posix(), profiler=profiler)
+
+        with expect('Profile of the render is given to the hook and the summary'):
+            assert profiles == [summary.profile]
+
+        with expect('Files, bytes, nodes and test cases are counted'):
+            profile = summary.profile
+
+            assert (profile.files, profile.skipped_files, profile.cached_files) == (2, 1, 0)
+            assert profile.test_cases == summary.test_cases == 6
+            assert profile.bytes_read > 0
+            assert profile.nodes > 0
+
+        with expect('Each phase of the render is measured'):
+            assert list(profile.phases) == ['walk', 'read', 'prefilter', 'parse', 'extract', 'store', 'write']
+            assert sum(profile.phases.values()) <= profile.elapsed
+
+        with expect('Only the slowest parsed file is kept'):
+            assert [file_profile.file_path for file_profile in profile.slowest_files] == [
+                (tmp_path / 'tests' / 'test_file.py').as_posix(),
+            ]
+
+        with expect('Profile is saved as JSON'):
+            save_render_profile(profile=profile, path=(tmp_path / 'profile.json').as_posix())
+            profile_json = json.loads((tmp_path / 'profile.json').read_text())
+
+            assert profile_json['test_cases'] == 6
+            assert profile_json['slowest_files'][0]['nodes'] == profile.slowest_files[0].nodes
+
+    def test_create_intentions_json_without_profiler(self, remove_intentions_json) -> None:
+        with case('Create intentions JSON file without a profiler'):
+            summary = create_intentions_json(directory='./fixtures')
+
+        with expect('Render is not profiled'):
+            assert summary.profile is None
@@ -0,0 +1,235 @@
+import pytest
+
+from benchmarks.generator import generate_test_tree
+from intentions.main import (
+    case,
+    expect,
+    when,
+)
+from intentions.render.enums import ExtractionEngine
+from intentions.render.main import (
+    create_intentions_json,
+    extract_test_cases,
+)
+from intentions.render.scanner import scan_test_functions
+
+TRICKY_TEST_FILE = '''
+"""
+Module docstring.
+def test_in_docstring():
+"""
+from intentions import (
+    case,
+    describe,
+    expect,
+    when,
+)
+
+QUERY = """
+@describe(domain='strings', component='strings', layer='strings')
+class TestInString:
+"""
+
+
+def decorator(function):
+    return function
+
+
+@decorator
+@describe(  # A comment inside the decorator.
+    domain='accounts',
+    component="accounts",
+    layer='service',
+)
+def test_multiline_describe():
+    with when(
+        'Description is on the next line'
+    ):
+        pass
+
+    with case('Intentions with budgets', budget_ms=1.5, budget_bytes=1_024):  # A comment after the header.
+        pass
+
+    with expect('Implicit ' 'concatenation'), open(__file__):
+        value = (
+"""
+    with when('Not an intention of a string'):
+"""
+        )
+
+    if value:
+        with when('Nested intention is not extracted'):
+            pass
+
+    with when('One-liner'): pass
+
+
+@describe(domain="accounts", component='accounts', layer='service')
+class TestAccounts:
+
+    @staticmethod
+    def test_static():
+        with when("Double quoted"):
+            pass
+
+    async def test_async(self):
+        with when('Async test is not extracted'):
+            pass
+
+    @describe(domain='accounts', component='nested', layer='service')
+    class TestNested:
+
+        def test_nested(self):
+            with case(r'Raw \\d string', budget_ms=-1):
+                pass
+
+    def helper(self):
+        with when('Helper is not a test'):
+            pass
+
+    def test_after_nested(self): \\
+            pass
+
+
+if True:
+    @describe(domain='accounts', component='accounts', layer='service')
+    def test_in_if_block():
+        with when('Test in if block is not extracted'):
+            pass
+
+
+@describe(domain=u'investments', component='investments', layer='service')
+def test_unicode_prefix():
+    with expect('Prefixed describe is parsed with ast'):
+        pass
+'''
+
+
+class TestScanner:
+
+    @pytest.mark.parametrize('engine', [ExtractionEngine.AST, ExtractionEngine.SCANNER])
+    def test_extract_tricky_test_file(self, tmp_path, engine) -> None:
+        with when('A test file has constructs the scanner handles only with help of ast'):
+            test_file = tmp_path / 'test_tricky.py'
+            test_file.write_text(TRICKY_TEST_FILE)
+
+        with case('Extract test cases of the file'):
+            file_test_cases = extract_test_cases(file_path=test_file.as_posix(), engine=engine)
+
+        with expect('Only intentions right in bodies of described test functions are extracted'):
+            assert file_test_cases.error is None
+            assert [
+                (described_test_case.test_case.function_name, described_test_case.test_case.class_name)
+                for described_test_case in file_test_cases.test_cases
+            ] == [
+                ('test_multiline_describe', None),
+                ('test_static', 'TestAccounts'),
+                ('test_nested', 'TestNested'),
+                ('test_unicode_prefix', None),
+            ]
+
+            intentions = file_test_cases.test_cases[0].test_case.intentions
+
+            assert [(intention.code_line, intention.description) for intention in intentions] == [
+                (31, 'Description is on the next line'),
+                (35, 'Intentions with budgets'),
+                (38, 'Implicit concatenation'),
+                (49, 'One-liner'),
+            ]
+            assert (intentions[1].budget_ms, intentions[1].budget_bytes) == (1.5, 1024)
+
+    def test_scanner_conforms_to_ast(self, tmp_path) -> None:
+        with when('There are fixtures, a tricky test file and a generated tree of test files'):
+            (tmp_path / 'test_tricky.py').write_text(TRICKY_TEST_FILE)
+            test_files = [*generate_test_tree(directory=tmp_path.as_posix(), files=50, intentions_per_test=4)]
+            test_files.extend((tmp_path / 'test_tricky.py', './fixtures/test_file.py'))
+
+        with case('Extract test cases of each file with both engines'):
+            results = [
+                (
+                    extract_test_cases(file_path=str(test_file), engine=ExtractionEngine.AST),
+                    extract_test_cases(file_path=str(test_file), engine=ExtractionEngine.SCANNER),
+                )
+                for test_file in test_files
+            ]
+
+        with expect('Both engines extract the same test cases'):
+            for ast_file_test_cases, scanner_file_test_cases in results:
+                assert ast_file_test_cases == scanner_file_test_cases
+
+        with expect('The scanner handles test files on its own without falling back to ast'):
+            for test_file in test_files:
+                with open(test_file, 'rb') as file:
+                    assert scan_test_functions(content=file.read()) is not None
+
+    def test_scanner_falls_back_to_ast(self, tmp_path) -> None:
+        with when('A test file has a syntax error'):
+            test_file = tmp_path / 'test_broken.py'
+            test_file.write_text(
+                "from intentions import describe, when\n\n@describe(\ndef test_broken():\n    when('x')\n",
+            )
+
+        with case('Extract test cases of the file with the scanner'):
+            file_test_cases = extract_test_cases(file_path=test_file.as_posix(), engine=ExtractionEngine.SCANNER)
+
+        with expect('The file is parsed with ast that reports the error'):
+            assert scan_test_functions(content=test_file.read_bytes()) is None
+            assert file_test_cases.error is not None
+            assert file_test_cases.error.code_line == 3
+
+    def test_scanner_skips_syntax_errors_it_does_not_look_into(self, tmp_path) -> None:
+        with when('A test file has a syntax error out of describe decorators and intention with statements'):
+            test_file = tmp_path / 'test_broken.py'
+            test_file.write_text(
+                'from intentions import describe, when\n'
+                '\n'
+                "@describe(domain='accounts', component='accounts', layer='service')\n"
+                'def test_close_account():\n'
+                "    with when('Account is closed'):\n"
+                '        retur x y\n',
+            )
+
+        with case('Extract test cases of the file with both engines'):
+            ast_file_test_cases = extract_test_cases(file_path=test_file.as_posix(), engine=ExtractionEngine.AST)
+            scanner_file_test_cases = extract_test_cases(
+                file_path=test_file.as_posix(),
+                engine=ExtractionEngine.SCANNER,
+            )
+
+        with expect('Only ast reports the error, the scanner renders the test case'):
+            assert ast_file_test_cases.error is not None
+            assert scanner_file_test_cases.error is None
+            assert len(scanner_file_test_cases.test_cases) == 1
+
+    def test_cache_test_cases_per_engine(self, tmp_path) -> None:
+        with when('Tests folder with a test file that has a syntax error only ast reports exists'):
+            (tmp_path / 'tests').mkdir()
+            (tmp_path / 'tests' / 'test_broken.py').write_text(
+                'from intentions import describe, when\n'
+                '\n'
+                "@describe(domain='accounts', component='accounts', layer='service')\n"
+                'def test_close_account():\n'
+                "    with when('Account is closed'):\n"
+                '        retur x y\n',
+            )
+            intentions_json_path = (tmp_path / 'intentions.json').as_posix()
+
+        with when('Intentions JSON file is created with the cache by the scanner'):
+            create_intentions_json(
+                directory=(tmp_path / 'tests').as_posix(),
+                path=intentions_json_path,
+                cache=True,
+                engine=ExtractionEngine.SCANNER,
+            )
+
+        with case('Create intentions JSON file with the cache by ast'):
+            summary = create_intentions_json(
+                directory=(tmp_path / 'tests').as_posix(),
+                path=intentions_json_path,
+                cache=True,
+                engine=ExtractionEngine.AST,
+            )
+
+        with expect('The file is parsed by ast instead of being served from the cache of the scanner'):
+            assert summary.cache_hits == 0
+            assert len(summary.errors) == 1
@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+
+from intentions.main import (
+    case,
+    expect,
+    when,
+)
+from intentions.render.main import (
+    create_intentions_json,
+    create_intentions_shards,
+)
+from intentions.render.shards import IntentionsShards
+
+
+class TestIntentionsShards:
+
+    def test_create_intentions_shards(self, remove_intentions_json, remove_intentions_shards) -> None:
+        with when('Intentions JSON file of tests folder with tests using intentions library exists'):
+            create_intentions_json(directory='./fixtures')
+
+            with open('./.intentions/intentions.json', 'r') as intentions_json:
+                intentions_json = json.load(intentions_json)
+
+        with case('Render intentions shards of the tests folder'):
+            _, shards_summary = create_intentions_shards(directory='./fixtures')
+
+        with expect('A shard per domain is written'):
+            assert (shards_summary.written, shards_summary.unchanged, shards_summary.removed) == (2, 0, 0)
+
+        with expect('Shards are not read until their domains are accessed'):
+            intentions_shards = IntentionsShards(verify=True)
+
+            assert list(intentions_shards) == ['accounts', 'investments']
+            assert intentions_shards.get_test_cases_count() == 6
+            assert intentions_shards.get_test_cases_count(domain='accounts') == 3
+            assert not intentions_shards.loaded_shards
+
+        with expect('Loaded shards are the same as domains of the intentions JSON file'):
+            assert intentions_shards['accounts'] == intentions_json['accounts']
+            assert list(intentions_shards.loaded_shards) == ['accounts.json']
+            assert dict(intentions_shards) == intentions_json
+
+    def test_skip_writing_unchanged_shards(self, tmp_path, remove_intentions_shards) -> None:
+        with when('Intentions shards of tests folder are rendered'):
+            (tmp_path / 'test_file.py').write_text(open('./fixtures/test_file.py').read())
+            create_intentions_shards(directory=tmp_path.as_posix(), by_component=True)
+
+        with when('Only investments test cases are changed'):
+            test_file = tmp_path / 'test_file.py'
+            test_file.write_text(test_file.read_text().replace('Invest money into stocks', 'Buy stocks'))
+
+        with case('Render intentions shards again'):
+            _, shards_summary = create_intentions_shards(directory=tmp_path.as_posix(), by_component=True)
+
+        with expect('Only the investments shard is written again'):
+            assert (shards_summary.written, shards_summary.unchanged, shards_summary.removed) == (1, 1, 0)
+
+        with expect('A component is loaded from its own shard'):
+            intentions_shards = IntentionsShards()
+            layers = intentions_shards.get_component(domain='investments', component='investments')
+
+            assert 'Buy stocks' in layers['service']
+            assert list(intentions_shards.loaded_shards) == ['investments/investments.json']
+
+    def test_remove_empty_domain_directories(self, remove_intentions_shards) -> None:
+        with when('Intentions shards of tests folder are rendered per component'):
+            create_intentions_shards(directory='./fixtures', by_component=True)
+
+        with case('Render intentions shards of the tests folder per domain'):
+            _, shards_summary = create_intentions_shards(directory='./fixtures')
+
+        with expect('Shards of components and directories of their domains are removed'):
+            assert (shards_summary.written, shards_summary.removed) == (2, 2)
+            assert sorted(path.name for path in Path(remove_intentions_shards).iterdir()) == [
+                'accounts.json',
+                'investments.json',
+                'manifest.json',
+            ]
@@ -0,0 +1,91 @@
+from intentions.main import (
+    case,
+    expect,
+    when,
+)
+from intentions.render.walker import (
+    WalkFilter,
+    is_test_file,
+    iter_test_files,
+)
+
+
+class TestWalker:
+
+    def test_iter_test_files(self, tmp_path) -> None:
+        with when('Tests folder with test files, other files and tooling directories exists'):
+            for path in (
+                'tests/test_accounts.py',
+                'tests/investments_test.py',
+                'tests/conftest.py',
+                'tests/nested/test_transfers.py',
+                'tests/__pycache__/test_accounts.py',
+                '.venv/lib/test_package.py',
+                'node_modules/package/test_package.py',
+                'library.egg-info/test_package.py',
+                'build/lib/test_package.py',
+                'tests/build/test_build.py',
+                'test_root.py',
+            ):
+                (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+                (tmp_path / path).write_text('')
+
+        with case('Iterate over test files of the folder'):
+            test_files = list(iter_test_files(directory=tmp_path.as_posix()))
+
+        with expect('Test files are found by pytest patterns in sorted order out of excluded directories and root build directories'):
+            assert [test_file.relative_to(tmp_path).as_posix() for test_file in test_files] == [
+                'test_root.py',
+                'tests/build/test_build.py',
+                'tests/investments_test.py',
+                'tests/nested/test_transfers.py',
+                'tests/test_accounts.py',
+            ]
+
+    def test_iter_test_files_with_include_and_exclude(self, tmp_path) -> None:
+        with when('Tests folder with unit and integration test files exists'):
+            for path in ('unit/test_accounts.py', 'unit/test_investments.py', 'integration/test_accounts.py'):
+                (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+                (tmp_path / path).write_text('')
+
+        with case('Iterate over test files including accounts and excluding integration test files'):
+            test_files = list(
+                iter_test_files(
+                    directory=tmp_path.as_posix(),
+                    walk_filter=WalkFilter(include=('*accounts*',), exclude=('integration',)),
+                ),
+            )
+
+        with expect('Only included test files out of excluded directories are found'):
+            assert [test_file.relative_to(tmp_path).as_posix() for test_file in test_files] == ['unit/test_accounts.py']
+
+    def test_iter_test_files_with_gitignore(self, tmp_path) -> None:
+        with when('Tests folder with .gitignore files exists'):
+            for path in (
+                'generated/test_generated.py',
+                'tests/test_accounts.py',
+                'tests/test_snapshot.py',
+                'tests/test_snapshot_kept.py',
+                'tests/legacy/test_legacy.py',
+            ):
+                (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+                (tmp_path / path).write_text('')
+
+            (tmp_path / '.gitignore').write_text('# Generated files\n/generated/\ntest_snapshot*.py\n')
+            (tmp_path / 'tests' / '.gitignore').write_text('!test_snapshot_kept.py\nlegacy/\n')
+
+        with case('Iterate over test files respecting .gitignore files'):
+            test_files = list(iter_test_files(directory=tmp_path.as_posix(), walk_filter=WalkFilter(gitignore=True)))
+
+        with expect('Ignored test files and directories are skipped, negated ones are kept'):
+            assert [test_file.relative_to(tmp_path).as_posix() for test_file in test_files] == [
+                'tests/test_accounts.py',
+                'tests/test_snapshot_kept.py',
+            ]
+
+        with expect('A single file is checked the same way as the walk does'):
+            walk_filter = WalkFilter(gitignore=True)
+
+            assert is_test_file(tmp_path.as_posix(), tmp_path / 'tests' / 'test_snapshot_kept.py', walk_filter)
+            assert not is_test_file(tmp_path.as_posix(), tmp_path / 'tests' / 'test_snapshot.py', walk_filter)
+            assert not is_test_file(tmp_path.as_posix(), tmp_path / 'tests' / 'legacy' / 'test_legacy.py', walk_filter)
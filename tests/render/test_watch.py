@@ -0,0 +1,119 @@
+import json
+import os
+import queue
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from intentions.main import (
+    case,
+    expect,
+    when,
+)
+from intentions.render.main import create_intentions_json
+from intentions.render.watch import (
+    InotifyWatcher,
+    watch_intentions_json,
+)
+
+UPDATE_TIMEOUT = 10
+
+
+class TestWatchIntentionsJson:
+
+    @pytest.mark.parametrize('polling', [False, True])
+    def test_watch_intentions_json(self, tmp_path, polling) -> None:
+        with when('Tests folder with a test file using intentions library exists'):
+            tests_folder_path = tmp_path / 'tests'
+            tests_folder_path.mkdir()
+            shutil.copy('./fixtures/test_file.py', tests_folder_path / 'test_file.py')
+
+            intentions_json_path = tmp_path / 'intentions.json'
+
+        with when('Intentions JSON file is being watched'):
+            summaries = queue.Queue()
+            stop_event = threading.Event()
+
+            watch_thread = threading.Thread(
+                target=watch_intentions_json,
+                kwargs={
+                    'directory': tests_folder_path.as_posix(),
+                    'path': intentions_json_path.as_posix(),
+                    'debounce': 0.05,
+                    'polling': polling,
+                    'poll_interval': 0.05,
+                    'stop_event': stop_event,
+                    'on_update': summaries.put,
+                },
+            )
+            watch_thread.start()
+
+            initial_summary = summaries.get(timeout=UPDATE_TIMEOUT)
+
+        with case('Add a test file to the tests folder'):
+            (tests_folder_path / 'test_other_file.py').write_text(
+                'from intentions import describe, when\n'
+                '\n'
+                "@describe(domain='payments', component='payments', layer='service')\n"
+                'def test_pay():\n'
+                "    with when('Payment is made'):\n"
+                '        pass\n',
+            )
+
+            updated_summary = summaries.get(timeout=UPDATE_TIMEOUT)
+
+        with case('Add a test file that is walked before the existing one'):
+            (tests_folder_path / 'test_accounts.py').write_text(
+                'from intentions import describe, when\n'
+                '\n'
+                "@describe(domain='accounts', component='accounts', layer='service')\n"
+                'def test_close_account():\n'
+                "    with when('Account is closed'):\n"
+                '        pass\n',
+            )
+
+            summaries.get(timeout=UPDATE_TIMEOUT)
+
+            stop_event.set()
+            watch_thread.join(timeout=UPDATE_TIMEOUT)
+
+        with open(intentions_json_path, 'r') as intentions_json:
+            intentions_json = json.load(intentions_json)
+
+        with expect('Intentions JSON file is rendered when watching starts'):
+            assert initial_summary.files == 1
+            assert initial_summary.test_cases == 6
+
+        with expect('Intentions JSON file is updated with the added test file'):
+            assert updated_summary.files == 2
+            assert updated_summary.test_cases == 7
+            assert intentions_json['payments']['payments']['service']['null'][0]['function_name'] == 'test_pay'
+
+        with expect('Watched intentions JSON file is the same as a fresh render of the tests folder'):
+            rendered_intentions_json_path = tmp_path / 'rendered-intentions.json'
+            create_intentions_json(
+                directory=tests_folder_path.as_posix(),
+                path=rendered_intentions_json_path.as_posix(),
+            )
+
+            assert intentions_json_path.read_text() == rendered_intentions_json_path.read_text()
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason='inotify is available only on Linux')
+    def test_watch_test_file_with_non_utf8_name(self, tmp_path) -> None:
+        with when('Tests folder is being watched by inotify'):
+            watcher = InotifyWatcher(directory=tmp_path.as_posix())
+
+        with case('Add a test file whose name is not valid UTF-8'):
+            test_file_path = os.path.join(os.fsencode(tmp_path), b'test_\xff.py')
+
+            with open(test_file_path, 'w') as file:
+                file.write('def test_sum():\n    assert 4 == 2 + 2\n')
+
+            changed_paths = watcher.wait(timeout=UPDATE_TIMEOUT)
+            watcher.close()
+
+        with expect('The test file is reported as changed by its file system path'):
+            assert Path(os.fsdecode(test_file_path)) in changed_paths
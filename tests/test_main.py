@@ -0,0 +1,203 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+import intentions.main
+from intentions.enums import BudgetPolicy
+from intentions.main import (
+    DESCRIBE_ATTRIBUTE,
+    IntentionBudgetExceededError,
+    IntentionBudgetWarning,
+    budget_violations,
+    case,
+    configure_budgets,
+    describe,
+    expect,
+    get_budget_configuration,
+    get_describe,
+    when,
+)
+
+
+class TestDescribe:
+
+    def test_describe_function(self) -> None:
+        with when('Test function exists'):
+            def test_function(first: int, second: int = 2) -> int:
+                return first + second
+
+        with case('Describe the test function'):
+            described_test_function = describe(domain='accounts', component='accounts', layer='service')(test_function)
+
+        with expect('Test function is returned unwrapped'):
+            assert described_test_function is test_function
+            assert described_test_function(1) == 3
+
+        with expect('Description is attached to the test function'):
+            description = get_describe(test_function)
+
+            assert getattr(test_function, DESCRIBE_ATTRIBUTE) is description
+            assert (description.domain, description.component, description.layer) == (
+                'accounts',
+                'accounts',
+                'service',
+            )
+
+    def test_describe_class(self) -> None:
+        with when('Test class exists'):
+            class TestAccountsService:
+
+                def test_transfer_money(self) -> None:
+                    return
+
+        with case('Describe the test class'):
+            described_test_class = describe(domain='accounts', component='accounts', layer='service')(
+                TestAccountsService,
+            )
+
+        with expect('Test class is returned as is'):
+            assert described_test_class is TestAccountsService
+            assert described_test_class.__name__ == 'TestAccountsService'
+
+        with expect('Description is attached to the test class'):
+            assert get_describe(TestAccountsService).domain == 'accounts'
+
+    def test_describe_unhashable_object(self) -> None:
+        with when('Test object is callable, but not hashable'):
+            class TestObject:
+
+                __hash__ = None
+
+                def __call__(self) -> None:
+                    return
+
+            test_object = TestObject()
+
+        with case('Describe the test object'):
+            describe(domain='accounts', component='accounts', layer='service')(test_object)
+
+        with expect('Description is attached to the test object'):
+            assert get_describe(test_object).domain == 'accounts'
+
+    def test_import_runtime_without_renderer(self) -> None:
+        with case('Import the library in a fresh interpreter'):
+            modules = subprocess.run(
+                [sys.executable, '-c', 'import sys, intentions; print(*sorted(sys.modules))'],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.split()
+
+        with expect('Renderer is not imported'):
+            assert 'intentions.main' in modules
+            assert not [module for module in modules if module.startswith('intentions.render')]
+
+    def test_get_describe_of_not_described_function(self) -> None:
+        with when('Test function is not described'):
+            def test_function() -> None:
+                return
+
+        with case('Get a description of the test function'):
+            description = get_describe(test_function)
+
+        with expect('No description is returned'):
+            assert description is None
+
+
+class TestIntention:
+
+    @pytest.mark.parametrize('intention', [when, case, expect])
+    def test_intention_has_no_instance_dictionary(self, intention) -> None:
+        with when('Intention is created'):
+            created_intention = intention('Sender account has insufficient balance')
+
+        with case('Set an attribute that is not declared on the intention'), pytest.raises(AttributeError):
+            created_intention.attribute = 'value'
+
+        with expect('Intention keeps only its description'):
+            assert created_intention.description == 'Sender account has insufficient balance'
+
+
+class TestIntentionBudget:
+
+    def test_read_budget_environment_variables_lazily(self, restore_budgets, monkeypatch) -> None:
+        with when('Budget policy environment variable is not valid and budgets are not configured yet'):
+            monkeypatch.setenv('INTENTIONS_BUDGET_POLICY', 'warning')
+            monkeypatch.setattr(intentions.main, 'budget_policy', None)
+
+        with case('Get the budget configuration'), pytest.raises(ValueError, match='INTENTIONS_BUDGET_POLICY') as error:
+            get_budget_configuration()
+
+        with expect('The error tells the variable and its valid values'):
+            assert "one of fail, warn, record, got 'warning'" in str(error.value)
+
+        with when('Budget multiplier environment variable is not a number'):
+            monkeypatch.setenv('INTENTIONS_BUDGET_POLICY', 'record')
+            monkeypatch.setenv('INTENTIONS_BUDGET_MULTIPLIER', 'twice')
+            monkeypatch.setattr(intentions.main, 'budget_multiplier', None)
+
+        with case('Get the budget configuration'), pytest.raises(ValueError, match='INTENTIONS_BUDGET_MULTIPLIER'):
+            get_budget_configuration()
+
+    def test_fail_on_exceeded_time_budget(self, restore_budgets) -> None:
+        with when('Budget policy is to fail'):
+            configure_budgets(policy=BudgetPolicy.FAIL, multiplier=1)
+
+        with case('Exceed the time budget of a block'), pytest.raises(IntentionBudgetExceededError) as error:
+            with case('Transfer money', budget_ms=1):
+                time.sleep(0.01)
+
+        with expect('The error tells the block and its budget'):
+            assert "case('Transfer money')" in str(error.value)
+            assert 'of 1.00ms' in str(error.value)
+
+    def test_warn_on_exceeded_allocation_budget(self, restore_budgets) -> None:
+        with when('Budget policy is to warn'):
+            configure_budgets(policy=BudgetPolicy.WARN)
+
+        with case('Exceed the allocation budget of a block'), pytest.warns(IntentionBudgetWarning) as warnings:
+            with when('Sender account history is loaded', budget_bytes=1024):
+                history = bytearray(1024 * 1024)
+
+        with expect('The warning tells allocated bytes'):
+            assert history
+            assert 'allocated' in str(warnings[0].message)
+
+    def test_record_exceeded_budget(self, restore_budgets) -> None:
+        with when('Budget policy is to only record'):
+            configure_budgets(policy=BudgetPolicy.RECORD, multiplier=1)
+            recorded_budget_violations = len(budget_violations)
+
+        with case('Exceed the time budget of a block'):
+            with expect('Money is transferred', budget_ms=1):
+                time.sleep(0.01)
+
+        with expect('The violation is recorded'):
+            assert len(budget_violations) == recorded_budget_violations + 1
+            assert budget_violations[-1].description == 'Money is transferred'
+            assert budget_violations[-1].elapsed_ms > 1
+
+    def test_multiply_time_budget(self, restore_budgets) -> None:
+        with when('Budget multiplier is big enough for a slow block'):
+            configure_budgets(policy=BudgetPolicy.FAIL, multiplier=1000)
+
+        with case('Run the slow block'):
+            with case('Transfer money', budget_ms=1):
+                time.sleep(0.01)
+
+        with expect('The block is within its multiplied budget'):
+            pass
+
+    def test_do_not_enforce_budget_of_failed_block(self, restore_budgets) -> None:
+        with when('Budget policy is to fail'):
+            configure_budgets(policy=BudgetPolicy.FAIL, multiplier=1)
+
+        with case('Raise an error in a block that exceeds its budget'), pytest.raises(ValueError):
+            with case('Transfer money', budget_ms=1):
+                time.sleep(0.01)
+                raise ValueError
+
+        with expect('The original error is raised'):
+            pass